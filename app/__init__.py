@@ -1,12 +1,10 @@
 import logging
-from contextlib import AbstractContextManager
 from contextlib import asynccontextmanager
 from contextlib import suppress
-from typing import Any, cast
+from typing import Any, Callable
 
 from fastapi import FastAPI
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
 
 from app.bootstrap import (
     register_core_middleware,
@@ -17,7 +15,7 @@ from app.bootstrap import (
 )
 from app.cache import ReadCache
 from app.config import Config
-from app.database import init_db, instrumented_begin
+from app.database import init_db
 from app.logging_config import configure_logging
 from app.observability import register_observability
 from app.security import (
@@ -48,19 +46,18 @@ def create_app(app_config: Config | None = None) -> FastAPI:
 
     configure_logging(level=app_config.LOG_LEVEL, json_logs=app_config.LOG_JSON)
 
+    # Resources register their shutdown hook here as they are created; the lifespan
+    # releases them in reverse order so later resources never outlive earlier ones.
+    shutdown_closers: list[Callable[[], object]] = []
+
     @asynccontextmanager
     async def _lifespan(_api: FastAPI):
         try:
             yield
         finally:
-            db_engine = getattr(_api.state, "db_engine", None)
-            if db_engine is not None and hasattr(db_engine, "dispose"):
-                with suppress(Exception):
-                    db_engine.dispose()
-            read_cache = getattr(_api.state, "read_cache", None)
-            if read_cache is not None:
+            for closer in reversed(shutdown_closers):
                 with suppress(Exception):
-                    read_cache.close()
+                    closer()
 
     api = FastAPI(
         title="Civic Archive API",
@@ -80,19 +77,23 @@ def create_app(app_config: Config | None = None) -> FastAPI:
         max_overflow=app_config.DB_MAX_OVERFLOW,
         pool_timeout_seconds=app_config.DB_POOL_TIMEOUT_SECONDS,
         pool_recycle_seconds=app_config.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=app_config.DB_POOL_PRE_PING,
         connect_timeout_seconds=app_config.DB_CONNECT_TIMEOUT_SECONDS,
         statement_timeout_ms=app_config.DB_STATEMENT_TIMEOUT_MS,
+        prepare_threshold=app_config.DB_PREPARE_THRESHOLD,
+        random_page_cost=app_config.DB_RANDOM_PAGE_COST,
     )
 
-    def connection_provider() -> AbstractContextManager[Connection]:
-        return cast(AbstractContextManager[Connection], cast(object, instrumented_begin(db_engine)))
-
     api.state.db_engine = db_engine
-    api.state.connection_provider = connection_provider
-    api.state.read_cache = ReadCache(
+    api.state.connection_provider = db_engine.begin
+    if hasattr(db_engine, "dispose"):
+        shutdown_closers.append(db_engine.dispose)
+    read_cache = ReadCache(
         redis_url=app_config.REDIS_URL,
         ttl_seconds=app_config.READ_CACHE_TTL_SECONDS,
     )
+    api.state.read_cache = read_cache
+    shutdown_closers.append(read_cache.close)
 
     protected_dependencies: list[Any] = build_protected_dependencies(
         app_config,
@@ -105,7 +106,11 @@ def create_app(app_config: Config | None = None) -> FastAPI:
         build_api_key_dependency=build_api_key_dependency,
         build_jwt_dependency=build_jwt_dependency,
     )
-    register_observability(api, metrics_dependencies=metrics_dependencies)
+    register_observability(
+        api,
+        metrics_dependencies=metrics_dependencies,
+        observe_path_label_resolution=app_config.METRICS_OBSERVE_PATH_LABEL_RESOLUTION,
+    )
 
     def db_health_check() -> tuple[bool, str | None]:
         try:
@@ -122,6 +127,7 @@ def create_app(app_config: Config | None = None) -> FastAPI:
         protected_dependencies=protected_dependencies,
         db_health_check=db_health_check,
         rate_limit_health_check=lambda: check_rate_limit_backend_health(app_config),
+        health_check_cache_ttl_seconds=app_config.HEALTH_CHECK_CACHE_TTL_SECONDS,
     )
     register_exception_handlers(api, logger=logger)
 
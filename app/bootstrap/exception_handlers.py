@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 import logging
 
 from fastapi import FastAPI, Request
@@ -10,28 +11,33 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.errors import error_response, normalize_http_exception
 
 
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+    return normalize_http_exception(request, exc)
+
+
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    errors = exc.errors()
+    message = "; ".join([err.get("msg", "invalid request") for err in errors])
+    return error_response(
+        request,
+        status_code=400,
+        code="VALIDATION_ERROR",
+        message=message or "invalid request",
+        details=errors,
+    )
+
+
+async def server_error_handler(request: Request, _exc: Exception, *, logger: logging.Logger) -> JSONResponse:
+    logger.exception("unhandled_exception", extra={"request_id": getattr(request.state, "request_id", None)})
+    return error_response(
+        request,
+        status_code=500,
+        code="INTERNAL_ERROR",
+        message="Internal Server Error",
+    )
+
+
 def register_exception_handlers(api: FastAPI, *, logger: logging.Logger) -> None:
-    @api.exception_handler(StarletteHTTPException)
-    async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
-        return normalize_http_exception(request, exc)
-
-    @api.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        message = "; ".join(err.get("msg", "invalid request") for err in exc.errors())
-        return error_response(
-            request,
-            status_code=400,
-            code="VALIDATION_ERROR",
-            message=message or "invalid request",
-            details=exc.errors(),
-        )
-
-    @api.exception_handler(Exception)
-    async def server_error_handler(request: Request, _exc: Exception) -> JSONResponse:
-        logger.exception("unhandled_exception", extra={"request_id": getattr(request.state, "request_id", None)})
-        return error_response(
-            request,
-            status_code=500,
-            code="INTERNAL_ERROR",
-            message="Internal Server Error",
-        )
+    api.add_exception_handler(StarletteHTTPException, http_exception_handler)  # type: ignore[arg-type]
+    api.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore[arg-type]
+    api.add_exception_handler(Exception, partial(server_error_handler, logger=logger))
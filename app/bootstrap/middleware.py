@@ -1,26 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, MutableMapping
-from typing import Any, cast
-from uuid import uuid4
+from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import Response
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import Config
 from app.errors import error_response
+from app.observability import new_request_id
 
-ReceiveMessage = MutableMapping[str, Any]
 WRITE_METHODS = frozenset({"POST", "PUT", "PATCH"})
 API_PATH_PREFIX = "/api/"
-REQUEST_SIZE_GUARD_DETAILS_ATTR = "_request_size_guard_details"
-REQUEST_RECEIVE_ATTR = "_receive"
+CONTENT_LENGTH_HEADER = b"content-length"
+REQUEST_ID_HEADER = b"x-request-id"
 
 
-def _is_request_size_guard_target(request: Request) -> bool:
-    return request.url.path.startswith(API_PATH_PREFIX) and request.method in WRITE_METHODS
+def _is_request_size_guard_target(scope: Scope) -> bool:
+    # Method membership is a single hash lookup and rejects most (read) traffic before the path check.
+    return (
+        scope["type"] == "http"
+        and scope.get("method") in WRITE_METHODS
+        and scope.get("path", "").startswith(API_PATH_PREFIX)
+    )
 
 
 def _payload_too_large_response(
@@ -46,6 +50,98 @@ def _invalid_content_length_response(request: Request) -> Response:
     )
 
 
+class RequestSizeGuardMiddleware:
+    """Reject oversized `/api/*` write requests before the route consumes the whole body.
+
+    Non-target scopes (non-HTTP, read methods, non-API paths) are passed straight
+    through without allocating request/response objects.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = int(max_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not _is_request_size_guard_target(scope):
+            await self.app(scope, receive, send)
+            return
+
+        max_request_body_bytes = self.max_bytes
+        # Scan the raw ASGI header list once instead of building a Starlette `Headers` view.
+        content_length_raw = b""
+        request_id_raw = b""
+        for name, value in scope["headers"]:
+            if name == CONTENT_LENGTH_HEADER and not content_length_raw:
+                content_length_raw = value.strip()
+            elif name == REQUEST_ID_HEADER and not request_id_raw:
+                request_id_raw = value
+
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id_raw.decode("latin-1") or state.get("request_id") or new_request_id()
+
+        content_length = None
+        if content_length_raw:
+            try:
+                content_length = int(content_length_raw)
+            except ValueError:
+                await _invalid_content_length_response(Request(scope))(scope, receive, send)
+                return
+            if content_length < 0:
+                await _invalid_content_length_response(Request(scope))(scope, receive, send)
+                return
+            if content_length > max_request_body_bytes:
+                response = _payload_too_large_response(
+                    Request(scope),
+                    details={
+                        "max_request_body_bytes": max_request_body_bytes,
+                        "content_length": content_length,
+                    },
+                )
+                await response(scope, receive, send)
+                return
+
+        received_bytes = 0
+        response_started = False
+        guard_details: dict[str, Any] | None = None
+
+        async def guarded_receive() -> Message:
+            nonlocal received_bytes, guard_details
+            message = await receive()
+            if message.get("type") != "http.request":
+                return message
+
+            chunk = message.get("body", b"") or b""
+            received_bytes += len(chunk)
+            if received_bytes > max_request_body_bytes:
+                guard_details = {
+                    "max_request_body_bytes": max_request_body_bytes,
+                    "request_body_bytes": received_bytes,
+                }
+                if content_length is not None:
+                    guard_details["content_length"] = content_length
+                # Stop reading request body as soon as the limit is exceeded.
+                return {"type": "http.request", "body": b"", "more_body": False}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if not response_started and guard_details is not None:
+                # Drop the downstream response; a 413 is sent once the app returns.
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, guarded_receive, guarded_send)
+        except Exception:
+            if response_started or guard_details is None:
+                raise
+
+        if guard_details is not None and not response_started:
+            await _payload_too_large_response(Request(scope), details=guard_details)(scope, receive, send)
+
+
 def register_core_middleware(api: FastAPI, config: Config) -> None:
     api.add_middleware(
         CORSMiddleware,
@@ -54,66 +150,4 @@ def register_core_middleware(api: FastAPI, config: Config) -> None:
         allow_headers=config.cors_allow_headers_list,
     )
     api.add_middleware(TrustedHostMiddleware, allowed_hosts=config.allowed_hosts_list)
-
-    @api.middleware("http")
-    async def request_size_guard(
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        request.state.request_id = request.headers.get("X-Request-Id") or getattr(request.state, "request_id", None) or str(uuid4())
-
-        if _is_request_size_guard_target(request):
-            max_request_body_bytes = int(config.MAX_REQUEST_BODY_BYTES)
-            content_length = None
-            content_length_raw = (request.headers.get("content-length") or "").strip()
-            if content_length_raw:
-                try:
-                    content_length = int(content_length_raw)
-                except ValueError:
-                    return _invalid_content_length_response(request)
-                if content_length < 0:
-                    return _invalid_content_length_response(request)
-                if content_length > max_request_body_bytes:
-                    return _payload_too_large_response(
-                        request,
-                        details={
-                            "max_request_body_bytes": max_request_body_bytes,
-                            "content_length": content_length,
-                        },
-                    )
-            received_bytes = 0
-            original_receive = cast(Callable[[], Awaitable[ReceiveMessage]], getattr(request, REQUEST_RECEIVE_ATTR))
-
-            async def guarded_receive() -> ReceiveMessage:
-                nonlocal received_bytes
-                message = await original_receive()
-                if message.get("type") != "http.request":
-                    return message
-
-                chunk = message.get("body", b"") or b""
-                received_bytes += len(chunk)
-                if received_bytes > max_request_body_bytes:
-                    overflow_details = {
-                        "max_request_body_bytes": max_request_body_bytes,
-                        "request_body_bytes": received_bytes,
-                    }
-                    if content_length is not None:
-                        overflow_details["content_length"] = content_length
-                    setattr(request.state, REQUEST_SIZE_GUARD_DETAILS_ATTR, overflow_details)
-                    # Stop reading request body as soon as the limit is exceeded.
-                    return {"type": "http.request", "body": b"", "more_body": False}
-                return message
-
-            setattr(request, REQUEST_RECEIVE_ATTR, guarded_receive)
-        try:
-            response = await call_next(request)
-        except Exception:
-            guard_details = getattr(request.state, REQUEST_SIZE_GUARD_DETAILS_ATTR, None)
-            if guard_details is not None:
-                return _payload_too_large_response(request, details=guard_details)
-            raise
-
-        guard_details = getattr(request.state, REQUEST_SIZE_GUARD_DETAILS_ATTR, None)
-        if guard_details is not None:
-            return _payload_too_large_response(request, details=guard_details)
-        return response
+    api.add_middleware(RequestSizeGuardMiddleware, max_bytes=config.MAX_REQUEST_BODY_BYTES)
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from time import monotonic
 from typing import Any
 
 from fastapi import Body, FastAPI
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+import orjson
 
 from app.bootstrap.contracts import DBHealthCheck, ProtectedDependencies, RateLimitHealthCheck
-from app.schemas import EchoResponse, ErrorResponse, HealthResponse, ReadinessCheck, ReadinessResponse
+from app.schemas import EchoResponse, ErrorResponse, HealthResponse, ReadinessResponse
+
+
+class CachedHealthCheck:
+    """Run a blocking readiness check off the event loop and reuse its result for `ttl_seconds`."""
+
+    def __init__(self, check: Callable[[], tuple[bool, str | None]], *, ttl_seconds: float) -> None:
+        self._check = check
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._cached: tuple[float, tuple[bool, str | None]] | None = None
+
+    async def __call__(self) -> tuple[bool, str | None]:
+        cached = self._cached
+        if cached is not None and monotonic() - cached[0] < self._ttl_seconds:
+            return cached[1]
+        result = await run_in_threadpool(self._check)
+        self._cached = (monotonic(), result)
+        return result
 
 
 def register_system_routes(
@@ -15,7 +36,15 @@ def register_system_routes(
     protected_dependencies: ProtectedDependencies,
     db_health_check: DBHealthCheck,
     rate_limit_health_check: RateLimitHealthCheck,
+    health_check_cache_ttl_seconds: float = 0,
 ) -> None:
+    cached_db_health_check = CachedHealthCheck(db_health_check, ttl_seconds=health_check_cache_ttl_seconds)
+    cached_rate_limit_health_check = CachedHealthCheck(
+        rate_limit_health_check,
+        ttl_seconds=health_check_cache_ttl_seconds,
+    )
+    last_ready: tuple[tuple[bool, str | None, bool, str | None], int, bytes] | None = None
+
     @api.get("/", tags=["system"])
     async def hello_world() -> PlainTextResponse:
         return PlainTextResponse("API Server Available")
@@ -34,20 +63,26 @@ def register_system_routes(
         response_model=ReadinessResponse,
         responses={500: {"model": ErrorResponse}, 503: {"model": ReadinessResponse}},
     )
-    async def health_ready() -> ReadinessResponse | JSONResponse:
-        db_ok, db_detail = db_health_check()
-        rate_limit_ok, rate_limit_detail = rate_limit_health_check()
-        checks = {
-            "database": ReadinessCheck(ok=db_ok, detail=db_detail),
-            "rate_limit_backend": ReadinessCheck(ok=rate_limit_ok, detail=rate_limit_detail),
-        }
-        payload = ReadinessResponse(
-            status="ok" if db_ok and rate_limit_ok else "degraded",
-            checks=checks,
-        )
-        if db_ok and rate_limit_ok:
-            return payload
-        return JSONResponse(status_code=503, content=payload.model_dump())
+    async def health_ready() -> Response:
+        nonlocal last_ready
+        db_ok, db_detail = await cached_db_health_check()
+        rate_limit_ok, rate_limit_detail = await cached_rate_limit_health_check()
+
+        # Probes overwhelmingly repeat the previous state; serialize the body only when it changes.
+        ready_key = (db_ok, db_detail, rate_limit_ok, rate_limit_detail)
+        if last_ready is None or last_ready[0] != ready_key:
+            ready = db_ok and rate_limit_ok
+            body = orjson.dumps(
+                {
+                    "status": "ok" if ready else "degraded",
+                    "checks": {
+                        "database": {"ok": db_ok, "detail": db_detail},
+                        "rate_limit_backend": {"ok": rate_limit_ok, "detail": rate_limit_detail},
+                    },
+                }
+            )
+            last_ready = (ready_key, 200 if ready else 503, body)
+        return Response(content=last_ready[2], status_code=last_ready[1], media_type="application/json")
 
     @api.post(
         "/api/echo",
@@ -64,6 +99,10 @@ def register_system_routes(
             500: {"model": ErrorResponse},
         },
     )
-    async def echo(_payload: Any = Body(default_factory=dict)) -> EchoResponse:
+    async def echo(_payload: Any = Body(default_factory=dict)) -> JSONResponse:
+        # Body() is the only parse of the request (there is no request.json() re-read). It keeps
+        # the OpenAPI requestBody, maps an empty body to {} and rejects malformed JSON as a
+        # validation error, which a bare request.json() with a fallback would swallow.
+        # The decoded payload is returned as-is instead of being re-validated via EchoResponse.
         data = {} if _payload is None else _payload
-        return EchoResponse(you_sent=data)
+        return JSONResponse(content={"you_sent": data})
@@ -25,6 +25,8 @@ def validate_startup_config(config: Config) -> None:
         raise RuntimeError("RATE_LIMIT_BACKEND=redis requires REDIS_URL to be set.")
     if config.RATE_LIMIT_REDIS_FAILURE_COOLDOWN_SECONDS <= 0:
         raise RuntimeError("RATE_LIMIT_REDIS_FAILURE_COOLDOWN_SECONDS must be greater than 0.")
+    # Per-process connection ceiling is DB_POOL_SIZE + DB_MAX_OVERFLOW; multiplied by the
+    # worker count it must stay below PostgreSQL max_connections.
     if config.DB_POOL_SIZE <= 0:
         raise RuntimeError("DB_POOL_SIZE must be greater than 0.")
     if config.DB_MAX_OVERFLOW < 0:
@@ -37,6 +39,8 @@ def validate_startup_config(config: Config) -> None:
         raise RuntimeError("DB_CONNECT_TIMEOUT_SECONDS must be greater than 0.")
     if config.DB_STATEMENT_TIMEOUT_MS <= 0:
         raise RuntimeError("DB_STATEMENT_TIMEOUT_MS must be greater than 0.")
+    if config.HEALTH_CHECK_CACHE_TTL_SECONDS < 0:
+        raise RuntimeError("HEALTH_CHECK_CACHE_TTL_SECONDS must be greater than or equal to 0.")
     if config.INGEST_MAX_BATCH_ITEMS <= 0:
         raise RuntimeError("INGEST_MAX_BATCH_ITEMS must be greater than 0.")
     if config.MAX_REQUEST_BODY_BYTES <= 0:
@@ -14,34 +14,89 @@ Build keys with ``ReadCache.key(*parts)`` to produce a colon-delimited,
 prefix-scoped string, e.g.::
 
     cache.key("news", "list", "source=abc", "page=1")
-    # → "civic_archive:read:news:list:source=abc:page=1"
+    # → "civic_archive:read:v2:news:list:source=abc:page=1"
 
 Invalidation
 ------------
 On write operations call ``invalidate_prefix(domain)`` (e.g. ``"news"``) to
 delete all cached keys under that domain prefix.  This uses Redis ``SCAN``
-with ``MATCH`` to avoid blocking the server with ``KEYS``.
+with ``MATCH`` to avoid blocking the server with ``KEYS``, and ``UNLINK`` in
+batches so memory is reclaimed off Redis' main thread.
+
+Connections
+-----------
+Instances pointing at the same ``REDIS_URL`` share one client (and therefore
+one connection pool, capped at ``_CLIENT_MAX_CONNECTIONS``).  The shared
+client is reference-counted and only closed when the last ``ReadCache`` using
+it is closed.
 """
 from __future__ import annotations
 
 import json
 import logging
+import threading
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger("civic_archive.cache")
 
-_KEY_PREFIX = "civic_archive:read"
+# Bump the version segment whenever the cached JSON encoding changes (v2: orjson ISO-8601 datetimes).
+_KEY_PREFIX = "civic_archive:read:v2"
+_CLIENT_MAX_CONNECTIONS = 64
+_INVALIDATE_BATCH_SIZE = 500
+_SHARED_CLIENTS: dict[str, tuple[Any, int]] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _acquire_shared_client(redis_module: Any, redis_url: str) -> Any:
+    with _SHARED_CLIENTS_LOCK:
+        entry = _SHARED_CLIENTS.get(redis_url)
+        if entry is None:
+            client = redis_module.from_url(
+                redis_url,
+                max_connections=_CLIENT_MAX_CONNECTIONS,
+                socket_keepalive=True,
+            )
+            _SHARED_CLIENTS[redis_url] = (client, 1)
+            return client
+        client, refcount = entry
+        _SHARED_CLIENTS[redis_url] = (client, refcount + 1)
+        return client
+
+
+def _release_shared_client(redis_url: str) -> bool:
+    """Drop one reference; return True when the caller held the last one."""
+    with _SHARED_CLIENTS_LOCK:
+        entry = _SHARED_CLIENTS.get(redis_url)
+        if entry is None:
+            return True
+        client, refcount = entry
+        if refcount <= 1:
+            del _SHARED_CLIENTS[redis_url]
+            return True
+        _SHARED_CLIENTS[redis_url] = (client, refcount - 1)
+        return False
+
+
+def _dumps(value: Any) -> bytes | str:
+    try:
+        return orjson.dumps(value, default=str)
+    except TypeError:
+        # orjson rejects non-str dict keys and >64-bit ints; keep the stdlib fallback for those.
+        return json.dumps(value, default=str)
 
 
 class ReadCache:
     def __init__(self, *, redis_url: str | None, ttl_seconds: int) -> None:
         self._ttl = max(0, ttl_seconds)
         self._client: Any = None
+        self._redis_url = redis_url
         if self._ttl > 0 and redis_url:
             try:
                 import redis as _redis
 
-                self._client = _redis.from_url(redis_url, decode_responses=True)
+                self._client = _acquire_shared_client(_redis, redis_url)
             except ImportError:
                 logger.warning("cache_redis_import_failed", extra={"reason": "redis package unavailable"})
             except Exception as exc:
@@ -64,7 +119,7 @@ class ReadCache:
             return None
         try:
             raw = self._client.get(cache_key)
-            return json.loads(raw) if raw is not None else None
+            return orjson.loads(raw) if raw is not None else None
         except Exception as exc:
             logger.warning("cache_get_failed", extra={"key": cache_key, "error": str(exc)})
             return None
@@ -73,7 +128,7 @@ class ReadCache:
         if not self.is_active:
             return
         try:
-            self._client.setex(cache_key, self._ttl, json.dumps(value, default=str))
+            self._client.setex(cache_key, self._ttl, _dumps(value))
         except Exception as exc:
             logger.warning("cache_set_failed", extra={"key": cache_key, "error": str(exc)})
 
@@ -83,19 +138,24 @@ class ReadCache:
             return
         pattern = f"{_KEY_PREFIX}:{domain}:*"
         try:
-            cursor = 0
-            while True:
-                cursor, keys = self._client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    self._client.delete(*keys)
-                if cursor == 0:
-                    break
+            batch: list[bytes] = []
+            for cache_key in self._client.scan_iter(match=pattern, count=_INVALIDATE_BATCH_SIZE):
+                batch.append(cache_key)
+                if len(batch) >= _INVALIDATE_BATCH_SIZE:
+                    self._client.unlink(*batch)
+                    batch = []
+            if batch:
+                self._client.unlink(*batch)
         except Exception as exc:
             logger.warning("cache_invalidate_failed", extra={"pattern": pattern, "error": str(exc)})
 
     def close(self) -> None:
-        if self._client is not None:
-            try:
-                self._client.close()
-            except Exception:
-                pass
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        if self._redis_url and not _release_shared_client(self._redis_url):
+            return
+        try:
+            client.close()
+        except Exception:
+            pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import List
 
 from pydantic import computed_field
@@ -19,12 +20,15 @@ class Config(BaseSettings):
     POSTGRES_USER: str = "app_user"
     POSTGRES_PASSWORD: str = "change_me"
     POSTGRES_DB: str = "civic_archive"
-    DB_POOL_SIZE: int = 10
-    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
     DB_POOL_TIMEOUT_SECONDS: int = 30
     DB_POOL_RECYCLE_SECONDS: int = 3600
+    DB_POOL_PRE_PING: bool = False
     DB_CONNECT_TIMEOUT_SECONDS: int = 3
     DB_STATEMENT_TIMEOUT_MS: int = 5000
+    DB_PREPARE_THRESHOLD: int = 1
+    DB_RANDOM_PAGE_COST: float = 0.0
     INGEST_MAX_BATCH_ITEMS: int = 200
     MAX_REQUEST_BODY_BYTES: int = 1_048_576
 
@@ -36,6 +40,7 @@ class Config(BaseSettings):
 
     LOG_LEVEL: str = "INFO"
     LOG_JSON: bool = True
+    METRICS_OBSERVE_PATH_LABEL_RESOLUTION: bool = False
     REQUIRE_API_KEY: bool = False
     API_KEY: str | None = None
     REQUIRE_JWT: bool = False
@@ -49,6 +54,7 @@ class Config(BaseSettings):
     JWT_SCOPE_DELETE: str = "archive:delete"
     JWT_ADMIN_ROLE: str = "admin"
     READ_CACHE_TTL_SECONDS: int = 0
+    HEALTH_CHECK_CACHE_TTL_SECONDS: int = 2
     RATE_LIMIT_PER_MINUTE: int = 0
     RATE_LIMIT_BACKEND: str = "memory"
     REDIS_URL: str | None = None
@@ -84,43 +90,48 @@ class Config(BaseSettings):
 
     @staticmethod
     def _parse_csv(value: str) -> List[str]:
-        return [item.strip() for item in value.split(",") if item.strip()]
-
-    @property
+        stripped = (value or "").strip()
+        if not stripped:
+            return []
+        if "," not in stripped:
+            return [stripped]
+        return [item for item in (part.strip() for part in stripped.split(",")) if item]
+
+    @cached_property
     def cors_allow_origins_list(self) -> List[str]:
         values = self._parse_csv(self.CORS_ALLOW_ORIGINS)
         return values or ["*"]
 
-    @property
+    @cached_property
     def cors_allow_methods_list(self) -> List[str]:
         values = self._parse_csv(self.CORS_ALLOW_METHODS)
         return values or ["GET", "POST", "DELETE", "OPTIONS"]
 
-    @property
+    @cached_property
     def cors_allow_headers_list(self) -> List[str]:
         values = self._parse_csv(self.CORS_ALLOW_HEADERS)
         return values or ["*"]
 
-    @property
+    @cached_property
     def allowed_hosts_list(self) -> List[str]:
         values = self._parse_csv(self.ALLOWED_HOSTS)
         return values or ["*"]
 
-    @property
+    @cached_property
     def trusted_proxy_cidrs_list(self) -> List[str]:
         return self._parse_csv(self.TRUSTED_PROXY_CIDRS)
 
-    @property
+    @cached_property
     def rate_limit_backend(self) -> str:
         value = (self.RATE_LIMIT_BACKEND or "").strip().lower()
         return value or "memory"
 
-    @property
+    @cached_property
     def app_env(self) -> str:
         value = (self.APP_ENV or "").strip().lower()
         return value or "development"
 
-    @property
+    @cached_property
     def strict_security_mode(self) -> bool:
         if bool(self.SECURITY_STRICT_MODE):
             return True
@@ -1,58 +1,66 @@
 import time as _time
-from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 
 
-class _InstrumentedConnection:
-    """Wraps a SQLAlchemy connection to record per-query latency."""
-
-    def __init__(self, conn: Any, histogram: Any) -> None:
-        self._conn = conn
-        self._histogram = histogram
-
-    def execute(self, *args: Any, **kwargs: Any) -> Any:
-        started = _time.perf_counter()
-        try:
-            return self._conn.execute(*args, **kwargs)
-        finally:
-            self._histogram.observe(_time.perf_counter() - started)
+def instrument_engine(engine: Engine) -> None:
+    """Record per-query latency from SQLAlchemy cursor events (no connection proxy)."""
+    from app.observability import DB_QUERY_DURATION
 
-    def __getattr__(self, name: str) -> Any:
-        return getattr(self._conn, name)
+    def before_cursor_execute(
+        _conn: Any, _cursor: Any, _statement: Any, _parameters: Any, context: Any, _executemany: bool
+    ) -> None:
+        context._query_started = _time.perf_counter()
 
+    def after_cursor_execute(
+        _conn: Any, _cursor: Any, _statement: Any, _parameters: Any, context: Any, _executemany: bool
+    ) -> None:
+        DB_QUERY_DURATION.observe(_time.perf_counter() - context._query_started)
 
-@contextmanager
-def instrumented_begin(engine: Engine) -> Generator[Any, None, None]:
-    from app.observability import DB_QUERY_DURATION
+    def handle_error(exception_context: Any) -> None:
+        # after_cursor_execute does not fire for failed statements (e.g. statement_timeout).
+        context = exception_context.execution_context
+        started = getattr(context, "_query_started", None)
+        if started is not None:
+            DB_QUERY_DURATION.observe(_time.perf_counter() - started)
 
-    with engine.begin() as conn:
-        yield _InstrumentedConnection(conn, DB_QUERY_DURATION)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
 
 
 def init_db(
     database_url: str,
     *,
-    pool_size: int = 10,
-    max_overflow: int = 20,
+    pool_size: int = 20,
+    max_overflow: int = 30,
     pool_timeout_seconds: int = 30,
     pool_recycle_seconds: int = 3600,
+    pool_pre_ping: bool = False,
     connect_timeout_seconds: int = 3,
     statement_timeout_ms: int = 5000,
+    prepare_threshold: int = 1,
+    random_page_cost: float = 0.0,
 ) -> Engine:
-    connect_args = {
+    connect_args: dict[str, Any] = {
         "connect_timeout": max(1, int(connect_timeout_seconds)),
         "options": (
             f"-c statement_timeout={max(1, int(statement_timeout_ms))} "
             "-c application_name=civic_archive_api "
             "-c timezone=UTC"
+            # Session-wide planner cost for SSD-backed storage, so index paths win without per-query SET LOCAL;
+            # 0 or less keeps the server setting.
+            + (f" -c random_page_cost={float(random_page_cost)}" if random_page_cost > 0 else "")
         ),
+        # psycopg server-side prepares a query after this many executions on a connection;
+        # negative disables it (e.g. behind PgBouncer transaction pooling).
+        "prepare_threshold": int(prepare_threshold) if prepare_threshold >= 0 else None,
     }
-    return create_engine(
+    engine = create_engine(
         database_url,
-        pool_pre_ping=True,
+        pool_pre_ping=bool(pool_pre_ping),
         pool_size=max(1, int(pool_size)),
         max_overflow=max(0, int(max_overflow)),
         pool_timeout=max(1, int(pool_timeout_seconds)),
@@ -60,3 +68,6 @@ def init_db(
         connect_args=connect_args,
         future=True,
     )
+    if isinstance(engine, Engine):
+        instrument_engine(engine)
+    return engine
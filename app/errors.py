@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Optional
 
 from fastapi import HTTPException, Request
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import orjson
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 DEFAULT_ERROR_CODES = {
@@ -19,6 +21,23 @@ DEFAULT_ERROR_CODES = {
 }
 
 
+# Keep backward-compatibility for existing clients/tests: `error` mirrors `message`.
+# Deployments without legacy clients can turn this off to drop the duplicate key.
+EMIT_LEGACY_ERROR_KEY = True
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_native(value: Any) -> bool:
+    # Plain JSON trees can be returned as-is; only foreign objects need `jsonable_encoder`.
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_native(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_native(item) for item in value)
+    return False
+
+
 def build_error_payload(
     *,
     code: str,
@@ -26,16 +45,13 @@ def build_error_payload(
     request_id: Optional[str] = None,
     details: Optional[Any] = None,
 ) -> dict[str, Any]:
-    payload: dict[str, Any] = {
-        "code": code,
-        "message": message,
-        # Keep backward-compatibility for existing clients/tests.
-        "error": message,
-    }
+    payload: dict[str, Any] = {"code": code, "message": message}
+    if EMIT_LEGACY_ERROR_KEY:
+        payload["error"] = message
     if request_id:
         payload["request_id"] = request_id
     if details is not None:
-        payload["details"] = jsonable_encoder(details)
+        payload["details"] = details if _is_json_native(details) else jsonable_encoder(details)
     return payload
 
 
@@ -46,6 +62,22 @@ def http_error(status_code: int, code: str, message: str, *, details: Optional[A
     return HTTPException(status_code=status_code, detail=detail)
 
 
+class _ErrorJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+
+@lru_cache(maxsize=256)
+def _static_error_body(code: str, message: str, emit_legacy_error_key: bool) -> bytes:
+    # Detail-less errors repeat the same code/message; only the request id varies.
+    payload: dict[str, Any] = {"code": code, "message": message}
+    if emit_legacy_error_key:
+        payload["error"] = message
+    return orjson.dumps(payload)
+
+
 def error_response(
     request: Request,
     *,
@@ -56,7 +88,12 @@ def error_response(
 ) -> JSONResponse:
     request_id = getattr(request.state, "request_id", None)
     headers = {"X-Request-Id": request_id} if request_id else None
-    return JSONResponse(
+    if details is None:
+        body = _static_error_body(code, message, EMIT_LEGACY_ERROR_KEY)
+        if request_id:
+            body = body[:-1] + b',"request_id":' + orjson.dumps(request_id) + b"}"
+        return _ErrorJSONResponse(body, status_code=status_code, headers=headers)
+    return _ErrorJSONResponse(
         build_error_payload(code=code, message=message, request_id=request_id, details=details),
         status_code=status_code,
         headers=headers,
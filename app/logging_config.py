@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import json
-import logging
+import atexit
+import copy
 from datetime import datetime, timezone
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+
+import orjson
 
 
 class JsonFormatter(logging.Formatter):
@@ -17,16 +22,48 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # `record.created` is already captured by logging; no extra clock read.
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
+        exc_text = record.exc_text
+        if exc_text is None and record.exc_info:
+            exc_text = self.formatException(record.exc_info)
+        if exc_text:
+            payload["exc_info"] = exc_text
+        record_fields = record.__dict__
+        # Walk the ordered tuple so extra keys keep a stable order across processes.
         for field in self.EXTRA_FIELDS:
-            value = getattr(record, field, None)
-            if value is not None:
-                payload[field] = value
-        return json.dumps(payload, ensure_ascii=False)
+            if field in record_fields:
+                value = record_fields[field]
+                if value is not None:
+                    payload[field] = value
+        return orjson.dumps(payload, default=str).decode()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue records with the message rendered but the traceback kept apart.
+
+    The message is merged with its args on the calling thread, as the stock `prepare()`
+    does, so mutable args cannot change before the listener emits them. Unlike the stock
+    handler, the traceback goes to `exc_text` instead of being folded into `record.msg`,
+    so formatters can emit it separately from the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if record.exc_text is None:
+                record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
 
 
 def configure_logging(*, level: str = "INFO", json_logs: bool = True) -> None:
@@ -42,6 +79,15 @@ def configure_logging(*, level: str = "INFO", json_logs: bool = True) -> None:
     else:
         handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
 
-    root.addHandler(handler)
+    # Request threads render the message (and any traceback) and enqueue the record; the
+    # handler's formatter and stream I/O run on the listener thread, which is flushed and
+    # stopped at interpreter exit.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.addHandler(_RecordQueueHandler(log_queue))
     root.setLevel(level.upper())
+    root._civic_log_listener = listener  # type: ignore[attr-defined]
     root._civic_logging_configured = True  # type: ignore[attr-defined]
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from collections import OrderedDict
 import logging
+from secrets import token_hex
 import threading
 import time
 from typing import Any
-from uuid import uuid4
+import weakref
 
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from starlette._utils import get_route_path
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.routing import Match
 
@@ -33,35 +34,26 @@ DB_QUERY_DURATION = Histogram(
     "Database query execution duration (seconds)",
 )
 ALLOWED_HTTP_METHOD_LABELS = {"GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"}
+_METHOD_LABELS = {
+    **{method: method for method in ALLOWED_HTTP_METHOD_LABELS},
+    **{method.lower(): method for method in ALLOWED_HTTP_METHOD_LABELS},
+}
+_STATUS_LABELS = {code: str(code) for code in range(100, 600)}
 MAX_PATH_LABEL_LENGTH = 96
 ROUTE_TEMPLATE_CACHE_MAX_SIZE = 512
 
 logger = logging.getLogger("civic_archive.api")
-_ROUTE_TEMPLATE_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
-_ROUTE_TEMPLATE_CACHE_LOCK = threading.RLock()
+REQUEST_ID_BYTES = 16
+# Label children are resolved once per label set; the path label is bounded to route
+# templates and sentinels, so these stay small.
+_COUNT_CHILDREN: dict[tuple[str, str, str], Counter] = {}
+_LATENCY_CHILDREN: dict[tuple[str, str], Histogram] = {}
 
 
-def _route_cache_key(request: Request) -> tuple[str, str]:
-    raw_path = request.scope.get("path")
-    path = str(raw_path) if isinstance(raw_path, str) else request.url.path
-    return (_metric_method_label(request.method), path)
-
-
-def _route_template_cache_get(cache_key: tuple[str, str]) -> str | None:
-    with _ROUTE_TEMPLATE_CACHE_LOCK:
-        route_path = _ROUTE_TEMPLATE_CACHE.get(cache_key)
-        if route_path is None:
-            return None
-        _ROUTE_TEMPLATE_CACHE.move_to_end(cache_key)
-        return route_path
-
-
-def _route_template_cache_set(cache_key: tuple[str, str], route_path: str) -> None:
-    with _ROUTE_TEMPLATE_CACHE_LOCK:
-        _ROUTE_TEMPLATE_CACHE[cache_key] = route_path
-        _ROUTE_TEMPLATE_CACHE.move_to_end(cache_key)
-        while len(_ROUTE_TEMPLATE_CACHE) > ROUTE_TEMPLATE_CACHE_MAX_SIZE:
-            _ROUTE_TEMPLATE_CACHE.popitem(last=False)
+# Per-app `(method, path) -> route template` cache for requests that reach the metrics
+# middleware without `scope["route"]` (e.g. rejected by the payload guard before routing).
+_ROUTE_TEMPLATE_CACHES: weakref.WeakKeyDictionary[FastAPI, dict[tuple[str, str], str]] = weakref.WeakKeyDictionary()
+_ROUTE_TEMPLATE_CACHE_LOCK = threading.Lock()
 
 
 def _resolve_route_template_from_router(request: Request, api: FastAPI | None = None) -> str | None:
@@ -82,48 +74,70 @@ def _resolve_route_template_from_router(request: Request, api: FastAPI | None =
     return None
 
 
-def _route_template(request: Request, api: FastAPI | None = None) -> tuple[str, str]:
+def _resolve_route_template(request: Request, api: FastAPI) -> tuple[str | None, str]:
+    """Return `(template, strategy)`: `cache` on a cache hit, `router` after a router scan."""
+    scope = request.scope
+    cache_key = (str(scope.get("method", "")), get_route_path(scope))
+    cache = _ROUTE_TEMPLATE_CACHES.get(api)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, "cache"
+
+    resolved = _resolve_route_template_from_router(request, api)
+    if resolved:
+        with _ROUTE_TEMPLATE_CACHE_LOCK:
+            cache = _ROUTE_TEMPLATE_CACHES.setdefault(api, {})
+            if cache_key not in cache and len(cache) >= ROUTE_TEMPLATE_CACHE_MAX_SIZE:
+                # dict keeps insertion order: drop the oldest entry.
+                del cache[next(iter(cache))]
+            cache[cache_key] = resolved
+    return resolved, "router"
+
+
+def _route_template(
+    request: Request, api: FastAPI | None = None, status_code: int | None = None
+) -> tuple[str, str]:
     route = request.scope.get("route")
     route_path = getattr(route, "path", None)
     if route_path:
         return str(route_path), "scope"
 
-    cache_key = _route_cache_key(request)
-    cached = _route_template_cache_get(cache_key)
-    if cached is not None:
-        return cached, "cache"
-    resolved = _resolve_route_template_from_router(request, api)
+    # A 404 without a matched route is the router's own miss (scanners, typos): skip the lookup.
+    if api is None or status_code == 404:
+        return "/_unmatched", "fallback"
+
+    resolved, strategy = _resolve_route_template(request, api)
     if resolved:
-        _route_template_cache_set(cache_key, resolved)
-        return resolved, "router"
+        return resolved, strategy
     return "/_unmatched", "fallback"
 
 
 def _metric_method_label(method: str | None) -> str:
-    normalized = (method or "").upper()
-    if normalized in ALLOWED_HTTP_METHOD_LABELS:
-        return normalized
-    return "OTHER"
+    label = _METHOD_LABELS.get(method or "")
+    if label is not None:
+        return label
+    return _METHOD_LABELS.get((method or "").upper(), "OTHER")
 
 
-def _metric_path_label(request: Request, api: FastAPI | None = None) -> tuple[str, str]:
-    path, strategy = _route_template(request, api)
+def _metric_path_label(
+    request: Request, api: FastAPI | None = None, status_code: int | None = None
+) -> tuple[str, str]:
+    path, strategy = _route_template(request, api, status_code)
     if len(path) > MAX_PATH_LABEL_LENGTH:
         return "/_label_too_long", "label_too_long"
     return path, strategy
 
 
 def _metric_status_label(status_code: int) -> str:
-    if 100 <= int(status_code) <= 599:
-        return str(int(status_code))
-    return "000"
+    return _STATUS_LABELS.get(status_code, "000")
 
 
 def _status_code_from_exception(exc: Exception) -> int:
     if isinstance(exc, RequestValidationError):
         return 400
     if isinstance(exc, StarletteHTTPException):
-        return int(exc.status_code)
+        return exc.status_code
     return 500
 
 
@@ -140,7 +154,7 @@ def _build_request_log_payload(
         "request_id": request_id,
         "method": method,
         "path": path,
-        "status_code": int(status_code),
+        "status_code": status_code,
         "duration_ms": round(elapsed_seconds * 1000, 2),
         "client_ip": client_ip,
     }
@@ -173,11 +187,31 @@ def build_request_log_payload(
     )
 
 
+def _count_child(method_label: str, path: str, status_label: str) -> Counter:
+    key = (method_label, path, status_label)
+    try:
+        return _COUNT_CHILDREN[key]
+    except KeyError:
+        child = REQUEST_COUNT.labels(*key)
+        _COUNT_CHILDREN[key] = child
+        return child
+
+
+def _latency_child(method_label: str, path: str) -> Histogram:
+    key = (method_label, path)
+    try:
+        return _LATENCY_CHILDREN[key]
+    except KeyError:
+        child = REQUEST_LATENCY.labels(*key)
+        _LATENCY_CHILDREN[key] = child
+        return child
+
+
 def _observe_request_metrics(*, method: str, path: str, status_code: int, elapsed_seconds: float) -> None:
     method_label = _metric_method_label(method)
     status_label = _metric_status_label(status_code)
-    REQUEST_COUNT.labels(method_label, path, status_label).inc()
-    REQUEST_LATENCY.labels(method_label, path).observe(elapsed_seconds)
+    _count_child(method_label, path, status_label).inc()
+    _latency_child(method_label, path).observe(elapsed_seconds)
 
 
 def _build_request_observability_payload(
@@ -188,13 +222,17 @@ def _build_request_observability_payload(
     method: str,
     status_code: int,
     started: float,
+    observe_path_label_resolution: bool = False,
 ) -> dict[str, str | int | float | None]:
     elapsed_seconds = time.perf_counter() - started
-    path_resolution_started = time.perf_counter()
-    path, path_strategy = _metric_path_label(request, api)
-    PATH_LABEL_RESOLUTION_LATENCY.labels(path_strategy).observe(
-        time.perf_counter() - path_resolution_started
-    )
+    if observe_path_label_resolution:
+        path_resolution_started = time.perf_counter()
+        path, path_strategy = _metric_path_label(request, api, status_code)
+        PATH_LABEL_RESOLUTION_LATENCY.labels(path_strategy).observe(
+            time.perf_counter() - path_resolution_started
+        )
+    else:
+        path, _ = _metric_path_label(request, api, status_code)
     _observe_request_metrics(
         method=method,
         path=path,
@@ -212,12 +250,22 @@ def _build_request_observability_payload(
     )
 
 
-def register_observability(api: FastAPI, *, metrics_dependencies: list[Any] | None = None) -> None:
+def new_request_id() -> str:
+    """Return a random 128-bit hex correlation id (cheaper than formatting a `uuid4()`)."""
+    return token_hex(REQUEST_ID_BYTES)
+
+
+def register_observability(
+    api: FastAPI,
+    *,
+    metrics_dependencies: list[Any] | None = None,
+    observe_path_label_resolution: bool = False,
+) -> None:
     route_dependencies = metrics_dependencies or []
 
     @api.middleware("http")
     async def request_observability(request: Request, call_next):
-        request_id = request.headers.get("X-Request-Id") or getattr(request.state, "request_id", None) or str(uuid4())
+        request_id = request.headers.get("X-Request-Id") or getattr(request.state, "request_id", None) or new_request_id()
         request.state.request_id = request_id
         started = time.perf_counter()
         method = request.method
@@ -234,6 +282,7 @@ def register_observability(api: FastAPI, *, metrics_dependencies: list[Any] | No
                 method=method,
                 status_code=status_code,
                 started=started,
+                observe_path_label_resolution=observe_path_label_resolution,
             )
             if status_code >= 500:
                 logger.exception(
@@ -248,7 +297,7 @@ def register_observability(api: FastAPI, *, metrics_dependencies: list[Any] | No
             raise
 
         assert response is not None
-        status_code = int(response.status_code)
+        status_code = response.status_code
         log_payload = _build_request_observability_payload(
             request=request,
             api=api,
@@ -256,6 +305,7 @@ def register_observability(api: FastAPI, *, metrics_dependencies: list[Any] | No
             method=method,
             status_code=status_code,
             started=started,
+            observe_path_label_resolution=observe_path_label_resolution,
         )
         response.headers["X-Request-Id"] = request_id
         logger.info(
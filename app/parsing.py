@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+import re
 from typing import Any
 
 DATETIME_FORMATS: tuple[str, ...] = (
@@ -9,11 +11,46 @@ DATETIME_FORMATS: tuple[str, ...] = (
     "%Y-%m-%dT%H:%M:%S",
 )
 
+# Common `YYYY-MM-DD[T ]HH:MM:SS[Z]` shape (lenient digit counts like strptime), parsed
+# without raising; anything else goes through `datetime.fromisoformat`, then `DATETIME_FORMATS`.
+_DATETIME_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})[T ](\d{1,2}):(\d{1,2}):(\d{1,2})Z?")
+_UTC = timezone.utc
+_MIDNIGHT = time(0, 0)
+# Ingest batches repeat the same timestamp strings (e.g. segments of one meeting).
+TEMPORAL_PARSE_CACHE_MAX_SIZE = 4096
+
 
 def _normalize_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None or dt.utcoffset() is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
+
+
+@lru_cache(maxsize=TEMPORAL_PARSE_CACHE_MAX_SIZE)
+def _parse_datetime_str(value: str) -> datetime | None:
+    match = _DATETIME_RE.fullmatch(value)
+    if match is not None:
+        year, month, day, hour, minute, second = map(int, match.groups())
+        try:
+            return datetime(year, month, day, hour, minute, second, tzinfo=_UTC)
+        except ValueError:
+            return None
+    # Every form fromisoformat or DATETIME_FORMATS accepts (extended `YYYY-MM-DD`, basic
+    # `YYYYMMDD`, week dates) opens with a 4-digit year; skip doomed raises for anything else.
+    if not value[:4].isdigit():
+        return None
+    if "T" in value or " " in value:
+        try:
+            return _normalize_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            pass
+    # strptime still covers spellings the regex leaves out, e.g. repeated whitespace.
+    for fmt in DATETIME_FORMATS:
+        try:
+            return _normalize_utc(datetime.strptime(value, fmt))
+        except ValueError:
+            continue
+    return None
 
 
 def parse_datetime_value(raw: Any) -> datetime | None:
@@ -22,25 +59,31 @@ def parse_datetime_value(raw: Any) -> datetime | None:
     if isinstance(raw, datetime):
         return _normalize_utc(raw)
     if isinstance(raw, date):
-        return datetime.combine(raw, datetime.min.time(), tzinfo=timezone.utc)
+        return datetime.combine(raw, _MIDNIGHT, tzinfo=_UTC)
     if isinstance(raw, str):
         value = raw.strip()
         if not value:
             return None
-        if "T" in value or " " in value:
-            iso_candidate = value.replace("Z", "+00:00")
-            try:
-                return _normalize_utc(datetime.fromisoformat(iso_candidate))
-            except ValueError:
-                pass
-        for fmt in DATETIME_FORMATS:
-            try:
-                return _normalize_utc(datetime.strptime(value, fmt))
-            except ValueError:
-                continue
+        parsed = _parse_datetime_str(value)
+        if parsed is not None:
+            return parsed
     raise ValueError(f"datetime format error: {raw}")
 
 
+@lru_cache(maxsize=TEMPORAL_PARSE_CACHE_MAX_SIZE)
+def _parse_date_str(value: str) -> date:
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        # Zero-padded `YYYY-MM-DD`: fromisoformat accepts exactly what strptime would, much faster.
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise ValueError("date must be YYYY-MM-DD") from exc
+
+
 def parse_date_value(raw: Any) -> date | None:
     if raw is None or raw == "":
         return None
@@ -49,8 +92,5 @@ def parse_date_value(raw: Any) -> date | None:
     if isinstance(raw, date):
         return raw
     if isinstance(raw, str):
-        try:
-            return datetime.strptime(raw, "%Y-%m-%d").date()
-        except ValueError as exc:
-            raise ValueError("date must be YYYY-MM-DD") from exc
+        return _parse_date_str(raw)
     raise ValueError("date must be YYYY-MM-DD")
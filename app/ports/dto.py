@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import TypedDict
+from typing import Literal, TypedDict
+
+# Keyset list position: (sort column value as ISO text or None, row id) of the last row seen.
+KeysetCursor = tuple[str | None, int]
+# List total mode. exact: window/COUNT total. skip: LIMIT size+1 lookahead, total is a lower
+# bound. estimate: like skip, but unfiltered lists use the planner row estimate (pg_class.reltuples).
+CountMode = Literal["exact", "estimate", "skip"]
 
 
 class NewsArticleUpsertDTO(TypedDict):
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Protocol
 
 from app.ports.dto import (
+    CountMode,
+    KeysetCursor,
     MinutesRecordDTO,
     MinutesUpsertDTO,
     NewsArticleRecordDTO,
@@ -25,15 +27,23 @@ class NewsRepositoryPort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[NewsArticleRecordDTO], int]:
         ...
 
     def get_article(self, item_id: int) -> NewsArticleRecordDTO | None:
         ...
 
+    def get_articles_by_ids(self, item_ids: list[int]) -> dict[int, NewsArticleRecordDTO]:
+        ...
+
     def delete_article(self, item_id: int) -> bool:
         ...
 
+    def delete_articles_by_ids(self, item_ids: list[int]) -> list[int]:
+        ...
+
 
 class MinutesRepositoryPort(Protocol):
     def upsert_minutes(self, items: list[MinutesUpsertDTO]) -> tuple[int, int]:
@@ -51,15 +61,23 @@ class MinutesRepositoryPort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[MinutesRecordDTO], int]:
         ...
 
     def get_minutes(self, item_id: int) -> MinutesRecordDTO | None:
         ...
 
+    def get_minutes_by_ids(self, item_ids: list[int]) -> dict[int, MinutesRecordDTO]:
+        ...
+
     def delete_minutes(self, item_id: int) -> bool:
         ...
 
+    def delete_minutes_by_ids(self, item_ids: list[int]) -> list[int]:
+        ...
+
 
 class SegmentsRepositoryPort(Protocol):
     def insert_segments(self, items: list[SegmentUpsertDTO]) -> int:
@@ -81,6 +99,8 @@ class SegmentsRepositoryPort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[SegmentRecordDTO], int]:
         ...
 
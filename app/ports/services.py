@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from app.ports.dto import (
+    CountMode,
     MinutesRecordDTO,
     MinutesUpsertDTO,
     NewsArticleRecordDTO,
@@ -28,6 +29,8 @@ class NewsServicePort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[NewsArticleRecordDTO], int]:
         ...
 
@@ -57,6 +60,8 @@ class MinutesServicePort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[MinutesRecordDTO], int]:
         ...
 
@@ -90,6 +95,8 @@ class SegmentsServicePort(Protocol):
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[SegmentRecordDTO], int]:
         ...
 
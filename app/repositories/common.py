@@ -1,62 +1,250 @@
 from __future__ import annotations
 
-import json
-from datetime import date, datetime
+from collections.abc import Hashable, Mapping, Sequence
+from functools import lru_cache
+from operator import itemgetter
+import time
 from typing import Any
 
-from sqlalchemy import Date, bindparam, cast, text
+import orjson
+from sqlalchemy import Date, Select, and_, bindparam, cast, or_, text, tuple_
 
-from app.repositories.search import build_split_search_condition, build_split_search_params
+from app.ports.dto import CountMode, KeysetCursor
+from app.repositories.search import (
+    build_indexed_search_condition,
+    build_split_search_condition,
+    build_split_search_params,
+)
 from app.repositories.session_provider import ConnectionProvider, open_connection_scope
 
 
-def _json_default(value: Any) -> Any:
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+# 목록 쿼리에 전체 건수를 함께 싣는 `COUNT(*) OVER ()` 컬럼의 label입니다.
+ROW_TOTAL_KEY = "__total_count"
+# LIMIT은 실행 시 literal로 렌더링합니다(statement compile은 한 번뿐입니다). page size 값의 종류가
+# 적고, literal이면 PostgreSQL이 size별로 top-N heapsort를 계획할 수 있습니다. OFFSET은 bind로 둡니다.
+PAGE_LIMIT_PARAM: Any = bindparam("limit", literal_execute=True)
+PAGE_OFFSET_PARAM: Any = bindparam("offset")
+ESTIMATED_COUNT_TTL_SECONDS = 60.0
+_ESTIMATED_COUNTS: dict[str, tuple[float, int]] = {}
+# 필터가 적용된 list/count statement는 (statement_key, bind된 필터 이름, count 경로)마다 한 번만 만듭니다.
+# 같은 statement 객체를 재사용하면 memoize된 cache key가 유지되어, 요청마다 SQL을 다시 만들거나
+# compile하지 않고 engine의 compiled cache를 그대로 사용합니다.
+_FILTERED_LIST_STATEMENTS: dict[Hashable, tuple[Any, Any]] = {}
+
+
+def _dump_json(value: Any) -> str:
+    # orjson은 date/datetime을 ISO-8601로 직접 직렬화하고, str이 아닌 key는 stdlib처럼 문자열로 바꿉니다.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def to_json_recordset(items: list[dict[str, Any]]) -> str:
-    return json.dumps(items, ensure_ascii=False, default=_json_default, separators=(",", ":"))
+    return _dump_json(items)
+
+
+# 이 크기 이상의 batch는 COPY로 staging하고, 더 작은 batch는 단일 statement jsonb_to_recordset 경로를 유지합니다.
+# API batch가 실제로 COPY 경로를 탈 수 있도록 기본 INGEST_MAX_BATCH_ITEMS(200)보다 작게 유지합니다.
+COPY_STAGE_MIN_ROWS = 100
+
+
+def _copy_value(value: Any, sql_type: str) -> Any:
+    if value is not None and sql_type == "jsonb":
+        return _dump_json(value)
+    return value
+
+
+def stage_payload_rows(
+    conn: Any,
+    *,
+    stage_table: str,
+    columns: Sequence[tuple[str, str]],
+    rows: list[dict[str, Any]],
+) -> None:
+    """Load rows into a transaction-scoped temp table through COPY FROM STDIN."""
+    column_defs = ", ".join(f"{name} {sql_type}" for name, sql_type in columns)
+    conn.execute(text(f"CREATE TEMP TABLE {stage_table} ({column_defs}) ON COMMIT DROP"))
+    column_names = ", ".join(name for name, _ in columns)
+    with conn.connection.driver_connection.cursor() as cursor:
+        with cursor.copy(f"COPY {stage_table} ({column_names}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([_copy_value(row.get(name), sql_type) for name, sql_type in columns])
+
+
+# payload template x {jsonb recordset, COPY stage} x tally 형태의 조합은 이 값보다 충분히 작습니다.
+PAYLOAD_STATEMENT_CACHE_MAX_SIZE = 32
+
+
+@lru_cache(maxsize=PAYLOAD_STATEMENT_CACHE_MAX_SIZE)
+def payload_statement(sql_template: str, payload_source: str, suffix: str = "") -> Any:
+    """Build the `text()` clause for a payload template once and reuse it across calls.
+
+    The same SQL string each time also lets psycopg's `prepare_threshold` reuse its server-side plan.
+    """
+    return text(sql_template.format(payload_source=payload_source) + suffix)
+
+
+def build_payload_source(
+    conn: Any,
+    *,
+    columns: Sequence[tuple[str, str]],
+    rows: list[dict[str, Any]],
+    stage_table: str,
+) -> tuple[str, dict[str, Any]]:
+    """Return the `FROM` source (aliased `p`) for payload rows and the params it binds.
+
+    Large batches are COPY-staged into `stage_table`; smaller ones ride in one jsonb parameter.
+    """
+    if len(rows) >= COPY_STAGE_MIN_ROWS:
+        stage_payload_rows(conn, stage_table=stage_table, columns=columns, rows=rows)
+        return f"{stage_table} AS p", {}
+    column_defs = ", ".join(f"{name} {sql_type}" for name, sql_type in columns)
+    return (
+        f"jsonb_to_recordset(CAST(:items AS jsonb)) AS p({column_defs})",
+        {"items": to_json_recordset(rows)},
+    )
+
+
+# 이 크기보다 작은 batch는 `upserted` RETURNING row를 Python에서 집계하고, 큰 batch는 SQL SUM을 유지합니다.
+UPSERT_SERVER_TALLY_MIN_ROWS = 500
+_SERVER_TALLY_SQL = """
+    SELECT
+      COALESCE(SUM(CASE WHEN inserted THEN 1 ELSE 0 END), 0) AS inserted,
+      COALESCE(SUM(CASE WHEN NOT inserted THEN 1 ELSE 0 END), 0) AS updated
+    FROM upserted
+"""
+_ROW_TALLY_SQL = "SELECT inserted FROM upserted"
+
+
+def execute_payload_upsert(
+    conn: Any,
+    upsert_sql: str,
+    *,
+    columns: Sequence[tuple[str, str]],
+    rows: list[dict[str, Any]],
+    stage_table: str,
+    server_tally_min_rows: int | None = None,
+) -> tuple[int, int]:
+    """Run the `upserted` CTE in `upsert_sql` over the JSON recordset or a COPY-staged table.
+
+    Returns `(inserted, updated)`.
+    """
+    payload_source, params = build_payload_source(conn, columns=columns, rows=rows, stage_table=stage_table)
+    if server_tally_min_rows is None:
+        server_tally_min_rows = UPSERT_SERVER_TALLY_MIN_ROWS
+    if len(rows) >= server_tally_min_rows:
+        statement = payload_statement(upsert_sql, payload_source, _SERVER_TALLY_SQL)
+        row = conn.execute(statement, params).mappings().first() or {}
+        return int(row.get("inserted") or 0), int(row.get("updated") or 0)
+    statement = payload_statement(upsert_sql, payload_source, _ROW_TALLY_SQL)
+    inserted = updated = 0
+    for row in conn.execute(statement, params).mappings().all():
+        if row["inserted"]:
+            inserted += 1
+        else:
+            updated += 1
+    return inserted, updated
+
+
+def project_payload_rows(items: Sequence[Mapping[str, Any]], fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Copy `fields` out of each item; missing keys become None."""
+    getter = itemgetter(*fields)
+    try:
+        return [dict(zip(fields, getter(item))) for item in items]
+    except KeyError:
+        # 일부 key만 있는 item(예: repository 직접 호출)은 key별 경로로 처리합니다.
+        return [{field: item.get(field) for field in fields} for item in items]
 
 
 def dedupe_rows_by_key(items: list[dict[str, Any]], *, key: str) -> list[dict[str, Any]]:
     """Keep the last row per key while preserving relative order of retained rows."""
-    seen: set[Any] = set()
-    deduped_reversed: list[dict[str, Any]] = []
-    for item in reversed(items):
+    deduped: dict[Any, dict[str, Any]] = {}
+    for item in items:
         key_value = item.get(key)
-        if key_value in seen:
-            continue
-        seen.add(key_value)
-        deduped_reversed.append(item)
-    deduped_reversed.reverse()
-    return deduped_reversed
+        # 먼저 pop해서 반복된 key가 마지막으로 등장한 위치로 옮겨지게 합니다.
+        deduped.pop(key_value, None)
+        deduped[key_value] = item
+    return list(deduped.values())
 
 
 def normalize_optional_str(value: str | None) -> str | None:
-    if value is None:
+    # None과 ""(흔한 "필터 미지정" 값)는 strip() 호출 없이 바로 반환합니다.
+    if not value:
         return None
-    normalized = value.strip()
-    return normalized or None
+    return value.strip() or None
 
 
-def _extract_row_total(
-    rows: list[dict[str, Any]],
-    *,
-    row_total_key: str,
-) -> int | None:
-    if not rows:
-        return None
-    if row_total_key not in rows[0]:
-        return None
+def _materialize_rows(result: Any, row_total_key: str | None) -> tuple[list[dict[str, Any]], int | None]:
+    """Build plain dicts from row tuples, dropping the window-total column on the way."""
+    keys = list(result.keys())
+    rows = result.tuples().all()
+    if row_total_key is None or row_total_key not in keys:
+        return [dict(zip(keys, row)) for row in rows], None
+    total_index = keys.index(row_total_key)
+    del keys[total_index]
+    raw_total = rows[0][total_index] if rows else None
+    if total_index == len(keys):
+        # 마지막 total 컬럼은 zip이 더 짧은 key 목록에서 멈추므로 자연히 제외됩니다.
+        row_dicts = [dict(zip(keys, row)) for row in rows]
+    else:
+        row_dicts = [dict(zip(keys, row[:total_index] + row[total_index + 1 :])) for row in rows]
+    return row_dicts, None if raw_total is None else int(raw_total)
+
+
+def _without_row_total(list_stmt: Any, row_total_key: str | None) -> Any:
+    if row_total_key is None or not isinstance(list_stmt, Select):
+        return list_stmt
+    columns = [column for column in list_stmt.selected_columns if column.key != row_total_key]
+    if len(columns) == len(list_stmt.selected_columns):
+        return list_stmt
+    return list_stmt.with_only_columns(*columns)
 
-    raw_total = rows[0][row_total_key]
-    for row in rows:
-        row.pop(row_total_key, None)
-    if raw_total is None:
+
+def _estimated_table_rows(conn: Any, table_name: str) -> int | None:
+    now = time.monotonic()
+    cached = _ESTIMATED_COUNTS.get(table_name)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    raw_estimate = conn.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+        {"table_name": table_name},
+    ).scalar()
+    # 테이블이 한 번도 vacuum/analyze되지 않았다면 reltuples는 -1입니다.
+    if raw_estimate is None or int(raw_estimate) < 0:
         return None
-    return int(raw_total)
+    estimate = int(raw_estimate)
+    _ESTIMATED_COUNTS[table_name] = (now + ESTIMATED_COUNT_TTL_SECONDS, estimate)
+    return estimate
+
+
+def _execute_lookahead_page(
+    conn: Any,
+    *,
+    list_stmt: Any,
+    count_stmt: Any,
+    params: dict[str, Any],
+    page: int,
+    size: int,
+    row_total_key: str | None,
+    estimate_table: str | None,
+) -> tuple[list[dict[str, Any]], int]:
+    offset = (page - 1) * size
+    params["limit"] = size + 1
+    params["offset"] = offset
+    row_dicts, _ = _materialize_rows(
+        conn.execute(_without_row_total(list_stmt, row_total_key), params),
+        row_total_key,
+    )
+    if not row_dicts and page > 1:
+        # 마지막 페이지를 지나면 보고할 하한이 없으므로 exact count로 대체합니다.
+        return row_dicts, int(conn.execute(count_stmt, params).scalar() or 0)
+
+    has_more = len(row_dicts) > size
+    del row_dicts[size:]
+    total = offset + len(row_dicts) + (1 if has_more else 0)
+    if has_more and estimate_table is not None:
+        estimate = _estimated_table_rows(conn, estimate_table)
+        if estimate is not None:
+            total = max(total, estimate)
+    return row_dicts, total
 
 
 def execute_paginated_query(
@@ -68,21 +256,31 @@ def execute_paginated_query(
     size: int,
     connection_provider: ConnectionProvider,
     row_total_key: str | None = None,
+    count_mode: CountMode = "exact",
+    estimate_table: str | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
     with open_connection_scope(connection_provider) as conn:
-        rows = conn.execute(
-            list_stmt,
-            {**params, "limit": size, "offset": (page - 1) * size},
-        ).mappings().all()
-        row_dicts = [dict(row) for row in rows]
-        if row_total_key:
-            total = _extract_row_total(row_dicts, row_total_key=row_total_key)
-            if total is None:
-                if page == 1 and len(row_dicts) < size:
-                    total = len(row_dicts)
-                else:
-                    total = conn.execute(count_stmt, params).scalar() or 0
-        else:
+        if count_mode != "exact":
+            return _execute_lookahead_page(
+                conn,
+                list_stmt=list_stmt,
+                count_stmt=count_stmt,
+                params=params,
+                page=page,
+                size=size,
+                row_total_key=row_total_key,
+                estimate_table=estimate_table if count_mode == "estimate" else None,
+            )
+        # params는 요청마다 새로 만든 dict라 limit/offset을 그대로 채워 넣습니다.
+        # count query는 자신이 bind하는 이름만 읽으므로 추가된 키의 영향을 받지 않습니다.
+        params["limit"] = size
+        params["offset"] = (page - 1) * size
+        # 목록 쿼리의 COUNT(*) OVER () 값이 있으면 별도 count query 없이 전체 건수로 사용합니다.
+        row_dicts, total = _materialize_rows(
+            conn.execute(list_stmt, params),
+            row_total_key,
+        )
+        if total is None:
             # 첫 페이지 결과가 page size보다 작으면 전체 건수는 rows 길이와 동일합니다.
             # 이 경우 count query를 생략해 DB round-trip을 줄입니다.
             if page == 1 and len(row_dicts) < size:
@@ -93,6 +291,36 @@ def execute_paginated_query(
     return row_dicts, int(total)
 
 
+# 필터 조건은 (column, param 이름, operator)에만 의존하므로 한 번만 만들어 요청 간에 공유합니다.
+# 그래서 cache된 list statement는 새 expression 객체를 만들 필요가 없습니다.
+FILTER_CONDITION_CACHE_MAX_SIZE = 256
+
+
+@lru_cache(maxsize=FILTER_CONDITION_CACHE_MAX_SIZE)
+def _filter_condition(column_expr: Any, param_name: str, kind: str) -> Any:
+    bound: Any = bindparam(param_name)
+    if kind == "eq":
+        return column_expr == bound
+    if kind == "gte":
+        return column_expr >= bound
+    if kind == "lte":
+        return column_expr <= bound
+    if kind == "lt_next_day":
+        return column_expr < (cast(bound, Date) + text("INTERVAL '1 day'"))
+    raise ValueError(f"unknown filter condition kind: {kind}")
+
+
+@lru_cache(maxsize=FILTER_CONDITION_CACHE_MAX_SIZE)
+def _keyset_condition(sort_column: Any, id_column: Any, null_sort: bool) -> Any:
+    if null_sort:
+        # NULL 정렬 값은 맨 뒤에 오므로, 그 뒤에는 id가 더 작은 남은 NULL row만 이어집니다.
+        return and_(sort_column.is_(None), id_column < bindparam("after_id"))
+    return or_(
+        tuple_(sort_column, id_column) < tuple_(bindparam("after_sort"), bindparam("after_id")),
+        sort_column.is_(None),
+    )
+
+
 def add_truthy_equals_filter(
     *,
     value: Any,
@@ -105,7 +333,7 @@ def add_truthy_equals_filter(
         value = normalize_optional_str(value)
     if not value:
         return
-    conditions.append(column_expr == bindparam(param_name))
+    conditions.append(_filter_condition(column_expr, param_name, "eq"))
     params[param_name] = value
 
 
@@ -119,7 +347,7 @@ def add_not_none_equals_filter(
 ) -> None:
     if value is None:
         return
-    conditions.append(column_expr == bindparam(param_name))
+    conditions.append(_filter_condition(column_expr, param_name, "eq"))
     params[param_name] = value
 
 
@@ -133,8 +361,24 @@ def add_split_search_filter(
     normalized_query = normalize_optional_str(query)
     if normalized_query is None:
         return
-    conditions.append(build_split_search_condition(columns=columns))
-    params.update(build_split_search_params(normalized_query))
+    search_params = build_split_search_params(normalized_query)
+    conditions.append(build_split_search_condition(columns=columns, fts="q_fts" in search_params))
+    params.update(search_params)
+
+
+def add_indexed_search_filter(
+    *,
+    query: str | None,
+    document_sql: str,
+    conditions: list[Any],
+    params: dict[str, Any],
+) -> None:
+    normalized_query = normalize_optional_str(query)
+    if normalized_query is None:
+        return
+    search_params = build_split_search_params(normalized_query)
+    conditions.append(build_indexed_search_condition(document_sql=document_sql, fts="q_fts" in search_params))
+    params.update(search_params)
 
 
 def add_date_from_filter(
@@ -148,7 +392,7 @@ def add_date_from_filter(
     normalized_value = normalize_optional_str(value)
     if normalized_value is None:
         return
-    conditions.append(column_expr >= bindparam(param_name))
+    conditions.append(_filter_condition(column_expr, param_name, "gte"))
     params[param_name] = normalized_value
 
 
@@ -163,7 +407,7 @@ def add_date_to_filter_inclusive(
     normalized_value = normalize_optional_str(value)
     if normalized_value is None:
         return
-    conditions.append(column_expr <= bindparam(param_name))
+    conditions.append(_filter_condition(column_expr, param_name, "lte"))
     params[param_name] = normalized_value
 
 
@@ -178,10 +422,53 @@ def add_date_to_filter_next_day_exclusive(
     normalized_value = normalize_optional_str(value)
     if normalized_value is None:
         return
-    conditions.append(column_expr < (cast(bindparam(param_name), Date) + text("INTERVAL '1 day'")))
+    conditions.append(_filter_condition(column_expr, param_name, "lt_next_day"))
     params[param_name] = normalized_value
 
 
+def add_keyset_after_filter(
+    *,
+    after: KeysetCursor | None,
+    sort_column: Any,
+    id_column: Any,
+    conditions: list[Any],
+    params: dict[str, Any],
+) -> None:
+    """Seek past `after` for lists ordered by `sort_column DESC NULLS LAST, id DESC`."""
+    if after is None:
+        return
+    after_sort, after_id = after
+    params["after_id"] = after_id
+    if after_sort is not None:
+        params["after_sort"] = after_sort
+    conditions.append(_keyset_condition(sort_column, id_column, after_sort is None))
+
+
+def _filtered_statements(
+    *,
+    statement_key: Hashable,
+    list_stmt: Any,
+    count_stmt: Any,
+    conditions: list[Any],
+    params: dict[str, Any],
+    row_total_key: str | None,
+    count_mode: CountMode,
+) -> tuple[Any, Any]:
+    # 필터 helper마다 고유한 parameter 이름을 bind하므로, bind된 이름만으로 WHERE 형태가 결정됩니다.
+    exact = count_mode == "exact"
+    cache_key = (statement_key, frozenset(params), exact)
+    cached = _FILTERED_LIST_STATEMENTS.get(cache_key)
+    if cached is not None:
+        return cached
+    for condition in conditions:
+        list_stmt = list_stmt.where(condition)
+        count_stmt = count_stmt.where(condition)
+    if not exact:
+        list_stmt = _without_row_total(list_stmt, row_total_key)
+    _FILTERED_LIST_STATEMENTS[cache_key] = (list_stmt, count_stmt)
+    return list_stmt, count_stmt
+
+
 def execute_filtered_paginated_query(
     *,
     list_stmt: Any,
@@ -192,10 +479,24 @@ def execute_filtered_paginated_query(
     size: int,
     connection_provider: ConnectionProvider,
     row_total_key: str | None = None,
+    count_mode: CountMode = "exact",
+    estimate_table: str | None = None,
+    statement_key: Hashable | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    for condition in conditions:
-        list_stmt = list_stmt.where(condition)
-        count_stmt = count_stmt.where(condition)
+    if statement_key is not None:
+        list_stmt, count_stmt = _filtered_statements(
+            statement_key=statement_key,
+            list_stmt=list_stmt,
+            count_stmt=count_stmt,
+            conditions=conditions,
+            params=params,
+            row_total_key=row_total_key,
+            count_mode=count_mode,
+        )
+    else:
+        for condition in conditions:
+            list_stmt = list_stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
     return execute_paginated_query(
         list_stmt=list_stmt,
         count_stmt=count_stmt,
@@ -204,4 +505,7 @@ def execute_filtered_paginated_query(
         size=size,
         connection_provider=connection_provider,
         row_total_key=row_total_key,
+        count_mode=count_mode,
+        # 테이블 전체에 대한 planner 추정치는 필터가 없는 목록에만 해당합니다.
+        estimate_table=None if conditions else estimate_table,
     )
@@ -2,18 +2,25 @@ from __future__ import annotations
 
 from typing import Any, cast as typing_cast
 
-from sqlalchemy import bindparam, column, func, select, table, text
+from sqlalchemy import column, func, select, table, text
 
-from app.ports.dto import MinutesRecordDTO, MinutesUpsertDTO
+from app.ports.dto import KeysetCursor, MinutesRecordDTO, MinutesUpsertDTO
 from app.repositories.common import (
+    PAGE_LIMIT_PARAM,
+    PAGE_OFFSET_PARAM,
+    ROW_TOTAL_KEY,
+    CountMode,
+    add_keyset_after_filter,
     add_date_from_filter,
     add_date_to_filter_inclusive,
-    add_split_search_filter,
+    add_indexed_search_filter,
     add_truthy_equals_filter,
     dedupe_rows_by_key,
+    project_payload_rows,
     execute_filtered_paginated_query,
-    to_json_recordset,
+    execute_payload_upsert,
 )
+from app.repositories.search import build_search_document_sql
 from app.repositories.session_provider import ConnectionProvider, open_connection_scope
 
 COUNCIL_MINUTES = table(
@@ -35,6 +42,56 @@ COUNCIL_MINUTES = table(
 )
 
 
+_UPSERT_COLUMNS = (
+    ("council", "text"),
+    ("committee", "text"),
+    ("session", "text"),
+    ("meeting_no", "integer"),
+    ("meeting_no_combined", "text"),
+    ("url", "text"),
+    ("meeting_date", "date"),
+    ("content", "text"),
+    ("tag", "jsonb"),
+    ("attendee", "jsonb"),
+    ("agenda", "jsonb"),
+)
+
+_PAYLOAD_FIELDS = tuple(name for name, _ in _UPSERT_COLUMNS)
+
+_UPSERT_SQL = """
+    WITH upserted AS (
+        INSERT INTO council_minutes
+          (council, committee, "session", meeting_no, meeting_no_combined, url, meeting_date, content, tag, attendee, agenda)
+        SELECT
+          council,
+          committee,
+          session,
+          meeting_no,
+          meeting_no_combined,
+          url,
+          meeting_date,
+          content,
+          tag,
+          attendee,
+          agenda
+        FROM {payload_source}
+        ON CONFLICT (url) DO UPDATE SET
+          council = EXCLUDED.council,
+          committee = EXCLUDED.committee,
+          "session" = EXCLUDED."session",
+          meeting_no = EXCLUDED.meeting_no,
+          meeting_no_combined = EXCLUDED.meeting_no_combined,
+          meeting_date = EXCLUDED.meeting_date,
+          content = EXCLUDED.content,
+          tag = EXCLUDED.tag,
+          attendee = EXCLUDED.attendee,
+          agenda = EXCLUDED.agenda,
+          updated_at = CURRENT_TIMESTAMP
+        RETURNING (xmax = 0) AS inserted
+    )
+"""
+
+
 def upsert_minutes(
     items: list[MinutesUpsertDTO],
     *,
@@ -43,84 +100,61 @@ def upsert_minutes(
     if not items:
         return 0, 0
 
-    payload_rows = [
-        {
-            "council": minute.get("council"),
-            "committee": minute.get("committee"),
-            "session": minute.get("session"),
-            "meeting_no": minute.get("meeting_no"),
-            "meeting_no_combined": minute.get("meeting_no_combined"),
-            "url": minute.get("url"),
-            "meeting_date": minute.get("meeting_date"),
-            "content": minute.get("content"),
-            "tag": minute.get("tag"),
-            "attendee": minute.get("attendee"),
-            "agenda": minute.get("agenda"),
-        }
-        for minute in items
-    ]
+    payload_rows = project_payload_rows(items, _PAYLOAD_FIELDS)
     payload_rows = dedupe_rows_by_key(payload_rows, key="url")
 
-    sql = text(
-        """
-        WITH payload AS (
-            SELECT *
-            FROM jsonb_to_recordset(CAST(:items AS jsonb))
-              AS p(
-                council text,
-                committee text,
-                session text,
-                meeting_no integer,
-                meeting_no_combined text,
-                url text,
-                meeting_date date,
-                content text,
-                tag jsonb,
-                attendee jsonb,
-                agenda jsonb
-              )
-        ),
-        upserted AS (
-            INSERT INTO council_minutes
-              (council, committee, "session", meeting_no, meeting_no_combined, url, meeting_date, content, tag, attendee, agenda)
-            SELECT
-              council,
-              committee,
-              session,
-              meeting_no,
-              meeting_no_combined,
-              url,
-              meeting_date,
-              content,
-              tag,
-              attendee,
-              agenda
-            FROM payload
-            ON CONFLICT (url) DO UPDATE SET
-              council = EXCLUDED.council,
-              committee = EXCLUDED.committee,
-              "session" = EXCLUDED."session",
-              meeting_no = EXCLUDED.meeting_no,
-              meeting_no_combined = EXCLUDED.meeting_no_combined,
-              meeting_date = EXCLUDED.meeting_date,
-              content = EXCLUDED.content,
-              tag = EXCLUDED.tag,
-              attendee = EXCLUDED.attendee,
-              agenda = EXCLUDED.agenda,
-              updated_at = CURRENT_TIMESTAMP
-            RETURNING (xmax = 0) AS inserted
+    with open_connection_scope(connection_provider) as conn:
+        return execute_payload_upsert(
+            conn,
+            _UPSERT_SQL,
+            columns=_UPSERT_COLUMNS,
+            rows=payload_rows,
+            stage_table="minutes_upsert_stage",
         )
-        SELECT
-          COALESCE(SUM(CASE WHEN inserted THEN 1 ELSE 0 END), 0) AS inserted,
-          COALESCE(SUM(CASE WHEN NOT inserted THEN 1 ELSE 0 END), 0) AS updated
-        FROM upserted
-        """
+
+
+# Searched columns, in the order of the `*_search_trgm` / `*_search_fts` index expressions.
+_SEARCH_DOCUMENT_SQL = build_search_document_sql(
+    "council",
+    "committee",
+    '"session"',
+    "content",
+    "agenda::text",
+)
+
+_LIST_STMT = (
+    select(
+        COUNCIL_MINUTES.c.id,
+        COUNCIL_MINUTES.c.council,
+        COUNCIL_MINUTES.c.committee,
+        COUNCIL_MINUTES.c["session"],
+        COUNCIL_MINUTES.c.meeting_no_combined.label("meeting_no"),
+        COUNCIL_MINUTES.c.url,
+        COUNCIL_MINUTES.c.meeting_date,
+        COUNCIL_MINUTES.c.tag,
+        COUNCIL_MINUTES.c.attendee,
+        COUNCIL_MINUTES.c.agenda,
+        COUNCIL_MINUTES.c.created_at,
+        COUNCIL_MINUTES.c.updated_at,
+        func.count().over().label(ROW_TOTAL_KEY),
+    )
+    .order_by(
+        COUNCIL_MINUTES.c.meeting_date.desc().nullslast(),
+        COUNCIL_MINUTES.c.id.desc(),
     )
+    .limit(PAGE_LIMIT_PARAM)
+    .offset(PAGE_OFFSET_PARAM)
+)
 
-    with open_connection_scope(connection_provider) as conn:
-        row = conn.execute(sql, {"items": to_json_recordset(payload_rows)}).mappings().first() or {}
+_COUNT_STMT = select(func.count().label("total")).select_from(COUNCIL_MINUTES)
 
-    return int(row.get("inserted") or 0), int(row.get("updated") or 0)
+# (bind name, column) for the truthy-equals filters, resolved once instead of per request.
+_EQUALS_FILTER_COLUMNS = (
+    ("council", COUNCIL_MINUTES.c.council),
+    ("committee", COUNCIL_MINUTES.c.committee),
+    ("session", COUNCIL_MINUTES.c["session"]),
+    ("meeting_no", COUNCIL_MINUTES.c.meeting_no_combined),
+)
 
 
 def list_minutes(
@@ -135,28 +169,22 @@ def list_minutes(
     page: int,
     size: int,
     connection_provider: ConnectionProvider,
+    after: KeysetCursor | None = None,
+    count_mode: CountMode = "exact",
 ) -> tuple[list[MinutesRecordDTO], int]:
     conditions: list[Any] = []
     params: dict[str, Any] = {}
 
-    add_split_search_filter(
+    add_indexed_search_filter(
         query=q,
-        columns=[
-            COUNCIL_MINUTES.c.council,
-            COUNCIL_MINUTES.c.committee,
-            COUNCIL_MINUTES.c["session"],
-            COUNCIL_MINUTES.c.content,
-            COUNCIL_MINUTES.c.agenda,
-        ],
+        document_sql=_SEARCH_DOCUMENT_SQL,
         conditions=conditions,
         params=params,
     )
 
-    for param_name, column_expr, value in (
-        ("council", COUNCIL_MINUTES.c.council, council),
-        ("committee", COUNCIL_MINUTES.c.committee, committee),
-        ("session", COUNCIL_MINUTES.c["session"], session),
-        ("meeting_no", COUNCIL_MINUTES.c.meeting_no_combined, meeting_no),
+    for (param_name, column_expr), value in zip(
+        _EQUALS_FILTER_COLUMNS,
+        (council, committee, session, meeting_no),
     ):
         add_truthy_equals_filter(
             value=value,
@@ -181,41 +209,27 @@ def list_minutes(
         params=params,
     )
 
-    list_stmt = (
-        select(
-            COUNCIL_MINUTES.c.id,
-            COUNCIL_MINUTES.c.council,
-            COUNCIL_MINUTES.c.committee,
-            COUNCIL_MINUTES.c["session"],
-            COUNCIL_MINUTES.c.meeting_no_combined.label("meeting_no"),
-            COUNCIL_MINUTES.c.url,
-            COUNCIL_MINUTES.c.meeting_date,
-            COUNCIL_MINUTES.c.tag,
-            COUNCIL_MINUTES.c.attendee,
-            COUNCIL_MINUTES.c.agenda,
-            COUNCIL_MINUTES.c.created_at,
-            COUNCIL_MINUTES.c.updated_at,
-            func.count().over().label("__total_count"),
-        )
-        .order_by(
-            COUNCIL_MINUTES.c.meeting_date.desc().nullslast(),
-            COUNCIL_MINUTES.c.id.desc(),
-        )
-        .limit(bindparam("limit"))
-        .offset(bindparam("offset"))
+    add_keyset_after_filter(
+        after=after,
+        sort_column=COUNCIL_MINUTES.c.meeting_date,
+        id_column=COUNCIL_MINUTES.c.id,
+        conditions=conditions,
+        params=params,
     )
 
-    count_stmt = select(func.count().label("total")).select_from(COUNCIL_MINUTES)
-
     rows, total = execute_filtered_paginated_query(
-        list_stmt=list_stmt,
-        count_stmt=count_stmt,
+        list_stmt=_LIST_STMT,
+        count_stmt=_COUNT_STMT,
         conditions=conditions,
         params=params,
-        page=page,
+        # A keyset position replaces OFFSET; the total then counts the rows after it.
+        page=1 if after is not None else page,
         size=size,
         connection_provider=connection_provider,
-        row_total_key="__total_count",
+        row_total_key=ROW_TOTAL_KEY,
+        count_mode=count_mode,
+        estimate_table=COUNCIL_MINUTES.name,
+        statement_key=COUNCIL_MINUTES.name,
     )
     return typing_cast(list[MinutesRecordDTO], rows), total
 
@@ -240,6 +254,28 @@ def get_minutes(
     return typing_cast(MinutesRecordDTO, dict(row)) if row else None
 
 
+def get_minutes_by_ids(
+    item_ids: list[int],
+    *,
+    connection_provider: ConnectionProvider,
+) -> dict[int, MinutesRecordDTO]:
+    if not item_ids:
+        return {}
+    sql = text(
+        """
+        SELECT id, council, committee, "session", meeting_no_combined AS meeting_no,
+               url, meeting_date, content, tag, attendee, agenda, created_at, updated_at
+        FROM council_minutes
+        WHERE id = ANY(:ids)
+        """
+    )
+
+    with open_connection_scope(connection_provider) as conn:
+        rows = conn.execute(sql, {"ids": list(item_ids)}).mappings().all()
+
+    return {int(row["id"]): typing_cast(MinutesRecordDTO, dict(row)) for row in rows}
+
+
 def delete_minutes(
     item_id: int,
     *,
@@ -251,6 +287,22 @@ def delete_minutes(
     return result.rowcount > 0
 
 
+def delete_minutes_by_ids(
+    item_ids: list[int],
+    *,
+    connection_provider: ConnectionProvider,
+) -> list[int]:
+    if not item_ids:
+        return []
+    with open_connection_scope(connection_provider) as conn:
+        rows = conn.execute(
+            text("DELETE FROM council_minutes WHERE id = ANY(:ids) RETURNING id"),
+            {"ids": list(item_ids)},
+        ).mappings().all()
+
+    return [int(row["id"]) for row in rows]
+
+
 class MinutesRepository:
     def __init__(self, *, connection_provider: ConnectionProvider) -> None:
         self._connection_provider = connection_provider
@@ -270,6 +322,8 @@ class MinutesRepository:
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[MinutesRecordDTO], int]:
         return list_minutes(
             q=q,
@@ -281,11 +335,19 @@ class MinutesRepository:
             date_to=date_to,
             page=page,
             size=size,
+            after=after,
+            count_mode=count_mode,
             connection_provider=self._connection_provider,
         )
 
     def get_minutes(self, item_id: int) -> MinutesRecordDTO | None:
         return get_minutes(item_id, connection_provider=self._connection_provider)
 
+    def get_minutes_by_ids(self, item_ids: list[int]) -> dict[int, MinutesRecordDTO]:
+        return get_minutes_by_ids(item_ids, connection_provider=self._connection_provider)
+
     def delete_minutes(self, item_id: int) -> bool:
         return delete_minutes(item_id, connection_provider=self._connection_provider)
+
+    def delete_minutes_by_ids(self, item_ids: list[int]) -> list[int]:
+        return delete_minutes_by_ids(item_ids, connection_provider=self._connection_provider)
@@ -2,18 +2,25 @@ from __future__ import annotations
 
 from typing import Any, cast as typing_cast
 
-from sqlalchemy import bindparam, column, func, select, table, text
+from sqlalchemy import column, func, select, table, text
 
-from app.ports.dto import NewsArticleRecordDTO, NewsArticleUpsertDTO
+from app.ports.dto import KeysetCursor, NewsArticleRecordDTO, NewsArticleUpsertDTO
 from app.repositories.common import (
+    PAGE_LIMIT_PARAM,
+    PAGE_OFFSET_PARAM,
+    ROW_TOTAL_KEY,
+    CountMode,
+    add_keyset_after_filter,
     add_date_from_filter,
     add_date_to_filter_next_day_exclusive,
-    add_split_search_filter,
+    add_indexed_search_filter,
     add_truthy_equals_filter,
     dedupe_rows_by_key,
+    project_payload_rows,
     execute_filtered_paginated_query,
-    to_json_recordset,
+    execute_payload_upsert,
 )
+from app.repositories.search import build_search_document_sql
 from app.repositories.session_provider import ConnectionProvider, open_connection_scope
 
 NEWS_ARTICLES = table(
@@ -32,6 +39,40 @@ NEWS_ARTICLES = table(
 )
 
 
+_UPSERT_COLUMNS = (
+    ("source", "text"),
+    ("title", "text"),
+    ("url", "text"),
+    ("published_at", "timestamptz"),
+    ("author", "text"),
+    ("summary", "text"),
+    ("content", "text"),
+    ("keywords", "jsonb"),
+)
+
+_PAYLOAD_FIELDS = tuple(name for name, _ in _UPSERT_COLUMNS)
+
+_UPSERT_SQL = """
+    WITH upserted AS (
+        INSERT INTO news_articles
+          (source, title, url, published_at, author, summary, content, keywords)
+        SELECT
+          source, title, url, published_at, author, summary, content, keywords
+        FROM {payload_source}
+        ON CONFLICT (url) DO UPDATE SET
+          source = EXCLUDED.source,
+          title = EXCLUDED.title,
+          published_at = EXCLUDED.published_at,
+          author = EXCLUDED.author,
+          summary = EXCLUDED.summary,
+          content = EXCLUDED.content,
+          keywords = EXCLUDED.keywords,
+          updated_at = CURRENT_TIMESTAMP
+        RETURNING (xmax = 0) AS inserted
+    )
+"""
+
+
 def upsert_articles(
     articles: list[NewsArticleUpsertDTO],
     *,
@@ -40,65 +81,49 @@ def upsert_articles(
     if not articles:
         return 0, 0
 
-    payload_rows = [
-        {
-            "source": article.get("source"),
-            "title": article.get("title"),
-            "url": article.get("url"),
-            "published_at": article.get("published_at"),
-            "author": article.get("author"),
-            "summary": article.get("summary"),
-            "content": article.get("content"),
-            "keywords": article.get("keywords"),
-        }
-        for article in articles
-    ]
+    payload_rows = project_payload_rows(articles, _PAYLOAD_FIELDS)
     payload_rows = dedupe_rows_by_key(payload_rows, key="url")
 
-    sql = text(
-        """
-        WITH payload AS (
-            SELECT *
-            FROM jsonb_to_recordset(CAST(:items AS jsonb))
-              AS p(
-                source text,
-                title text,
-                url text,
-                published_at timestamptz,
-                author text,
-                summary text,
-                content text,
-                keywords jsonb
-              )
-        ),
-        upserted AS (
-            INSERT INTO news_articles
-              (source, title, url, published_at, author, summary, content, keywords)
-            SELECT
-              source, title, url, published_at, author, summary, content, keywords
-            FROM payload
-            ON CONFLICT (url) DO UPDATE SET
-              source = EXCLUDED.source,
-              title = EXCLUDED.title,
-              published_at = EXCLUDED.published_at,
-              author = EXCLUDED.author,
-              summary = EXCLUDED.summary,
-              content = EXCLUDED.content,
-              keywords = EXCLUDED.keywords,
-              updated_at = CURRENT_TIMESTAMP
-            RETURNING (xmax = 0) AS inserted
+    with open_connection_scope(connection_provider) as conn:
+        return execute_payload_upsert(
+            conn,
+            _UPSERT_SQL,
+            columns=_UPSERT_COLUMNS,
+            rows=payload_rows,
+            stage_table="news_upsert_stage",
         )
-        SELECT
-          COALESCE(SUM(CASE WHEN inserted THEN 1 ELSE 0 END), 0) AS inserted,
-          COALESCE(SUM(CASE WHEN NOT inserted THEN 1 ELSE 0 END), 0) AS updated
-        FROM upserted
-        """
-    )
 
-    with open_connection_scope(connection_provider) as conn:
-        row = conn.execute(sql, {"items": to_json_recordset(payload_rows)}).mappings().first() or {}
 
-    return int(row.get("inserted") or 0), int(row.get("updated") or 0)
+# Searched columns, in the order of the `*_search_trgm` / `*_search_fts` index expressions.
+_SEARCH_DOCUMENT_SQL = build_search_document_sql(
+    "title",
+    "summary",
+    "content",
+)
+
+_LIST_STMT = (
+    select(
+        NEWS_ARTICLES.c.id,
+        NEWS_ARTICLES.c.source,
+        NEWS_ARTICLES.c.title,
+        NEWS_ARTICLES.c.url,
+        NEWS_ARTICLES.c.published_at,
+        NEWS_ARTICLES.c.author,
+        NEWS_ARTICLES.c.summary,
+        NEWS_ARTICLES.c.keywords,
+        NEWS_ARTICLES.c.created_at,
+        NEWS_ARTICLES.c.updated_at,
+        func.count().over().label(ROW_TOTAL_KEY),
+    )
+    .order_by(
+        NEWS_ARTICLES.c.published_at.desc().nullslast(),
+        NEWS_ARTICLES.c.id.desc(),
+    )
+    .limit(PAGE_LIMIT_PARAM)
+    .offset(PAGE_OFFSET_PARAM)
+)
+
+_COUNT_STMT = select(func.count().label("total")).select_from(NEWS_ARTICLES)
 
 
 def list_articles(
@@ -110,17 +135,15 @@ def list_articles(
     page: int,
     size: int,
     connection_provider: ConnectionProvider,
+    after: KeysetCursor | None = None,
+    count_mode: CountMode = "exact",
 ) -> tuple[list[NewsArticleRecordDTO], int]:
     conditions: list[Any] = []
     params: dict[str, Any] = {}
 
-    add_split_search_filter(
+    add_indexed_search_filter(
         query=q,
-        columns=[
-            NEWS_ARTICLES.c.title,
-            NEWS_ARTICLES.c.summary,
-            NEWS_ARTICLES.c.content,
-        ],
+        document_sql=_SEARCH_DOCUMENT_SQL,
         conditions=conditions,
         params=params,
     )
@@ -147,39 +170,27 @@ def list_articles(
         params=params,
     )
 
-    list_stmt = (
-        select(
-            NEWS_ARTICLES.c.id,
-            NEWS_ARTICLES.c.source,
-            NEWS_ARTICLES.c.title,
-            NEWS_ARTICLES.c.url,
-            NEWS_ARTICLES.c.published_at,
-            NEWS_ARTICLES.c.author,
-            NEWS_ARTICLES.c.summary,
-            NEWS_ARTICLES.c.keywords,
-            NEWS_ARTICLES.c.created_at,
-            NEWS_ARTICLES.c.updated_at,
-            func.count().over().label("__total_count"),
-        )
-        .order_by(
-            NEWS_ARTICLES.c.published_at.desc().nullslast(),
-            NEWS_ARTICLES.c.id.desc(),
-        )
-        .limit(bindparam("limit"))
-        .offset(bindparam("offset"))
+    add_keyset_after_filter(
+        after=after,
+        sort_column=NEWS_ARTICLES.c.published_at,
+        id_column=NEWS_ARTICLES.c.id,
+        conditions=conditions,
+        params=params,
     )
 
-    count_stmt = select(func.count().label("total")).select_from(NEWS_ARTICLES)
-
     rows, total = execute_filtered_paginated_query(
-        list_stmt=list_stmt,
-        count_stmt=count_stmt,
+        list_stmt=_LIST_STMT,
+        count_stmt=_COUNT_STMT,
         conditions=conditions,
         params=params,
-        page=page,
+        # A keyset position replaces OFFSET; the total then counts the rows after it.
+        page=1 if after is not None else page,
         size=size,
         connection_provider=connection_provider,
-        row_total_key="__total_count",
+        row_total_key=ROW_TOTAL_KEY,
+        count_mode=count_mode,
+        estimate_table=NEWS_ARTICLES.name,
+        statement_key=NEWS_ARTICLES.name,
     )
     return typing_cast(list[NewsArticleRecordDTO], rows), total
 
@@ -200,6 +211,24 @@ def get_article(
     return typing_cast(NewsArticleRecordDTO, dict(row)) if row else None
 
 
+def get_articles_by_ids(
+    item_ids: list[int],
+    *,
+    connection_provider: ConnectionProvider,
+) -> dict[int, NewsArticleRecordDTO]:
+    if not item_ids:
+        return {}
+    sql = text(
+        "SELECT id, source, title, url, published_at, author, summary, content, keywords, created_at, updated_at "
+        "FROM news_articles WHERE id = ANY(:ids)"
+    )
+
+    with open_connection_scope(connection_provider) as conn:
+        rows = conn.execute(sql, {"ids": list(item_ids)}).mappings().all()
+
+    return {int(row["id"]): typing_cast(NewsArticleRecordDTO, dict(row)) for row in rows}
+
+
 def delete_article(
     item_id: int,
     *,
@@ -211,6 +240,22 @@ def delete_article(
     return result.rowcount > 0
 
 
+def delete_articles_by_ids(
+    item_ids: list[int],
+    *,
+    connection_provider: ConnectionProvider,
+) -> list[int]:
+    if not item_ids:
+        return []
+    with open_connection_scope(connection_provider) as conn:
+        rows = conn.execute(
+            text("DELETE FROM news_articles WHERE id = ANY(:ids) RETURNING id"),
+            {"ids": list(item_ids)},
+        ).mappings().all()
+
+    return [int(row["id"]) for row in rows]
+
+
 class NewsRepository:
     def __init__(self, *, connection_provider: ConnectionProvider) -> None:
         self._connection_provider = connection_provider
@@ -227,6 +272,8 @@ class NewsRepository:
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[NewsArticleRecordDTO], int]:
         return list_articles(
             q=q,
@@ -235,11 +282,19 @@ class NewsRepository:
             date_to=date_to,
             page=page,
             size=size,
+            after=after,
+            count_mode=count_mode,
             connection_provider=self._connection_provider,
         )
 
     def get_article(self, item_id: int) -> NewsArticleRecordDTO | None:
         return get_article(item_id, connection_provider=self._connection_provider)
 
+    def get_articles_by_ids(self, item_ids: list[int]) -> dict[int, NewsArticleRecordDTO]:
+        return get_articles_by_ids(item_ids, connection_provider=self._connection_provider)
+
     def delete_article(self, item_id: int) -> bool:
         return delete_article(item_id, connection_provider=self._connection_provider)
+
+    def delete_articles_by_ids(self, item_ids: list[int]) -> list[int]:
+        return delete_articles_by_ids(item_ids, connection_provider=self._connection_provider)
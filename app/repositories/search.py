@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import Text, bindparam, cast, func, literal, or_
+from sqlalchemy import Text, bindparam, cast, func, literal, literal_column, or_
 
 
 def _coalesce_text(column_expr: Any) -> Any:
@@ -19,18 +22,46 @@ def build_search_document(*, columns: list[Any]) -> Any:
     return document
 
 
-def build_split_search_condition(*, columns: list[Any]) -> Any:
+def build_split_search_condition(*, columns: list[Any], fts: bool = True) -> Any:
     search_document = build_search_document(columns=columns)
     trigram_match = search_document.ilike(bindparam("q"))
+    if not fts:
+        return trigram_match
     fts_match = func.to_tsvector("simple", search_document).op("@@")(
         func.websearch_to_tsquery("simple", bindparam("q_fts"))
     )
     return or_(trigram_match, fts_match)
 
 
-def build_split_search_params(query: str) -> dict[str, str]:
-    normalized = (query or "").strip()
-    return {
-        "q": f"%{normalized}%",
-        "q_fts": normalized,
-    }
+def build_search_document_sql(*expressions: str) -> str:
+    # Must render exactly like the `*_search_trgm` / `*_search_fts` index expressions so the planner can match them.
+    return " || ' ' || ".join(f"COALESCE({expression}, '')" for expression in expressions)
+
+
+@lru_cache(maxsize=64)
+def build_indexed_search_condition(*, document_sql: str, fts: bool = True) -> Any:
+    search_document = literal_column(f"({document_sql})", type_=Text)
+    trigram_match = search_document.ilike(bindparam("q"))
+    if not fts:
+        return trigram_match
+    fts_match = func.to_tsvector(literal_column("'simple'"), search_document).op("@@")(
+        func.websearch_to_tsquery(literal_column("'simple'"), bindparam("q_fts"))
+    )
+    return or_(trigram_match, fts_match)
+
+
+SEARCH_PARAMS_CACHE_MAX_SIZE = 4096
+
+
+@lru_cache(maxsize=SEARCH_PARAMS_CACHE_MAX_SIZE)
+def _split_search_params(normalized: str) -> Mapping[str, str]:
+    if normalized.isalnum():
+        # A single plain token only matches FTS where it also appears as a substring, so the
+        # trigram branch alone returns the same rows without a second GIN scan and BitmapOr.
+        return MappingProxyType({"q": f"%{normalized}%"})
+    return MappingProxyType({"q": f"%{normalized}%", "q_fts": normalized})
+
+
+def build_split_search_params(query: str) -> Mapping[str, str]:
+    # Paging through one search repeats the same term; the read-only mapping is shared across requests.
+    return _split_search_params((query or "").strip())
@@ -2,19 +2,27 @@ from __future__ import annotations
 
 from typing import Any, cast as typing_cast
 
-from sqlalchemy import bindparam, column, func, select, table, text
+from sqlalchemy import column, func, select, table, text
 
-from app.ports.dto import SegmentRecordDTO, SegmentUpsertDTO
+from app.ports.dto import KeysetCursor, SegmentRecordDTO, SegmentUpsertDTO
 from app.repositories.common import (
+    PAGE_LIMIT_PARAM,
+    PAGE_OFFSET_PARAM,
+    ROW_TOTAL_KEY,
+    CountMode,
     add_date_from_filter,
     add_date_to_filter_inclusive,
     add_not_none_equals_filter,
-    add_split_search_filter,
+    add_indexed_search_filter,
+    add_keyset_after_filter,
     add_truthy_equals_filter,
+    build_payload_source,
     execute_filtered_paginated_query,
     dedupe_rows_by_key,
-    to_json_recordset,
+    payload_statement,
+    project_payload_rows,
 )
+from app.repositories.search import build_search_document_sql
 from app.repositories.session_provider import ConnectionProvider, open_connection_scope
 
 COUNCIL_SPEECH_SEGMENTS = table(
@@ -43,6 +51,73 @@ COUNCIL_SPEECH_SEGMENTS = table(
 )
 
 
+_INSERT_COLUMNS = (
+    ("council", "text"),
+    ("committee", "text"),
+    ("session", "text"),
+    ("meeting_no", "integer"),
+    ("meeting_no_combined", "text"),
+    ("meeting_date", "date"),
+    ("content", "text"),
+    ("summary", "text"),
+    ("subject", "text"),
+    ("tag", "jsonb"),
+    ("importance", "integer"),
+    ("moderator", "jsonb"),
+    ("questioner", "jsonb"),
+    ("answerer", "jsonb"),
+    ("party", "text"),
+    ("constituency", "text"),
+    ("department", "text"),
+    ("dedupe_hash", "text"),
+    ("dedupe_hash_legacy", "text"),
+)
+
+_PAYLOAD_FIELDS = tuple(name for name, _ in _INSERT_COLUMNS)
+
+_INSERT_SQL = """
+    WITH inserted_rows AS (
+        INSERT INTO council_speech_segments
+          (council, committee, "session", meeting_no, meeting_no_combined, meeting_date,
+           content, summary, subject, tag, importance, moderator, questioner, answerer,
+           party, constituency, department, dedupe_hash)
+        SELECT
+          council,
+          committee,
+          session,
+          meeting_no,
+          meeting_no_combined,
+          meeting_date,
+          content,
+          summary,
+          subject,
+          tag,
+          importance,
+          moderator,
+          questioner,
+          answerer,
+          party,
+          constituency,
+          department,
+          dedupe_hash
+        FROM {payload_source}
+        WHERE NOT EXISTS (
+          SELECT 1
+          FROM council_speech_segments s
+          WHERE s.dedupe_hash = p.dedupe_hash
+             OR (
+               p.dedupe_hash_legacy IS NOT NULL
+               AND s.dedupe_hash = p.dedupe_hash_legacy
+             )
+        )
+        ON CONFLICT (dedupe_hash) DO NOTHING
+        RETURNING 1
+    )
+    SELECT COUNT(*) AS inserted
+    FROM inserted_rows
+"""
+
+
 def insert_segments(
     items: list[SegmentUpsertDTO],
     *,
@@ -51,108 +126,80 @@ def insert_segments(
     if not items:
         return 0
 
-    payload_rows = [
-        {
-            "council": segment.get("council"),
-            "committee": segment.get("committee"),
-            "session": segment.get("session"),
-            "meeting_no": segment.get("meeting_no"),
-            "meeting_no_combined": segment.get("meeting_no_combined"),
-            "meeting_date": segment.get("meeting_date"),
-            "content": segment.get("content"),
-            "summary": segment.get("summary"),
-            "subject": segment.get("subject"),
-            "tag": segment.get("tag"),
-            "importance": segment.get("importance"),
-            "moderator": segment.get("moderator"),
-            "questioner": segment.get("questioner"),
-            "answerer": segment.get("answerer"),
-            "party": segment.get("party"),
-            "constituency": segment.get("constituency"),
-            "department": segment.get("department"),
-            "dedupe_hash": segment.get("dedupe_hash"),
-            "dedupe_hash_legacy": segment.get("dedupe_hash_legacy"),
-        }
-        for segment in items
-    ]
+    payload_rows = project_payload_rows(items, _PAYLOAD_FIELDS)
     if any(segment.get("dedupe_hash") is not None for segment in payload_rows):
         payload_rows = dedupe_rows_by_key(payload_rows, key="dedupe_hash")
 
-    sql = text(
-        """
-        WITH payload AS (
-            SELECT *
-            FROM jsonb_to_recordset(CAST(:items AS jsonb))
-              AS p(
-                council text,
-                committee text,
-                session text,
-                meeting_no integer,
-                meeting_no_combined text,
-                meeting_date date,
-                content text,
-                summary text,
-                subject text,
-                tag jsonb,
-                importance integer,
-                moderator jsonb,
-                questioner jsonb,
-                answerer jsonb,
-                party text,
-                constituency text,
-                department text,
-                dedupe_hash text,
-                dedupe_hash_legacy text
-              )
-        ),
-        inserted_rows AS (
-            INSERT INTO council_speech_segments
-              (council, committee, "session", meeting_no, meeting_no_combined, meeting_date,
-               content, summary, subject, tag, importance, moderator, questioner, answerer,
-               party, constituency, department, dedupe_hash)
-            SELECT
-              council,
-              committee,
-              session,
-              meeting_no,
-              meeting_no_combined,
-              meeting_date,
-              content,
-              summary,
-              subject,
-              tag,
-              importance,
-              moderator,
-              questioner,
-              answerer,
-              party,
-              constituency,
-              department,
-              dedupe_hash
-            FROM payload p
-            WHERE NOT EXISTS (
-              SELECT 1
-              FROM council_speech_segments s
-              WHERE s.dedupe_hash = p.dedupe_hash
-                 OR (
-                   p.dedupe_hash_legacy IS NOT NULL
-                   AND s.dedupe_hash = p.dedupe_hash_legacy
-                 )
-            )
-            ON CONFLICT (dedupe_hash) DO NOTHING
-            RETURNING 1
-        )
-        SELECT COUNT(*) AS inserted
-        FROM inserted_rows
-        """
-    )
-
     with open_connection_scope(connection_provider) as conn:
-        row = conn.execute(sql, {"items": to_json_recordset(payload_rows)}).mappings().first() or {}
+        payload_source, params = build_payload_source(
+            conn,
+            columns=_INSERT_COLUMNS,
+            rows=payload_rows,
+            stage_table="segments_insert_stage",
+        )
+        row = conn.execute(payload_statement(_INSERT_SQL, payload_source), params).mappings().first() or {}
 
     return int(row.get("inserted") or 0)
 
 
+# Searched columns, in the order of the `*_search_trgm` / `*_search_fts` index expressions.
+_SEARCH_DOCUMENT_SQL = build_search_document_sql(
+    "council",
+    "committee",
+    '"session"',
+    "content",
+    "summary",
+    "subject",
+    "party",
+    "constituency",
+    "department",
+    "tag::text",
+    "questioner::text",
+    "answerer::text",
+)
+
+_LIST_STMT = (
+    select(
+        COUNCIL_SPEECH_SEGMENTS.c.id,
+        COUNCIL_SPEECH_SEGMENTS.c.council,
+        COUNCIL_SPEECH_SEGMENTS.c.committee,
+        COUNCIL_SPEECH_SEGMENTS.c["session"],
+        COUNCIL_SPEECH_SEGMENTS.c.meeting_no_combined.label("meeting_no"),
+        COUNCIL_SPEECH_SEGMENTS.c.meeting_date,
+        COUNCIL_SPEECH_SEGMENTS.c.summary,
+        COUNCIL_SPEECH_SEGMENTS.c.subject,
+        COUNCIL_SPEECH_SEGMENTS.c.tag,
+        COUNCIL_SPEECH_SEGMENTS.c.importance,
+        COUNCIL_SPEECH_SEGMENTS.c.moderator,
+        COUNCIL_SPEECH_SEGMENTS.c.questioner,
+        COUNCIL_SPEECH_SEGMENTS.c.answerer,
+        COUNCIL_SPEECH_SEGMENTS.c.party,
+        COUNCIL_SPEECH_SEGMENTS.c.constituency,
+        COUNCIL_SPEECH_SEGMENTS.c.department,
+        func.count().over().label(ROW_TOTAL_KEY),
+    )
+    .order_by(
+        COUNCIL_SPEECH_SEGMENTS.c.meeting_date.desc().nullslast(),
+        COUNCIL_SPEECH_SEGMENTS.c.id.desc(),
+    )
+    .limit(PAGE_LIMIT_PARAM)
+    .offset(PAGE_OFFSET_PARAM)
+)
+
+_COUNT_STMT = select(func.count().label("total")).select_from(COUNCIL_SPEECH_SEGMENTS)
+
+# (bind name, column) for the truthy-equals filters, resolved once instead of per request.
+_EQUALS_FILTER_COLUMNS = (
+    ("council", COUNCIL_SPEECH_SEGMENTS.c.council),
+    ("committee", COUNCIL_SPEECH_SEGMENTS.c.committee),
+    ("session", COUNCIL_SPEECH_SEGMENTS.c["session"]),
+    ("meeting_no", COUNCIL_SPEECH_SEGMENTS.c.meeting_no_combined),
+    ("party", COUNCIL_SPEECH_SEGMENTS.c.party),
+    ("constituency", COUNCIL_SPEECH_SEGMENTS.c.constituency),
+    ("department", COUNCIL_SPEECH_SEGMENTS.c.department),
+)
+
+
 def list_segments(
     *,
     q: str | None,
@@ -169,38 +216,22 @@ def list_segments(
     page: int,
     size: int,
     connection_provider: ConnectionProvider,
+    after: KeysetCursor | None = None,
+    count_mode: CountMode = "exact",
 ) -> tuple[list[SegmentRecordDTO], int]:
     conditions: list[Any] = []
     params: dict[str, Any] = {}
 
-    add_split_search_filter(
+    add_indexed_search_filter(
         query=q,
-        columns=[
-            COUNCIL_SPEECH_SEGMENTS.c.council,
-            COUNCIL_SPEECH_SEGMENTS.c.committee,
-            COUNCIL_SPEECH_SEGMENTS.c["session"],
-            COUNCIL_SPEECH_SEGMENTS.c.content,
-            COUNCIL_SPEECH_SEGMENTS.c.summary,
-            COUNCIL_SPEECH_SEGMENTS.c.subject,
-            COUNCIL_SPEECH_SEGMENTS.c.party,
-            COUNCIL_SPEECH_SEGMENTS.c.constituency,
-            COUNCIL_SPEECH_SEGMENTS.c.department,
-            COUNCIL_SPEECH_SEGMENTS.c.tag,
-            COUNCIL_SPEECH_SEGMENTS.c.questioner,
-            COUNCIL_SPEECH_SEGMENTS.c.answerer,
-        ],
+        document_sql=_SEARCH_DOCUMENT_SQL,
         conditions=conditions,
         params=params,
     )
 
-    for param_name, column_expr, value in (
-        ("council", COUNCIL_SPEECH_SEGMENTS.c.council, council),
-        ("committee", COUNCIL_SPEECH_SEGMENTS.c.committee, committee),
-        ("session", COUNCIL_SPEECH_SEGMENTS.c["session"], session),
-        ("meeting_no", COUNCIL_SPEECH_SEGMENTS.c.meeting_no_combined, meeting_no),
-        ("party", COUNCIL_SPEECH_SEGMENTS.c.party, party),
-        ("constituency", COUNCIL_SPEECH_SEGMENTS.c.constituency, constituency),
-        ("department", COUNCIL_SPEECH_SEGMENTS.c.department, department),
+    for (param_name, column_expr), value in zip(
+        _EQUALS_FILTER_COLUMNS,
+        (council, committee, session, meeting_no, party, constituency, department),
     ):
         add_truthy_equals_filter(
             value=value,
@@ -233,45 +264,27 @@ def list_segments(
         params=params,
     )
 
-    list_stmt = (
-        select(
-            COUNCIL_SPEECH_SEGMENTS.c.id,
-            COUNCIL_SPEECH_SEGMENTS.c.council,
-            COUNCIL_SPEECH_SEGMENTS.c.committee,
-            COUNCIL_SPEECH_SEGMENTS.c["session"],
-            COUNCIL_SPEECH_SEGMENTS.c.meeting_no_combined.label("meeting_no"),
-            COUNCIL_SPEECH_SEGMENTS.c.meeting_date,
-            COUNCIL_SPEECH_SEGMENTS.c.summary,
-            COUNCIL_SPEECH_SEGMENTS.c.subject,
-            COUNCIL_SPEECH_SEGMENTS.c.tag,
-            COUNCIL_SPEECH_SEGMENTS.c.importance,
-            COUNCIL_SPEECH_SEGMENTS.c.moderator,
-            COUNCIL_SPEECH_SEGMENTS.c.questioner,
-            COUNCIL_SPEECH_SEGMENTS.c.answerer,
-            COUNCIL_SPEECH_SEGMENTS.c.party,
-            COUNCIL_SPEECH_SEGMENTS.c.constituency,
-            COUNCIL_SPEECH_SEGMENTS.c.department,
-            func.count().over().label("__total_count"),
-        )
-        .order_by(
-            COUNCIL_SPEECH_SEGMENTS.c.meeting_date.desc().nullslast(),
-            COUNCIL_SPEECH_SEGMENTS.c.id.desc(),
-        )
-        .limit(bindparam("limit"))
-        .offset(bindparam("offset"))
+    add_keyset_after_filter(
+        after=after,
+        sort_column=COUNCIL_SPEECH_SEGMENTS.c.meeting_date,
+        id_column=COUNCIL_SPEECH_SEGMENTS.c.id,
+        conditions=conditions,
+        params=params,
     )
 
-    count_stmt = select(func.count().label("total")).select_from(COUNCIL_SPEECH_SEGMENTS)
-
     rows, total = execute_filtered_paginated_query(
-        list_stmt=list_stmt,
-        count_stmt=count_stmt,
+        list_stmt=_LIST_STMT,
+        count_stmt=_COUNT_STMT,
         conditions=conditions,
         params=params,
-        page=page,
+        # A keyset position replaces OFFSET; the total then counts the rows after it.
+        page=1 if after is not None else page,
         size=size,
         connection_provider=connection_provider,
-        row_total_key="__total_count",
+        row_total_key=ROW_TOTAL_KEY,
+        count_mode=count_mode,
+        estimate_table=COUNCIL_SPEECH_SEGMENTS.name,
+        statement_key=COUNCIL_SPEECH_SEGMENTS.name,
     )
     return typing_cast(list[SegmentRecordDTO], rows), total
 
@@ -334,6 +347,8 @@ class SegmentsRepository:
         date_to: str | None,
         page: int,
         size: int,
+        after: KeysetCursor | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[SegmentRecordDTO], int]:
         return list_segments(
             q=q,
@@ -349,6 +364,8 @@ class SegmentsRepository:
             date_to=date_to,
             page=page,
             size=size,
+            after=after,
+            count_mode=count_mode,
             connection_provider=self._connection_provider,
         )
 
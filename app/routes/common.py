@@ -1,10 +1,13 @@
+from collections.abc import Mapping, Sequence
 from datetime import date
 from typing import Any, TypeVar
 
 from fastapi import Request
+from pydantic import BaseModel
 
 from app.errors import http_error
 from app.schemas import ErrorResponse
+from app.services.common import encode_list_cursor
 
 ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
     400: {"model": ErrorResponse},
@@ -32,6 +35,7 @@ def enforce_ingest_batch_limit(request: Request, batch_size: int) -> None:
 
 PayloadItemT = TypeVar("PayloadItemT")
 ResourceT = TypeVar("ResourceT")
+ListItemT = TypeVar("ListItemT", bound=BaseModel)
 
 
 def normalize_ingest_payload(
@@ -43,6 +47,12 @@ def normalize_ingest_payload(
     return payload_items
 
 
+def ingest_item_fields(item: BaseModel) -> dict[str, Any]:
+    # Ingest models hold only scalar/JSON fields and the normalizers only read them,
+    # so the validated field dict is used as-is instead of a model_dump() copy.
+    return item.__dict__
+
+
 def ensure_resource_found(resource: ResourceT | None) -> ResourceT:
     if resource is None:
         raise http_error(404, "NOT_FOUND", "Not Found")
@@ -58,3 +68,27 @@ def to_date_filter(value: date | None) -> str | None:
     if value is None:
         return None
     return value.isoformat()
+
+
+def next_list_cursor(
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    sort_key: str,
+    page: int,
+    size: int,
+    total: int,
+    cursor: str | None,
+) -> str | None:
+    # With a cursor the total counts the rows after it; otherwise it covers the whole list.
+    seen = len(rows) if cursor is not None else (page - 1) * size + len(rows)
+    if not rows or seen >= total:
+        return None
+    last_row = rows[-1]
+    return encode_list_cursor(last_row.get(sort_key), int(last_row["id"]))
+
+
+def construct_list_items(model: type[ListItemT], rows: Sequence[Mapping[str, Any]]) -> list[ListItemT]:
+    # Repository rows already carry DB-typed values, so list pages skip per-row validation
+    # (detail routes use model_construct the same way). FastAPI passes the constructed
+    # instances through the response model without revalidating them.
+    return [model.model_construct(**row) for row in rows]
@@ -2,12 +2,15 @@ from datetime import date
 
 from fastapi import APIRouter, Body, Depends, Query, Request
 
-from app.ports.dto import MinutesUpsertDTO
+from app.ports.dto import CountMode, MinutesUpsertDTO
 from app.ports.services import MinutesServicePort
 from app.routes.common import (
     ERROR_RESPONSES,
+    construct_list_items,
     ensure_delete_succeeded,
     ensure_resource_found,
+    ingest_item_fields,
+    next_list_cursor,
     normalize_ingest_payload,
     to_date_filter,
 )
@@ -49,7 +52,7 @@ def save_minutes(
     service: MinutesServicePort = Depends(get_minutes_service),
 ) -> UpsertResponse:
     payload_items = normalize_ingest_payload(request, payload)
-    items: list[MinutesUpsertDTO] = [service.normalize_minutes(item.model_dump()) for item in payload_items]
+    items: list[MinutesUpsertDTO] = [service.normalize_minutes(ingest_item_fields(item)) for item in payload_items]
     inserted, updated = service.upsert_minutes(items)
     return UpsertResponse(inserted=inserted, updated=updated)
 
@@ -70,6 +73,14 @@ def list_minutes(
     size: int = Query(default=20, ge=1, le=200),
     date_from: date | None = Query(default=None, alias="from"),
     date_to: date | None = Query(default=None, alias="to"),
+    cursor: str | None = Query(
+        default=None,
+        description="previous response next_cursor; seeks past it instead of using page offset",
+    ),
+    count: CountMode = Query(
+        default="exact",
+        description="total: exact count, estimate (planner row estimate when unfiltered), or skip (lower bound from a lookahead row)",
+    ),
     service: MinutesServicePort = Depends(get_minutes_service),
 ) -> MinutesListResponse:
     rows, total = service.list_minutes(
@@ -82,13 +93,19 @@ def list_minutes(
         date_to=to_date_filter(date_to),
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count,
     )
 
     return MinutesListResponse(
-        page=page,
+        # A cursor seeks past its row, so the page restarts at 1 and total counts the rest.
+        page=1 if cursor is not None else page,
         size=size,
         total=total,
-        items=[MinutesItemBase.model_validate(row) for row in rows],
+        items=construct_list_items(MinutesItemBase, rows),
+        next_cursor=next_list_cursor(
+            rows, sort_key="meeting_date", page=page, size=size, total=total, cursor=cursor
+        ),
     )
 
 
@@ -100,7 +117,7 @@ def list_minutes(
 )
 def get_minutes(item_id: int, service: MinutesServicePort = Depends(get_minutes_service)) -> MinutesItemDetail:
     row = ensure_resource_found(service.get_minutes(item_id))
-    return MinutesItemDetail.model_validate(row)
+    return MinutesItemDetail.model_construct(**row)
 
 
 @router.delete(
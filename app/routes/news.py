@@ -2,12 +2,15 @@ from datetime import date
 
 from fastapi import APIRouter, Body, Depends, Query, Request
 
-from app.ports.dto import NewsArticleUpsertDTO
+from app.ports.dto import CountMode, NewsArticleUpsertDTO
 from app.ports.services import NewsServicePort
 from app.routes.common import (
     ERROR_RESPONSES,
+    construct_list_items,
     ensure_delete_succeeded,
     ensure_resource_found,
+    ingest_item_fields,
+    next_list_cursor,
     normalize_ingest_payload,
     to_date_filter,
 )
@@ -59,7 +62,7 @@ def save_news(
     service: NewsServicePort = Depends(get_news_service),
 ) -> UpsertResponse:
     payload_items = normalize_ingest_payload(request, payload)
-    items: list[NewsArticleUpsertDTO] = [service.normalize_article(item.model_dump()) for item in payload_items]
+    items: list[NewsArticleUpsertDTO] = [service.normalize_article(ingest_item_fields(item)) for item in payload_items]
     inserted, updated = service.upsert_articles(items)
     return UpsertResponse(inserted=inserted, updated=updated)
 
@@ -77,6 +80,14 @@ def list_news(
     size: int = Query(default=20, ge=1, le=200),
     date_from: date | None = Query(default=None, alias="from"),
     date_to: date | None = Query(default=None, alias="to"),
+    cursor: str | None = Query(
+        default=None,
+        description="previous response next_cursor; seeks past it instead of using page offset",
+    ),
+    count: CountMode = Query(
+        default="exact",
+        description="total: exact count, estimate (planner row estimate when unfiltered), or skip (lower bound from a lookahead row)",
+    ),
     service: NewsServicePort = Depends(get_news_service),
 ) -> NewsListResponse:
     rows, total = service.list_articles(
@@ -86,9 +97,20 @@ def list_news(
         date_to=to_date_filter(date_to),
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count,
     )
 
-    return NewsListResponse(page=page, size=size, total=total, items=[NewsItemBase.model_validate(row) for row in rows])
+    return NewsListResponse(
+        # A cursor seeks past its row, so the page restarts at 1 and total counts the rest.
+        page=1 if cursor is not None else page,
+        size=size,
+        total=total,
+        items=construct_list_items(NewsItemBase, rows),
+        next_cursor=next_list_cursor(
+            rows, sort_key="published_at", page=page, size=size, total=total, cursor=cursor
+        ),
+    )
 
 
 @router.get(
@@ -99,7 +121,7 @@ def list_news(
 )
 def get_news(item_id: int, service: NewsServicePort = Depends(get_news_service)) -> NewsItemDetail:
     row = ensure_resource_found(service.get_article(item_id))
-    return NewsItemDetail.model_validate(row)
+    return NewsItemDetail.model_construct(**row)
 
 
 @router.delete(
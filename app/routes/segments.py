@@ -2,12 +2,15 @@ from datetime import date
 
 from fastapi import APIRouter, Body, Depends, Query, Request
 
-from app.ports.dto import SegmentUpsertDTO
+from app.ports.dto import CountMode, SegmentUpsertDTO
 from app.ports.services import SegmentsServicePort
 from app.routes.common import (
     ERROR_RESPONSES,
+    construct_list_items,
     ensure_delete_succeeded,
     ensure_resource_found,
+    ingest_item_fields,
+    next_list_cursor,
     normalize_ingest_payload,
     to_date_filter,
 )
@@ -50,7 +53,7 @@ def save_segments(
     service: SegmentsServicePort = Depends(get_segments_service),
 ) -> InsertResponse:
     payload_items = normalize_ingest_payload(request, payload)
-    items: list[SegmentUpsertDTO] = [service.normalize_segment(item.model_dump()) for item in payload_items]
+    items: list[SegmentUpsertDTO] = [service.normalize_segment(ingest_item_fields(item)) for item in payload_items]
     inserted = service.insert_segments(items)
     return InsertResponse(inserted=inserted)
 
@@ -75,6 +78,14 @@ def list_segments(
     size: int = Query(default=20, ge=1, le=200),
     date_from: date | None = Query(default=None, alias="from"),
     date_to: date | None = Query(default=None, alias="to"),
+    cursor: str | None = Query(
+        default=None,
+        description="previous response next_cursor; seeks past it instead of using page offset",
+    ),
+    count: CountMode = Query(
+        default="exact",
+        description="total: exact count, estimate (planner row estimate when unfiltered), or skip (lower bound from a lookahead row)",
+    ),
     service: SegmentsServicePort = Depends(get_segments_service),
 ) -> SegmentsListResponse:
     rows, total = service.list_segments(
@@ -91,13 +102,19 @@ def list_segments(
         date_to=to_date_filter(date_to),
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count,
     )
 
     return SegmentsListResponse(
-        page=page,
+        # A cursor seeks past its row, so the page restarts at 1 and total counts the rest.
+        page=1 if cursor is not None else page,
         size=size,
         total=total,
-        items=[SegmentsItemBase.model_validate(row) for row in rows],
+        items=construct_list_items(SegmentsItemBase, rows),
+        next_cursor=next_list_cursor(
+            rows, sort_key="meeting_date", page=page, size=size, total=total, cursor=cursor
+        ),
     )
 
 
@@ -109,7 +126,7 @@ def list_segments(
 )
 def get_segment(item_id: int, service: SegmentsServicePort = Depends(get_segments_service)) -> SegmentsItemDetail:
     row = ensure_resource_found(service.get_segment(item_id))
-    return SegmentsItemDetail.model_validate(row)
+    return SegmentsItemDetail.model_construct(**row)
 
 
 @router.delete(
@@ -8,6 +8,20 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.parsing import parse_date_value, parse_datetime_value
 
 
+def _strip_required_text(value: str) -> str:
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError("must not be blank")
+    return stripped
+
+
+def _validate_meeting_date(value: Any) -> Optional[date]:
+    try:
+        return parse_date_value(value)
+    except ValueError as exc:
+        raise ValueError("meeting_date must be YYYY-MM-DD") from exc
+
+
 class StrictRequestModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -90,13 +104,7 @@ class NewsUpsertItem(StrictRequestModel):
         },
     )
 
-    @field_validator("title", "url")
-    @classmethod
-    def _strip_required_text(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            raise ValueError("must not be blank")
-        return stripped
+    _strip_required_text = field_validator("title", "url")(_strip_required_text)
 
     @field_validator("published_at", mode="before")
     @classmethod
@@ -140,21 +148,9 @@ class MinutesUpsertItem(StrictRequestModel):
         },
     )
 
-    @field_validator("council", "url")
-    @classmethod
-    def _strip_required_text(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            raise ValueError("must not be blank")
-        return stripped
+    _strip_required_text = field_validator("council", "url")(_strip_required_text)
 
-    @field_validator("meeting_date", mode="before")
-    @classmethod
-    def _validate_meeting_date(cls, value: Any) -> Optional[date]:
-        try:
-            return parse_date_value(value)
-        except ValueError as exc:
-            raise ValueError("meeting_date must be YYYY-MM-DD") from exc
+    _validate_meeting_date = field_validator("meeting_date", mode="before")(_validate_meeting_date)
 
 
 MinutesUpsertPayload = MinutesUpsertItem | list[MinutesUpsertItem]
@@ -201,21 +197,9 @@ class SegmentsInsertItem(StrictRequestModel):
         },
     )
 
-    @field_validator("council")
-    @classmethod
-    def _strip_required_text(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            raise ValueError("must not be blank")
-        return stripped
+    _strip_required_text = field_validator("council")(_strip_required_text)
 
-    @field_validator("meeting_date", mode="before")
-    @classmethod
-    def _validate_meeting_date(cls, value: Any) -> Optional[date]:
-        try:
-            return parse_date_value(value)
-        except ValueError as exc:
-            raise ValueError("meeting_date must be YYYY-MM-DD") from exc
+    _validate_meeting_date = field_validator("meeting_date", mode="before")(_validate_meeting_date)
 
 
 SegmentsInsertPayload = SegmentsInsertItem | list[SegmentsInsertItem]
@@ -243,6 +227,7 @@ class NewsListResponse(BaseModel):
     size: int
     total: int
     items: list[NewsItemBase]
+    next_cursor: str | None = None
 
 
 class MinutesItemBase(BaseModel):
@@ -269,6 +254,7 @@ class MinutesListResponse(BaseModel):
     size: int
     total: int
     items: list[MinutesItemBase]
+    next_cursor: str | None = None
 
 
 class SegmentsItemBase(BaseModel):
@@ -301,3 +287,4 @@ class SegmentsListResponse(BaseModel):
     size: int
     total: int
     items: list[SegmentsItemBase]
+    next_cursor: str | None = None
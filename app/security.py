@@ -17,7 +17,7 @@ from app.security_jwt import (
     validate_jwt_hs256 as _validate_jwt_hs256_impl,
 )
 from app.security_proxy import (
-    TrustedProxyNetwork,
+    TrustedProxies,
     client_key as _client_key_impl,
     is_trusted_proxy as _is_trusted_proxy_impl,
     parse_trusted_proxy_networks as _parse_trusted_proxy_networks_impl,
@@ -87,7 +87,7 @@ def _authorize_claims_for_request(request: Request, claims: dict, config) -> Non
     _authorize_claims_for_request_impl(request, claims, config)
 
 
-def _parse_trusted_proxy_networks(cidrs: list[str]) -> list[TrustedProxyNetwork]:
+def _parse_trusted_proxy_networks(cidrs: list[str]) -> TrustedProxies:
     return _parse_trusted_proxy_networks_impl(cidrs)
 
 
@@ -95,11 +95,11 @@ def _remote_ip(request: Request) -> str:
     return _remote_ip_impl(request)
 
 
-def _is_trusted_proxy(remote_ip: str, trusted_proxy_networks: list[TrustedProxyNetwork]) -> bool:
+def _is_trusted_proxy(remote_ip: str, trusted_proxy_networks: TrustedProxies) -> bool:
     return _is_trusted_proxy_impl(remote_ip, trusted_proxy_networks)
 
 
-def _client_key(request: Request, *, trusted_proxy_networks: list[TrustedProxyNetwork]) -> str:
+def _client_key(request: Request, *, trusted_proxy_networks: TrustedProxies) -> str:
     return _client_key_impl(
         request,
         trusted_proxy_networks=trusted_proxy_networks,
@@ -138,6 +138,8 @@ def build_jwt_dependency(config) -> Callable:
 def build_rate_limit_dependency(config) -> Callable:
     limiter = _build_rate_limiter(config)
     trusted_proxy_networks = _parse_trusted_proxy_networks(config.trusted_proxy_cidrs_list)
+    limit_per_minute = int(config.RATE_LIMIT_PER_MINUTE)
+    backend = str(config.rate_limit_backend)
 
     async def verify_rate_limit(request: Request) -> None:
         if not limiter.enabled:
@@ -149,8 +151,8 @@ def build_rate_limit_dependency(config) -> Callable:
                 "Too Many Requests",
                 details={
                     "reason": "rate_limit_exceeded",
-                    "limit_per_minute": int(config.RATE_LIMIT_PER_MINUTE),
-                    "backend": str(config.rate_limit_backend),
+                    "limit_per_minute": limit_per_minute,
+                    "backend": backend,
                 },
             )
 
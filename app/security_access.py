@@ -13,14 +13,18 @@ def build_protected_dependencies(
     build_jwt_dependency: Callable[[Any], Callable[..., Any]],
     build_rate_limit_dependency: Callable[[Any], Callable[..., Any]],
 ) -> list[Any]:
-    api_key_dependency = build_api_key_dependency(config)
-    jwt_dependency = build_jwt_dependency(config)
-    rate_limit_dependency = build_rate_limit_dependency(config)
-    return [
-        Depends(api_key_dependency),
-        Depends(jwt_dependency),
-        Depends(rate_limit_dependency),
-    ]
+    # Disabled guards are not built at all, so they cost nothing per request (and no
+    # Redis client is created for a rate limiter that would never be consulted).
+    dependencies: list[Any] = []
+
+    if bool(config.REQUIRE_API_KEY):
+        dependencies.append(Depends(build_api_key_dependency(config)))
+    if bool(config.REQUIRE_JWT):
+        dependencies.append(Depends(build_jwt_dependency(config)))
+    if int(config.RATE_LIMIT_PER_MINUTE or 0) > 0:
+        dependencies.append(Depends(build_rate_limit_dependency(config)))
+
+    return dependencies
 
 
 def build_metrics_access_dependencies(
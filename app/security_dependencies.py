@@ -11,7 +11,7 @@ from app.security_jwt import authorize_claims_for_request, validate_jwt_hs256
 
 
 def build_api_key_dependency(config: Any) -> Callable[..., Any]:
-    expected_key = config.API_KEY or ""
+    expected_key = (config.API_KEY or "").encode("utf-8")
     require_api_key = bool(config.REQUIRE_API_KEY)
 
     async def verify_api_key(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> None:
@@ -24,7 +24,9 @@ def build_api_key_dependency(config: Any) -> Callable[..., Any]:
                 "Unauthorized",
                 details={"auth_type": "api_key", "reason": "missing_api_key"},
             )
-        if not hmac.compare_digest(x_api_key, expected_key):
+        # Starlette decodes header bytes as latin-1; re-encoding recovers the raw bytes, and
+        # comparing bytes keeps non-ASCII keys a 401 instead of a compare_digest TypeError.
+        if not hmac.compare_digest(x_api_key.encode("latin-1", "replace"), expected_key):
             raise http_error(
                 401,
                 "UNAUTHORIZED",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import jwt
@@ -14,33 +15,81 @@ logger = logging.getLogger("civic_archive.security")
 
 def extract_values_set(claims: dict[str, Any], *keys: str) -> set[str]:
     values: set[str] = set()
+    add = values.add
     for key in keys:
         raw = claims.get(key)
         if isinstance(raw, str):
             if key == "scope":
-                values.update(token for token in raw.split() if token)
-            elif raw.strip():
-                values.add(raw.strip())
+                # str.split() without a separator never yields empty tokens.
+                values.update(raw.split())
+            else:
+                stripped = raw.strip()
+                if stripped:
+                    add(stripped)
         elif isinstance(raw, list):
             for item in raw:
-                if isinstance(item, str) and item.strip():
-                    values.add(item.strip())
+                if isinstance(item, str):
+                    stripped = item.strip()
+                    if stripped:
+                        add(stripped)
     return values
 
 
+@lru_cache(maxsize=4)
+def _method_scopes(
+    raw_read_scope: str | None,
+    raw_write_scope: str | None,
+    raw_delete_scope: str | None,
+) -> dict[str, str | None]:
+    read_scope = (raw_read_scope or "").strip() or None
+    write_scope = (raw_write_scope or "").strip() or None
+    delete_scope = (raw_delete_scope or "").strip() or None
+    return {
+        "GET": read_scope,
+        "HEAD": read_scope,
+        "POST": write_scope,
+        "PUT": write_scope,
+        "PATCH": write_scope,
+        "DELETE": delete_scope,
+    }
+
+
 def required_scope_for_method(config: Any, method: str) -> str | None:
-    normalized = (method or "").upper()
-    if normalized in {"GET", "HEAD"}:
-        return (config.JWT_SCOPE_READ or "").strip() or None
-    if normalized in {"POST", "PUT", "PATCH"}:
-        return (config.JWT_SCOPE_WRITE or "").strip() or None
-    if normalized == "DELETE":
-        return (config.JWT_SCOPE_DELETE or "").strip() or None
-    return None
+    scopes = _method_scopes(config.JWT_SCOPE_READ, config.JWT_SCOPE_WRITE, config.JWT_SCOPE_DELETE)
+    # ASGI servers already hand over upper-case verbs; normalize only on a miss.
+    if method in scopes:
+        return scopes[method]
+    return scopes.get((method or "").upper())
+
+
+@lru_cache(maxsize=4)
+def _jwt_params(
+    raw_secret: str | None,
+    raw_audience: str | None,
+    raw_issuer: str | None,
+    raw_leeway_seconds: Any,
+) -> tuple[str, str | None, str | None, int, Options]:
+    # Keyed by the raw config values, so a changed config never reuses stale decode settings.
+    audience = (raw_audience or "").strip() or None
+    issuer = (raw_issuer or "").strip() or None
+    options: Options = {
+        "require": ["sub", "exp"],
+        "verify_signature": True,
+        "verify_exp": True,
+        "verify_nbf": True,
+        "verify_aud": audience is not None,
+        "verify_iss": issuer is not None,
+    }
+    return (raw_secret or "").strip(), audience, issuer, max(0, int(raw_leeway_seconds)), options
 
 
 def validate_jwt_hs256(token: str, config: Any) -> dict[str, Any]:
-    secret = (config.JWT_SECRET or "").strip()
+    secret, audience, issuer, leeway_seconds, options = _jwt_params(
+        config.JWT_SECRET,
+        config.JWT_AUDIENCE,
+        config.JWT_ISSUER,
+        config.JWT_LEEWAY_SECONDS,
+    )
     if not secret:
         raise http_error(
             401,
@@ -49,19 +98,6 @@ def validate_jwt_hs256(token: str, config: Any) -> dict[str, Any]:
             details={"auth_type": "jwt", "reason": "jwt_secret_not_configured"},
         )
 
-    audience = (config.JWT_AUDIENCE or "").strip() or None
-    issuer = (config.JWT_ISSUER or "").strip() or None
-    leeway_seconds = max(0, int(config.JWT_LEEWAY_SECONDS))
-
-    options: Options = {
-        "require": ["sub", "exp"],
-        "verify_signature": True,
-        "verify_exp": True,
-        "verify_nbf": True,
-        "verify_aud": audience is not None,
-        "verify_iss": issuer is not None,
-    }
-
     try:
         payload = jwt.decode(
             token,
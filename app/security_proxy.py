@@ -1,14 +1,54 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network, ip_address, ip_network
 
 from fastapi import Request
 
 TrustedProxyNetwork = IPv4Network | IPv6Network
 
 
-def parse_trusted_proxy_networks(cidrs: list[str]) -> list[TrustedProxyNetwork]:
+class TrustedProxies:
+    """Trusted proxy CIDRs split by IP version.
+
+    Single-host entries (`/32`, `/128`) are kept as integer sets so the common
+    load-balancer allowlist is an O(1) lookup; wider networks are scanned only
+    within the matching address family.
+    """
+
+    __slots__ = ("v4", "v6", "v4_hosts", "v6_hosts")
+
+    def __init__(self, networks: Iterable[TrustedProxyNetwork] = ()) -> None:
+        v4: list[IPv4Network] = []
+        v6: list[IPv6Network] = []
+        v4_hosts: set[int] = set()
+        v6_hosts: set[int] = set()
+        for network in networks:
+            if isinstance(network, IPv4Network):
+                if network.prefixlen == network.max_prefixlen:
+                    v4_hosts.add(int(network.network_address))
+                else:
+                    v4.append(network)
+            elif network.prefixlen == network.max_prefixlen:
+                v6_hosts.add(int(network.network_address))
+            else:
+                v6.append(network)
+        self.v4: tuple[IPv4Network, ...] = tuple(v4)
+        self.v6: tuple[IPv6Network, ...] = tuple(v6)
+        self.v4_hosts: frozenset[int] = frozenset(v4_hosts)
+        self.v6_hosts: frozenset[int] = frozenset(v6_hosts)
+
+    def __bool__(self) -> bool:
+        return bool(self.v4 or self.v6 or self.v4_hosts or self.v6_hosts)
+
+    def __contains__(self, address: IPv4Address | IPv6Address) -> bool:
+        if isinstance(address, IPv4Address):
+            return int(address) in self.v4_hosts or any(address in network for network in self.v4)
+        return int(address) in self.v6_hosts or any(address in network for network in self.v6)
+
+
+def parse_trusted_proxy_networks(cidrs: list[str]) -> TrustedProxies:
     networks: list[TrustedProxyNetwork] = []
     for raw in cidrs:
         value = (raw or "").strip()
@@ -20,7 +60,7 @@ def parse_trusted_proxy_networks(cidrs: list[str]) -> list[TrustedProxyNetwork]:
             raise RuntimeError(f"Invalid TRUSTED_PROXY_CIDRS entry: {value}") from exc
         if isinstance(network, (IPv4Network, IPv6Network)):
             networks.append(network)
-    return networks
+    return TrustedProxies(networks)
 
 
 def _first_valid_forwarded_ip(headers: Mapping[str, str]) -> str | None:
@@ -60,20 +100,31 @@ def remote_ip(request: Request) -> str:
     return f"request-id:{request_id}"
 
 
-def is_trusted_proxy(remote_ip_value: str, trusted_proxy_networks: list[TrustedProxyNetwork]) -> bool:
-    if not trusted_proxy_networks:
-        return False
+REMOTE_ADDRESS_CACHE_MAX_SIZE = 1024
+
+
+@lru_cache(maxsize=REMOTE_ADDRESS_CACHE_MAX_SIZE)
+def _parse_remote_address(remote_ip_value: str) -> IPv4Address | IPv6Address | None:
+    # Behind a load balancer the peer host is the same handful of proxy IPs on every request.
     try:
-        remote_addr = ip_address(remote_ip_value)
+        return ip_address(remote_ip_value)
     except ValueError:
+        return None
+
+
+def is_trusted_proxy(remote_ip_value: str, trusted_proxy_networks: TrustedProxies) -> bool:
+    if not trusted_proxy_networks:
+        return False
+    remote_addr = _parse_remote_address(remote_ip_value)
+    if remote_addr is None:
         return False
-    return any(remote_addr in network for network in trusted_proxy_networks)
+    return remote_addr in trusted_proxy_networks
 
 
 def client_key(
     request: Request,
     *,
-    trusted_proxy_networks: list[TrustedProxyNetwork],
+    trusted_proxy_networks: TrustedProxies,
     remote_ip_resolver: Callable[[Request], str] = remote_ip,
 ) -> str:
     resolved_remote_ip = remote_ip_resolver(request)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from collections.abc import Mapping
+from datetime import date
+import json
 
+from app.ports.dto import KeysetCursor
 from app.utils import bad_request, normalize_date_filter, normalize_optional_str, normalize_pagination
 
 
@@ -38,3 +43,23 @@ def normalize_list_window(
     normalized_date_from = normalize_date_filter(date_from, field_name="from")
     normalized_date_to = normalize_date_filter(date_to, field_name="to")
     return normalized_page, normalized_size, normalized_date_from, normalized_date_to
+
+
+def encode_list_cursor(sort_value: date | str | None, row_id: int) -> str:
+    """Opaque `cursor` for the row after which the next list page starts."""
+    sort_text = sort_value.isoformat() if isinstance(sort_value, date) else sort_value
+    raw = json.dumps([sort_text, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_list_cursor(cursor: str | None) -> KeysetCursor | None:
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise bad_request("invalid cursor") from exc
+    if not (sort_value is None or isinstance(sort_value, str)) or type(row_id) is not int:
+        raise bad_request("invalid cursor")
+    return sort_value, row_id
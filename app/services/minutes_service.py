@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import cast
 
-from app.ports.dto import MinutesRecordDTO, MinutesUpsertDTO
+from app.ports.dto import CountMode, MinutesRecordDTO, MinutesUpsertDTO
 from app.ports.repositories import MinutesRepositoryPort
 from app.ports.services import MinutesServicePort
 from app.repositories.minutes_repository import MinutesRepository
 from app.repositories.session_provider import ConnectionProvider, ensure_connection_provider
 from app.services.common import (
+    decode_list_cursor,
     ensure_item_object,
     normalize_list_window,
     normalize_optional_filters,
@@ -76,6 +77,8 @@ class MinutesService:
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[MinutesRecordDTO], int]:
         page, size, date_from, date_to = normalize_list_window(
             page=page,
@@ -102,6 +105,8 @@ class MinutesService:
             date_to=date_to,
             page=page,
             size=size,
+            after=decode_list_cursor(cursor),
+            count_mode=count_mode,
         )
 
     def get_minutes(self, item_id: int) -> MinutesRecordDTO | None:
@@ -145,6 +150,8 @@ def list_minutes(
     date_to: str | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    count_mode: CountMode = "exact",
     service: MinutesServicePort | None = None,
     connection_provider: ConnectionProvider | None = None,
 ) -> tuple[list[MinutesRecordDTO], int]:
@@ -159,6 +166,8 @@ def list_minutes(
         date_to=date_to,
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count_mode,
     )
 
 
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import cast
 
-from app.ports.dto import NewsArticleRecordDTO, NewsArticleUpsertDTO
+from app.ports.dto import CountMode, NewsArticleRecordDTO, NewsArticleUpsertDTO
 from app.ports.repositories import NewsRepositoryPort
 from app.ports.services import NewsServicePort
 from app.repositories.news_repository import NewsRepository
 from app.repositories.session_provider import ConnectionProvider, ensure_connection_provider
 from app.services.common import (
+    decode_list_cursor,
     ensure_item_object,
     normalize_list_window,
     normalize_optional_filters,
@@ -62,6 +63,8 @@ class NewsService:
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[NewsArticleRecordDTO], int]:
         page, size, date_from, date_to = normalize_list_window(
             page=page,
@@ -77,6 +80,8 @@ class NewsService:
             date_to=date_to,
             page=page,
             size=size,
+            after=decode_list_cursor(cursor),
+            count_mode=count_mode,
         )
 
     def get_article(self, item_id: int) -> NewsArticleRecordDTO | None:
@@ -117,6 +122,8 @@ def list_articles(
     date_to: str | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    count_mode: CountMode = "exact",
     service: NewsServicePort | None = None,
     connection_provider: ConnectionProvider | None = None,
 ) -> tuple[list[NewsArticleRecordDTO], int]:
@@ -128,6 +135,8 @@ def list_articles(
         date_to=date_to,
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count_mode,
     )
 
 
@@ -5,12 +5,13 @@ import json
 from datetime import date, datetime
 from typing import Mapping, cast
 
-from app.ports.dto import SegmentRecordDTO, SegmentUpsertDTO
+from app.ports.dto import CountMode, SegmentRecordDTO, SegmentUpsertDTO
 from app.ports.repositories import SegmentsRepositoryPort
 from app.ports.services import SegmentsServicePort
 from app.repositories.segments_repository import SegmentsRepository
 from app.repositories.session_provider import ConnectionProvider, ensure_connection_provider
 from app.services.common import (
+    decode_list_cursor,
     ensure_item_object,
     normalize_list_window,
     normalize_optional_filters,
@@ -178,6 +179,8 @@ class SegmentsService:
         date_to: str | None,
         page: int,
         size: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[list[SegmentRecordDTO], int]:
         page, size, date_from, date_to = normalize_list_window(
             page=page,
@@ -211,6 +214,8 @@ class SegmentsService:
             date_to=date_to,
             page=page,
             size=size,
+            after=decode_list_cursor(cursor),
+            count_mode=count_mode,
         )
 
     def get_segment(self, item_id: int) -> SegmentRecordDTO | None:
@@ -258,6 +263,8 @@ def list_segments(
     date_to: str | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    count_mode: CountMode = "exact",
     service: SegmentsServicePort | None = None,
     connection_provider: ConnectionProvider | None = None,
 ) -> tuple[list[SegmentRecordDTO], int]:
@@ -276,6 +283,8 @@ def list_segments(
         date_to=date_to,
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count_mode,
     )
 
 
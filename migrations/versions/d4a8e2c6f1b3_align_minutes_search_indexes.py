@@ -0,0 +1,79 @@
+"""align council_minutes search indexes with the searched columns
+
+Revision ID: d4a8e2c6f1b3
+Revises: b7d1c2a4e8f9
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a8e2c6f1b3"
+down_revision: Union[str, Sequence[str], None] = "b7d1c2a4e8f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# `GET /api/minutes?q=` searches council/committee/session/content/agenda only.
+# The index expressions must match the query's search document to be usable.
+_MINUTES_SEARCH_DOCUMENT = """
+            COALESCE(council, '') ||
+            ' ' ||
+            COALESCE(committee, '') ||
+            ' ' ||
+            COALESCE("session", '') ||
+            ' ' ||
+            COALESCE(content, '') ||
+            ' ' ||
+            COALESCE(agenda::text, '')
+"""
+
+_LEGACY_MINUTES_SEARCH_DOCUMENT = """
+            COALESCE(council, '') ||
+            ' ' ||
+            COALESCE(committee, '') ||
+            ' ' ||
+            COALESCE("session", '') ||
+            ' ' ||
+            COALESCE(content, '') ||
+            ' ' ||
+            COALESCE(tag::text, '') ||
+            ' ' ||
+            COALESCE(attendee::text, '') ||
+            ' ' ||
+            COALESCE(agenda::text, '')
+"""
+
+
+def _create_minutes_search_indexes(document: str) -> None:
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_council_minutes_search_trgm
+        ON council_minutes
+        USING gin ((({document})) gin_trgm_ops)
+        """
+    )
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_council_minutes_search_fts
+        ON council_minutes
+        USING gin (to_tsvector('simple', ({document})))
+        """
+    )
+
+
+def _drop_minutes_search_indexes() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_council_minutes_search_fts")
+    op.execute("DROP INDEX IF EXISTS ix_council_minutes_search_trgm")
+
+
+def upgrade() -> None:
+    _drop_minutes_search_indexes()
+    _create_minutes_search_indexes(_MINUTES_SEARCH_DOCUMENT)
+
+
+def downgrade() -> None:
+    _drop_minutes_search_indexes()
+    _create_minutes_search_indexes(_LEGACY_MINUTES_SEARCH_DOCUMENT)
@@ -0,0 +1,62 @@
+"""rebuild list ordering indexes as DESC NULLS LAST
+
+Revision ID: e5b9c3d7a2f4
+Revises: d4a8e2c6f1b3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9c3d7a2f4"
+down_revision: Union[str, Sequence[str], None] = "d4a8e2c6f1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# List endpoints order by `<date> DESC NULLS LAST, id DESC`. A plain `DESC` btree key sorts
+# NULLs first, so the planner cannot walk it for that ORDER BY and falls back to sort + limit.
+# (index name, table, leading filter columns, date column)
+_ORDER_INDEXES = (
+    ("ix_news_articles_source_published_id", "news_articles", ("source",), "published_at"),
+    ("ix_news_articles_published_id", "news_articles", (), "published_at"),
+    (
+        "ix_council_minutes_filters_date_id",
+        "council_minutes",
+        ("council", "committee", '"session"'),
+        "meeting_date",
+    ),
+    ("ix_council_minutes_date_id", "council_minutes", (), "meeting_date"),
+    (
+        "ix_council_segments_filters_date_id",
+        "council_speech_segments",
+        (
+            "council",
+            "committee",
+            '"session"',
+            "importance",
+            "party",
+            "constituency",
+            "department",
+        ),
+        "meeting_date",
+    ),
+    ("ix_council_segments_date_id", "council_speech_segments", (), "meeting_date"),
+)
+
+
+def _rebuild_order_indexes(date_order: str) -> None:
+    for index_name, table_name, filter_columns, date_column in _ORDER_INDEXES:
+        key_columns = ", ".join((*filter_columns, f"{date_column} {date_order}", "id DESC"))
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({key_columns})")
+
+
+def upgrade() -> None:
+    _rebuild_order_indexes("DESC NULLS LAST")
+
+
+def downgrade() -> None:
+    _rebuild_order_indexes("DESC")
@@ -0,0 +1,54 @@
+"""add council_speech_segments filter + order composite indexes
+
+Revision ID: f1c6a8d3b5e7
+Revises: e5b9c3d7a2f4
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c6a8d3b5e7"
+down_revision: Union[str, Sequence[str], None] = "e5b9c3d7a2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ix_council_segments_filters_date_id only serves filters that fill its leading columns in order.
+# These cover the common single/paired filters and end in the list ORDER BY keys, so a filtered
+# page is read straight off the index without a sort node.
+_FILTER_ORDER_INDEXES = (
+    ("ix_council_segments_council_committee_date_id", "council, committee", ""),
+    ("ix_council_segments_party_date_id", "party", ""),
+    ("ix_council_segments_department_date_id", "department", ""),
+    ("ix_council_segments_importance_date_id", "importance", "WHERE importance IS NOT NULL"),
+)
+
+# Single-column indexes whose lookups the composites above now serve with the same leading column.
+_SUPERSEDED_INDEXES = (
+    ("ix_council_segments_party", "party"),
+    ("ix_council_segments_department", "department"),
+    ("ix_council_segments_importance", "importance"),
+)
+
+
+def upgrade() -> None:
+    for index_name, filter_columns, predicate in _FILTER_ORDER_INDEXES:
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {index_name}
+            ON council_speech_segments ({filter_columns}, meeting_date DESC NULLS LAST, id DESC)
+            {predicate}
+            """
+        )
+    for index_name, _ in _SUPERSEDED_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    for index_name, column_name in _SUPERSEDED_INDEXES:
+        op.create_index(index_name, "council_speech_segments", [column_name], unique=False)
+    for index_name, _, _ in reversed(_FILTER_ORDER_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -28,8 +28,11 @@ def test_create_app_applies_database_runtime_tuning():
                 DB_MAX_OVERFLOW=13,
                 DB_POOL_TIMEOUT_SECONDS=11,
                 DB_POOL_RECYCLE_SECONDS=1800,
+                DB_POOL_PRE_PING=True,
                 DB_CONNECT_TIMEOUT_SECONDS=4,
                 DB_STATEMENT_TIMEOUT_MS=4500,
+                DB_PREPARE_THRESHOLD=0,
+                DB_RANDOM_PAGE_COST=1.1,
             )
         )
 
@@ -39,10 +42,13 @@ def test_create_app_applies_database_runtime_tuning():
     assert init_kwargs["max_overflow"] == 13
     assert init_kwargs["pool_timeout"] == 11
     assert init_kwargs["pool_recycle"] == 1800
+    assert init_kwargs["pool_pre_ping"] is True
     assert init_kwargs["connect_args"]["connect_timeout"] == 4
     assert "statement_timeout=4500" in init_kwargs["connect_args"]["options"]
     assert "application_name=civic_archive_api" in init_kwargs["connect_args"]["options"]
     assert "timezone=UTC" in init_kwargs["connect_args"]["options"]
+    assert init_kwargs["connect_args"]["prepare_threshold"] == 0
+    assert "random_page_cost=1.1" in init_kwargs["connect_args"]["options"]
 
 
 @pytest.mark.parametrize(
@@ -54,6 +60,7 @@ def test_create_app_applies_database_runtime_tuning():
         ({"DB_POOL_RECYCLE_SECONDS": 0}, "DB_POOL_RECYCLE_SECONDS must be greater than 0."),
         ({"DB_CONNECT_TIMEOUT_SECONDS": 0}, "DB_CONNECT_TIMEOUT_SECONDS must be greater than 0."),
         ({"DB_STATEMENT_TIMEOUT_MS": 0}, "DB_STATEMENT_TIMEOUT_MS must be greater than 0."),
+        ({"HEALTH_CHECK_CACHE_TTL_SECONDS": -1}, "HEALTH_CHECK_CACHE_TTL_SECONDS must be greater than or equal to 0."),
         ({"INGEST_MAX_BATCH_ITEMS": 0}, "INGEST_MAX_BATCH_ITEMS must be greater than 0."),
         ({"MAX_REQUEST_BODY_BYTES": 0}, "MAX_REQUEST_BODY_BYTES must be greater than 0."),
     ],
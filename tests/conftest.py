@@ -39,6 +39,7 @@ def build_test_config(**overrides: Any) -> Config:
         "RATE_LIMIT_PER_MINUTE": 0,
         "RATE_LIMIT_BACKEND": "memory",
         "SECURITY_STRICT_MODE": False,
+        "HEALTH_CHECK_CACHE_TTL_SECONDS": 0,
     }
     defaults.update(overrides)
     return Config.model_validate(defaults)
@@ -137,6 +138,13 @@ class StubResult:
     def mappings(self) -> "StubResult":
         return self
 
+    def keys(self) -> List[str]:
+        return list(dict.fromkeys(key for row in self._rows for key in row))
+
+    def tuples(self) -> "StubResult":
+        keys = self.keys()
+        return StubResult(rows=[tuple(row.get(key) for key in keys) for row in self._rows])
+
     def all(self) -> List[Dict[str, Any]]:
         return self._rows
 
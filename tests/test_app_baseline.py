@@ -129,7 +129,7 @@ def test_normalize_segment_keeps_numeric_string_meeting_no_as_text(segments_modu
 
 def test_upsert_articles_counts_insert_and_update(news_module, make_connection_provider):
     def handler(_statement, _params):
-        return StubResult(rows=[{"inserted": 2, "updated": 1}])
+        return StubResult(rows=[{"inserted": True}, {"inserted": True}, {"inserted": False}])
 
     connection_provider, _ = make_connection_provider(handler)
 
@@ -242,12 +242,12 @@ def test_list_news_returns_paginated_payload(client, use_stub_connection_provide
                         "source": "paper",
                         "title": "budget news",
                         "url": "https://example.com/n/10",
-                        "published_at": "2025-01-01 00:00:00",
+                        "published_at": datetime(2025, 1, 1),
                         "author": "author",
                         "summary": "summary",
                         "keywords": '["budget"]',
-                        "created_at": "2025-01-01 00:00:00",
-                        "updated_at": "2025-01-01 00:00:00",
+                        "created_at": datetime(2025, 1, 1),
+                        "updated_at": datetime(2025, 1, 1),
                     }
                 ]
             )
@@ -268,9 +268,77 @@ def test_list_news_returns_paginated_payload(client, use_stub_connection_provide
     assert first_select_params["limit"] == 1
     assert first_select_params["offset"] == 1
     assert first_select_params["q"] == "%budget%"
-    assert first_select_params["q_fts"] == "budget"
-
-
+    assert "q_fts" not in first_select_params
+
+
+def test_list_news_returns_next_cursor_and_seeks_past_it(client, use_stub_connection_provider):
+    row = {
+        "id": 10,
+        "source": "paper",
+        "title": "budget news",
+        "url": "https://example.com/n/10",
+        "published_at": datetime(2025, 1, 1),
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+    }
+
+    def handler(statement, _params):
+        if "count(" in str(statement).lower() and "over" not in str(statement).lower():
+            return StubResult(scalar_value=3)
+        return StubResult(rows=[row])
+
+    engine = use_stub_connection_provider(handler)
+
+    first = client.get("/api/news?size=1").get_json()
+    assert first["total"] == 3
+    assert first["next_cursor"]
+
+    resp = client.get(f"/api/news?size=1&page=5&cursor={first['next_cursor']}")
+    assert resp.status_code == 200
+    assert resp.get_json()["page"] == 1
+    select_params = [c["params"] for c in engine.connection.calls if "after_id" in (c.get("params") or {})]
+    assert select_params[0]["after_sort"] == "2025-01-01T00:00:00"
+    assert select_params[0]["after_id"] == 10
+    assert select_params[0]["offset"] == 0
+
+    bad = client.get("/api/news?cursor=garbage")
+    assert bad.status_code == 400
+
+
+def test_list_news_count_skip_uses_lookahead_instead_of_count_query(client, use_stub_connection_provider):
+    rows = [
+        {
+            "id": item_id,
+            "source": "paper",
+            "title": "budget news",
+            "url": f"https://example.com/n/{item_id}",
+            "published_at": datetime(2025, 1, 1),
+            "created_at": datetime(2025, 1, 1),
+            "updated_at": datetime(2025, 1, 1),
+        }
+        for item_id in (12, 11, 10)
+    ]
+
+    def handler(statement, _params):
+        return StubResult(rows=rows)
+
+    engine = use_stub_connection_provider(handler)
+
+    resp = client.get("/api/news?size=2&count=skip")
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert [item["id"] for item in data["items"]] == [12, 11]
+    assert data["total"] == 3
+    assert data["next_cursor"]
+
+    statements = [str(c["statement"]).lower() for c in engine.connection.calls]
+    assert len(statements) == 1
+    assert "over" not in statements[0]
+    assert extract_first_select_params(engine)["limit"] == 3
+
+    assert client.get("/api/news?count=approx").status_code == 400
+
+
 def test_get_news_404_when_not_found(client, use_stub_connection_provider):
     def handler(_statement, _params):
         return StubResult(rows=[])
@@ -352,3 +420,19 @@ def test_build_test_config_is_deterministic_against_env(monkeypatch):
     assert config.POSTGRES_PASSWORD == "change_me"
 
 
+def test_config_derived_properties_are_parsed_once_per_instance():
+    config = build_test_config(ALLOWED_HOSTS=" api.example.com , , admin.example.com ", RATE_LIMIT_BACKEND=" Redis ")
+
+    assert config.allowed_hosts_list == ["api.example.com", "admin.example.com"]
+    assert config.allowed_hosts_list is config.allowed_hosts_list
+    assert config.rate_limit_backend == "redis"
+    assert "allowed_hosts_list" not in config.model_dump()
+
+
+def test_config_parse_csv_handles_single_and_blank_values():
+    config = build_test_config()
+
+    assert config._parse_csv("*") == ["*"]
+    assert config._parse_csv("  GET  ") == ["GET"]
+    assert config._parse_csv("  ") == []
+    assert config._parse_csv(" a, ,b ,") == ["a", "b"]
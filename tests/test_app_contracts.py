@@ -1,4 +1,6 @@
-﻿from conftest import StubResult
+﻿from datetime import date, datetime
+
+from conftest import StubResult
 
 
 from app.services.providers import get_minutes_service, get_segments_service
@@ -16,7 +18,7 @@ def _assert_common_list_select_params(first_select_params):
     assert first_select_params["limit"] == 1
     assert first_select_params["offset"] == 1
     assert first_select_params["q"] == "%budget%"
-    assert first_select_params["q_fts"] == "budget"
+    assert "q_fts" not in first_select_params
     assert first_select_params["council"] == "A"
     assert first_select_params["committee"] == "B"
     assert first_select_params["session"] == "C"
@@ -61,7 +63,7 @@ def test_list_segments_invalid_pagination_returns_400(client):
 
 def test_upsert_minutes_counts_insert_and_update(minutes_module, make_connection_provider):
     def handler(_statement, _params):
-        return StubResult(rows=[{"inserted": 1, "updated": 2}])
+        return StubResult(rows=[{"inserted": True}, {"inserted": False}, {"inserted": False}])
 
     connection_provider, _ = make_connection_provider(handler)
 
@@ -122,12 +124,12 @@ def test_list_minutes_returns_paginated_payload_and_filter_params(client, use_st
                         "session": "C",
                         "meeting_no": "C 1th",
                         "url": "https://example.com/m/101",
-                        "meeting_date": "2025-01-01",
+                        "meeting_date": date(2025, 1, 1),
                         "tag": "[]",
                         "attendee": "{}",
                         "agenda": "[]",
-                        "created_at": "2025-01-01 00:00:00",
-                        "updated_at": "2025-01-01 00:00:00",
+                        "created_at": datetime(2025, 1, 1),
+                        "updated_at": datetime(2025, 1, 1),
                     }
                 ]
             )
@@ -168,8 +170,8 @@ def test_get_minutes_success_and_404(client, use_stub_connection_provider):
                         "tag": None,
                         "attendee": None,
                         "agenda": None,
-                        "created_at": "2025-01-01 00:00:00",
-                        "updated_at": "2025-01-01 00:00:00",
+                        "created_at": datetime(2025, 1, 1),
+                        "updated_at": datetime(2025, 1, 1),
                     }
                 ]
             )
@@ -248,7 +250,7 @@ def test_list_segments_returns_paginated_payload_and_filter_params(client, use_s
                         "committee": "B",
                         "session": "C",
                         "meeting_no": "C 1th",
-                        "meeting_date": "2025-01-02",
+                        "meeting_date": date(2025, 1, 2),
                         "summary": "s",
                         "subject": "sub",
                         "tag": "[]",
@@ -334,8 +336,8 @@ def test_get_segment_success_and_404(client, use_stub_connection_provider):
                         "party": None,
                         "constituency": None,
                         "department": None,
-                        "created_at": "2025-01-01 00:00:00",
-                        "updated_at": "2025-01-01 00:00:00",
+                        "created_at": datetime(2025, 1, 1),
+                        "updated_at": datetime(2025, 1, 1),
                     }
                 ]
             )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import date
 
@@ -5,11 +6,12 @@ import pytest
 from conftest import build_test_config
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.testclient import TestClient
+import orjson
 from unittest.mock import patch
 
 import app.bootstrap.routes as bootstrap_routes_module
 from app.bootstrap.exception_handlers import register_exception_handlers
-from app.bootstrap.middleware import register_core_middleware
+from app.bootstrap.middleware import RequestSizeGuardMiddleware, register_core_middleware
 from app.bootstrap.routes import register_domain_routes
 from app.bootstrap.system_routes import register_system_routes
 from app.bootstrap.validation import validate_startup_config
@@ -71,6 +73,29 @@ def test_middleware_module_enforces_request_size_guard():
         assert error_body["details"]["max_request_body_bytes"] == 64
 
 
+def test_middleware_module_registers_request_size_guard_as_pure_asgi():
+    api = FastAPI()
+    register_core_middleware(api, build_test_config(MAX_REQUEST_BODY_BYTES=64))
+
+    guard = next(item for item in api.user_middleware if item.cls is RequestSizeGuardMiddleware)
+    assert guard.kwargs == {"max_bytes": 64}
+
+
+def test_request_size_guard_passes_non_target_scopes_through_untouched():
+    seen_scopes = []
+
+    async def downstream(scope, receive, send):
+        seen_scopes.append(scope)
+
+    guard = RequestSizeGuardMiddleware(downstream, max_bytes=1)
+    scope = {"type": "http", "method": "GET", "path": "/api/news", "headers": []}
+
+    asyncio.run(guard(scope, None, None))
+
+    assert seen_scopes == [scope]
+    assert "state" not in scope
+
+
 def test_system_routes_module_readiness_and_echo():
     api = FastAPI()
     register_system_routes(
@@ -111,6 +136,17 @@ def test_system_routes_echo_reflects_any_json_payload():
         assert string_resp.status_code == 200
         assert string_resp.json() == {"you_sent": "plain"}
 
+        empty_resp = client.post("/api/echo")
+        assert empty_resp.status_code == 200
+        assert empty_resp.json() == {"you_sent": {}}
+
+        malformed_resp = client.post(
+            "/api/echo",
+            content="{not json",
+            headers={"Content-Type": "application/json"},
+        )
+        assert malformed_resp.status_code == 422
+
 
 def test_create_app_disposes_db_engine_on_shutdown():
     class _NoopScope:
@@ -140,6 +176,21 @@ def test_create_app_disposes_db_engine_on_shutdown():
     assert engine.disposed is True
 
 
+def test_create_app_closes_resources_in_reverse_order_on_shutdown(make_engine):
+    events = []
+    engine = make_engine(lambda *_: None)
+    engine.dispose = lambda: events.append("db_engine")
+
+    with patch("app.database.create_engine", return_value=engine), patch(
+        "app.ReadCache.close", autospec=True, side_effect=lambda _self: events.append("read_cache")
+    ):
+        app = create_app(build_test_config())
+        with TestClient(app):
+            assert events == []
+
+    assert events == ["read_cache", "db_engine"]
+
+
 def test_exception_handlers_module_normalizes_errors():
     api = FastAPI()
     register_exception_handlers(api, logger=logging.getLogger("test.bootstrap.handlers"))
@@ -204,3 +255,67 @@ def test_routes_common_not_found_guards():
     with pytest.raises(HTTPException) as delete_failed:
         ensure_delete_succeeded(False)
     assert delete_failed.value.status_code == 404
+
+
+def test_system_routes_readiness_reuses_checks_within_cache_ttl():
+    calls = {"db": 0, "rate_limit": 0}
+
+    def counting_db_health_check():
+        calls["db"] += 1
+        return True, None
+
+    def counting_rate_limit_health_check():
+        calls["rate_limit"] += 1
+        return True, None
+
+    api = FastAPI()
+    register_system_routes(
+        api,
+        protected_dependencies=[],
+        db_health_check=counting_db_health_check,
+        rate_limit_health_check=counting_rate_limit_health_check,
+        health_check_cache_ttl_seconds=60,
+    )
+
+    with TestClient(api) as client:
+        assert client.get("/health/ready").status_code == 200
+        assert client.get("/health/ready").status_code == 200
+
+    assert calls == {"db": 1, "rate_limit": 1}
+
+
+def test_system_routes_readiness_reserializes_only_on_state_change():
+    db_state = {"result": (False, "database connection failed")}
+
+    api = FastAPI()
+    register_system_routes(
+        api,
+        protected_dependencies=[],
+        db_health_check=lambda: db_state["result"],
+        rate_limit_health_check=lambda: (True, None),
+    )
+
+    with patch("app.bootstrap.system_routes.orjson.dumps", wraps=orjson.dumps) as dumps:
+        with TestClient(api) as client:
+            first = client.get("/health/ready")
+            second = client.get("/health/ready")
+            db_state["result"] = (False, "pool exhausted")
+            third = client.get("/health/ready")
+            db_state["result"] = (True, None)
+            recovered = client.get("/health/ready")
+            recovered_again = client.get("/health/ready")
+
+    assert first.status_code == second.status_code == third.status_code == 503
+    assert first.headers["content-type"] == "application/json"
+    assert first.json() == second.json()
+    assert first.json()["checks"]["database"] == {"ok": False, "detail": "database connection failed"}
+    assert third.json()["checks"]["database"]["detail"] == "pool exhausted"
+    assert recovered.status_code == recovered_again.status_code == 200
+    assert recovered.json() == {
+        "status": "ok",
+        "checks": {
+            "database": {"ok": True, "detail": None},
+            "rate_limit_backend": {"ok": True, "detail": None},
+        },
+    }
+    assert dumps.call_count == 3
@@ -1,11 +1,23 @@
 """Unit tests for app.cache.ReadCache."""
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock, patch
 
+import orjson
+import pytest
+
+import app.cache as cache_module
 from app.cache import ReadCache
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    cache_module._SHARED_CLIENTS.clear()
+    yield
+    cache_module._SHARED_CLIENTS.clear()
+
+
 # ---------------------------------------------------------------------------
 # No-op behaviour (disabled)
 # ---------------------------------------------------------------------------
@@ -43,11 +55,11 @@ def test_read_cache_invalidate_prefix_is_noop_when_inactive():
 
 def test_read_cache_key_joins_parts_with_prefix():
     key = ReadCache.key("news", "list", "source=abc", "page=1")
-    assert key == "civic_archive:read:news:list:source=abc:page=1"
+    assert key == "civic_archive:read:v2:news:list:source=abc:page=1"
 
 
 def test_read_cache_key_single_part():
-    assert ReadCache.key("health") == "civic_archive:read:health"
+    assert ReadCache.key("health") == "civic_archive:read:v2:health"
 
 
 # ---------------------------------------------------------------------------
@@ -100,7 +112,21 @@ def test_read_cache_set_calls_setex_with_ttl():
     args = mock_client.setex.call_args
     assert args[0][0] == "k"
     assert args[0][1] == 120
-    assert '"total": 5' in args[0][2]
+    assert orjson.loads(args[0][2]) == {"total": 5}
+
+
+def test_read_cache_set_falls_back_for_values_orjson_rejects():
+    cache, mock_client = _make_active_cache()
+    cache.set("k", {1: "non-str key"})
+
+    assert json.loads(mock_client.setex.call_args[0][2]) == {"1": "non-str key"}
+
+
+def test_read_cache_get_decodes_bytes_payload():
+    cache, mock_client = _make_active_cache()
+    mock_client.get.return_value = b'{"items": [1, 2]}'
+
+    assert cache.get("some-key") == {"items": [1, 2]}
 
 
 def test_read_cache_set_is_silent_on_redis_error():
@@ -110,34 +136,49 @@ def test_read_cache_set_is_silent_on_redis_error():
     cache.set("k", {"data": 1})  # must not raise
 
 
-def test_read_cache_invalidate_prefix_scans_and_deletes():
+def test_read_cache_invalidate_prefix_scans_and_unlinks():
     cache, mock_client = _make_active_cache()
-    mock_client.scan.side_effect = [
-        (0, ["civic_archive:read:news:k1", "civic_archive:read:news:k2"]),
-    ]
+    mock_client.scan_iter.return_value = iter(["civic_archive:read:v2:news:k1", "civic_archive:read:v2:news:k2"])
 
     cache.invalidate_prefix("news")
 
-    mock_client.scan.assert_called_once_with(0, match="civic_archive:read:news:*", count=100)
-    mock_client.delete.assert_called_once_with(
-        "civic_archive:read:news:k1", "civic_archive:read:news:k2"
+    mock_client.scan_iter.assert_called_once_with(match="civic_archive:read:v2:news:*", count=500)
+    mock_client.unlink.assert_called_once_with(
+        "civic_archive:read:v2:news:k1", "civic_archive:read:v2:news:k2"
     )
+    mock_client.delete.assert_not_called()
 
 
-def test_read_cache_invalidate_prefix_handles_pagination():
+def test_read_cache_invalidate_prefix_unlinks_in_batches():
     cache, mock_client = _make_active_cache()
-    mock_client.scan.side_effect = [
-        (42, ["civic_archive:read:news:k1"]),
-        (0, ["civic_archive:read:news:k2"]),
-    ]
+    mock_client.scan_iter.return_value = iter(f"civic_archive:read:v2:news:k{i}" for i in range(501))
 
     cache.invalidate_prefix("news")
 
-    assert mock_client.scan.call_count == 2
-    assert mock_client.delete.call_count == 2
+    assert mock_client.unlink.call_count == 2
+    assert len(mock_client.unlink.call_args_list[0].args) == 500
+    assert mock_client.unlink.call_args_list[1].args == ("civic_archive:read:v2:news:k500",)
 
 
 def test_read_cache_close_calls_client_close():
     cache, mock_client = _make_active_cache()
     cache.close()
     mock_client.close.assert_called_once()
+
+
+def test_read_cache_instances_share_client_per_redis_url():
+    mock_client = MagicMock()
+    with patch("redis.from_url", return_value=mock_client) as from_url:
+        first = ReadCache(redis_url="redis://localhost:6379/0", ttl_seconds=30)
+        second = ReadCache(redis_url="redis://localhost:6379/0", ttl_seconds=30)
+
+    from_url.assert_called_once()
+    assert first._client is second._client
+
+    first.close()
+    mock_client.close.assert_not_called()
+    assert not first.is_active
+    assert second.is_active
+
+    second.close()
+    mock_client.close.assert_called_once()
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from datetime import date
+import json
 import logging
 from types import SimpleNamespace
 
 from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 
 from conftest import metric_counter_value
 from app.bootstrap.exception_handlers import register_exception_handlers
+from app import errors
+from app.errors import build_error_payload, error_response
 from app.observability import register_observability
 from app.security import build_rate_limit_dependency
 from app.security_dependencies import build_api_key_dependency, build_jwt_dependency
@@ -168,3 +173,49 @@ def test_observability_records_not_found_with_request_id_and_metric():
         status_code="404",
     )
     assert after_count == before_count + 1
+
+
+def test_build_error_payload_passes_plain_details_through_and_encodes_others():
+    plain = {"loc": ("body", "items"), "limit": [1, 2.5, None, True]}
+    assert build_error_payload(code="BAD_REQUEST", message="bad", details=plain)["details"] is plain
+
+    encoded = build_error_payload(code="BAD_REQUEST", message="bad", details={"at": date(2024, 1, 2)})
+    assert encoded["details"] == {"at": "2024-01-02"}
+
+
+def test_build_error_payload_can_drop_legacy_error_key(monkeypatch):
+    assert build_error_payload(code="NOT_FOUND", message="Not Found", request_id="rid") == {
+        "code": "NOT_FOUND",
+        "message": "Not Found",
+        "error": "Not Found",
+        "request_id": "rid",
+    }
+
+    monkeypatch.setattr(errors, "EMIT_LEGACY_ERROR_KEY", False)
+    assert build_error_payload(code="NOT_FOUND", message="Not Found") == {
+        "code": "NOT_FOUND",
+        "message": "Not Found",
+    }
+
+
+def test_error_response_renders_compact_utf8_json_with_orjson():
+    request = SimpleNamespace(state=SimpleNamespace(request_id="rid"))
+    response = error_response(request, status_code=400, code="BAD_REQUEST", message="잘못된 요청")
+
+    assert isinstance(response, ORJSONResponse)
+    assert response.headers["X-Request-Id"] == "rid"
+    assert response.body == (
+        '{"code":"BAD_REQUEST","message":"잘못된 요청","error":"잘못된 요청","request_id":"rid"}'.encode()
+    )
+
+
+def test_error_response_reuses_static_body_and_escapes_request_id():
+    request = SimpleNamespace(state=SimpleNamespace(request_id='a"b'))
+    first = error_response(request, status_code=404, code="NOT_FOUND", message="Not Found")
+    second = error_response(
+        SimpleNamespace(state=SimpleNamespace(request_id=None)), status_code=404, code="NOT_FOUND", message="Not Found"
+    )
+
+    assert json.loads(first.body) == build_error_payload(code="NOT_FOUND", message="Not Found", request_id='a"b')
+    assert json.loads(second.body) == build_error_payload(code="NOT_FOUND", message="Not Found")
+    assert "x-request-id" not in second.headers
@@ -15,6 +15,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import text
 
 from app import create_app
+from app.repositories.common import COPY_STAGE_MIN_ROWS
 from app.services.segments_service import normalize_segment
 
 pytestmark = pytest.mark.integration
@@ -321,6 +322,68 @@ def test_segments_insert_skips_existing_legacy_hash_row(integration_client):
     assert listed.json()["total"] == 1
 
 
+def test_batches_past_copy_threshold_are_staged_through_copy(integration_client):
+    batch_size = COPY_STAGE_MIN_ROWS + 10
+    assert batch_size <= build_test_config().INGEST_MAX_BATCH_ITEMS
+
+    news = [
+        {
+            "source": "integration-copy",
+            "title": f"copy news {index}",
+            "url": f"https://example.com/news/copy-{index}",
+            "published_at": "2026-02-17T10:00:00Z",
+            "keywords": ["copy", index],
+        }
+        for index in range(batch_size - 1)
+    ]
+    # Duplicate URL inside the staged batch: the last item wins.
+    news.append({**news[0], "title": "copy news 0 latest"})
+    saved = integration_client.post("/api/news", json=news)
+    assert saved.status_code == 201
+    assert saved.json() == {"inserted": batch_size - 1, "updated": 0}
+    resaved = integration_client.post("/api/news", json=news)
+    assert resaved.json() == {"inserted": 0, "updated": batch_size - 1}
+
+    listed = integration_client.get("/api/news", params={"source": "integration-copy", "size": 200})
+    assert listed.json()["total"] == batch_size - 1
+    first = next(item for item in listed.json()["items"] if item["url"] == "https://example.com/news/copy-0")
+    assert first["title"] == "copy news 0 latest"
+    assert first["keywords"] == ["copy", 0]
+
+    minutes = [
+        {
+            "council": "copy-council",
+            "url": f"https://example.com/minutes/copy-{index}",
+            "meeting_date": "2026-02-17",
+            "meeting_no": index,
+            "attendee": {"count": index},
+        }
+        for index in range(batch_size)
+    ]
+    saved = integration_client.post("/api/minutes", json=minutes)
+    assert saved.status_code == 201
+    assert saved.json() == {"inserted": batch_size, "updated": 0}
+
+    segments = [
+        {
+            "council": "copy-council",
+            "meeting_date": "2026-02-17",
+            "content": f"copy segment {index}",
+            "importance": 1 + index % 3,
+            "questioner": {"name": f"member-{index}"},
+        }
+        for index in range(batch_size)
+    ]
+    saved = integration_client.post("/api/segments", json=segments)
+    assert saved.status_code == 201
+    assert saved.json() == {"inserted": batch_size}
+    duplicate = integration_client.post("/api/segments", json=segments)
+    assert duplicate.json() == {"inserted": 0}
+
+    listed = integration_client.get("/api/segments", params={"council": "copy-council", "size": 1})
+    assert listed.json()["total"] == batch_size
+
+
 def test_error_schema_contains_standard_fields(integration_client):
     missing = integration_client.get("/api/news/99999")
     assert missing.status_code == 404
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import atexit
+import io
+import json
+import logging
+from logging.handlers import QueueHandler
+
+from app.logging_config import JsonFormatter, configure_logging
+
+
+def test_json_formatter_emits_record_time_and_known_extra_fields():
+    record = logging.LogRecord("civic_archive.api", logging.INFO, __file__, 1, "요청 완료", None, None)
+    record.created = 0.0
+    record.request_id = "abc"
+    record.status_code = 200
+    record.client_ip = None
+    record.unrelated = "ignored"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert list(payload) == ["timestamp", "level", "logger", "message", "request_id", "status_code"]
+    assert payload == {
+        "timestamp": "1970-01-01T00:00:00+00:00",
+        "level": "INFO",
+        "logger": "civic_archive.api",
+        "message": "요청 완료",
+        "request_id": "abc",
+        "status_code": 200,
+    }
+
+
+def test_configure_logging_emits_through_queue_listener(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.delattr(root, "_civic_logging_configured", raising=False)
+    monkeypatch.delattr(root, "_civic_log_listener", raising=False)
+    previous_level = root.level
+
+    configure_logging(level="INFO", json_logs=True)
+    listener = root._civic_log_listener
+    try:
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], QueueHandler)
+        assert isinstance(listener.handlers[0].formatter, JsonFormatter)
+
+        stream = io.StringIO()
+        listener.handlers[0].setStream(stream)
+        logging.getLogger("civic_archive.test").info("queued", extra={"request_id": "rid"})
+    finally:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        root.setLevel(previous_level)
+
+    payload = json.loads(stream.getvalue())
+    assert payload["message"] == "queued"
+    assert payload["request_id"] == "rid"
+
+
+def test_configure_logging_renders_message_on_caller_and_keeps_traceback_apart(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.delattr(root, "_civic_logging_configured", raising=False)
+    monkeypatch.delattr(root, "_civic_log_listener", raising=False)
+    previous_level = root.level
+
+    configure_logging(level="INFO", json_logs=True)
+    listener = root._civic_log_listener
+    try:
+        stream = io.StringIO()
+        listener.handlers[0].setStream(stream)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logging.getLogger("civic_archive.test").exception("unhandled_exception")
+        state = {"phase": "queued"}
+        logging.getLogger("civic_archive.test").info("state=%s", state)
+        state["phase"] = "mutated"
+    finally:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        root.setLevel(previous_level)
+
+    payload, args_payload = (json.loads(line) for line in stream.getvalue().splitlines())
+    assert payload["message"] == "unhandled_exception"
+    assert payload["exc_info"].startswith("Traceback (most recent call last):")
+    assert payload["exc_info"].endswith("RuntimeError: boom")
+    assert args_payload["message"] == "state={'phase': 'queued'}"
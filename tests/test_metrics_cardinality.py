@@ -1,6 +1,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 from conftest import oversized_echo_body
 from conftest import StubResult, build_test_config
@@ -29,10 +30,12 @@ def test_metrics_normalizes_unknown_http_method_to_other(client):
 
 
 def test_metrics_records_route_template_cache_strategy_for_pre_route_failures(make_engine):
-    observability._ROUTE_TEMPLATE_CACHE.clear()
+    observability._ROUTE_TEMPLATE_CACHES.clear()
 
     with patch("app.database.create_engine", return_value=make_engine(lambda *_: StubResult())):
-        app = create_app(build_test_config(MAX_REQUEST_BODY_BYTES=64))
+        app = create_app(
+            build_test_config(MAX_REQUEST_BODY_BYTES=64, METRICS_OBSERVE_PATH_LABEL_RESOLUTION=True)
+        )
 
     with TestClient(app) as client:
         before_metrics = client.get("/metrics")
@@ -54,34 +57,45 @@ def test_metrics_records_route_template_cache_strategy_for_pre_route_failures(ma
         assert _histogram_count(after_metrics.text, strategy="cache") >= before_cache + 1
 
 
-def test_route_template_cache_operations_are_thread_safe(monkeypatch):
-    observability._ROUTE_TEMPLATE_CACHE.clear()
-    monkeypatch.setattr(observability, "ROUTE_TEMPLATE_CACHE_MAX_SIZE", 1)
-    errors: list[Exception] = []
+def test_route_template_cache_resolution_is_thread_safe(monkeypatch):
+    monkeypatch.setattr(observability, "ROUTE_TEMPLATE_CACHE_MAX_SIZE", 16)
+    api = FastAPI()
 
-    def write_cache(worker: int) -> None:
-        for index in range(1000):
-            key = ("GET", f"/api/thread-{worker % 3}-{index % 5}")
-            try:
-                observability._route_template_cache_set(key, key[1])
-            except Exception as exc:  # pragma: no cover
-                errors.append(exc)
+    @api.get("/api/thread/{item_id}")
+    async def thread_item(item_id: str):
+        return {"id": item_id}
 
-    def read_cache(worker: int) -> None:
+    errors: list[Exception] = []
+
+    def resolve(worker: int) -> None:
         for index in range(1000):
-            key = ("GET", f"/api/thread-{worker % 3}-{index % 5}")
+            request = Request(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": f"/api/thread/{worker % 3}-{index % 700}",
+                    "root_path": "",
+                    "headers": [],
+                }
+            )
             try:
-                observability._route_template_cache_get(key)
+                resolved, _strategy = observability._resolve_route_template(request, api)
+                assert resolved == "/api/thread/{item_id}"
             except Exception as exc:  # pragma: no cover
                 errors.append(exc)
 
     with ThreadPoolExecutor(max_workers=8) as pool:
-        futures = []
-        for worker in range(4):
-            futures.append(pool.submit(write_cache, worker))
-            futures.append(pool.submit(read_cache, worker))
-        for future in futures:
+        for future in [pool.submit(resolve, worker) for worker in range(8)]:
             future.result()
 
     assert errors == []
-    assert len(observability._ROUTE_TEMPLATE_CACHE) <= observability.ROUTE_TEMPLATE_CACHE_MAX_SIZE
+    assert len(observability._ROUTE_TEMPLATE_CACHES[api]) <= observability.ROUTE_TEMPLATE_CACHE_MAX_SIZE
+
+
+def test_request_metric_label_children_are_reused():
+    first = observability._count_child("GET", "/api/child-reuse", "200")
+    assert observability._count_child("GET", "/api/child-reuse", "200") is first
+    assert observability._count_child("GET", "/api/child-reuse", "404") is not first
+    assert observability._latency_child("GET", "/api/child-reuse") is observability._latency_child(
+        "GET", "/api/child-reuse"
+    )
@@ -2,8 +2,10 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.observability import (
+    _metric_method_label,
     build_request_log_payload,
     metric_status_label,
+    new_request_id,
     status_code_from_exception,
 )
 
@@ -51,3 +53,20 @@ def test_build_request_log_payload_has_consistent_shape():
         "duration_ms": 123.4,
         "client_ip": "127.0.0.1",
     }
+
+
+def test_new_request_id_is_unique_lowercase_hex():
+    first = new_request_id()
+    second = new_request_id()
+    assert first != second
+    assert len(first) == 32
+    assert int(first, 16) >= 0
+    assert first == first.lower()
+
+
+def test_metric_method_label_normalizes_case_and_unknown_methods():
+    assert _metric_method_label("GET") == "GET"
+    assert _metric_method_label("get") == "GET"
+    assert _metric_method_label("Delete") == "DELETE"
+    assert _metric_method_label("BREW") == "OTHER"
+    assert _metric_method_label(None) == "OTHER"
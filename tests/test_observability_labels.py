@@ -1,9 +1,11 @@
 from unittest.mock import patch
 
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 from conftest import StubResult, assert_payload_guard_metrics_use_route_template, build_test_config
 
 from app import create_app
+import app.observability as observability
 
 def test_metrics_uses_route_template_label_for_payload_guard_failure(make_engine):
     with patch("app.database.create_engine", return_value=make_engine(lambda *_: StubResult())):
@@ -11,3 +13,47 @@ def test_metrics_uses_route_template_label_for_payload_guard_failure(make_engine
 
     with TestClient(app) as tc:
         assert_payload_guard_metrics_use_route_template(tc)
+
+
+def _http_request(method: str, path: str) -> Request:
+    return Request({"type": "http", "method": method, "path": path, "root_path": "", "headers": []})
+
+
+def test_route_template_resolution_scans_router_once_then_hits_cache():
+    api = FastAPI()
+
+    @api.get("/api/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @api.get("/api/items/latest")
+    async def latest_item():
+        return {}
+
+    @api.delete("/api/things/{thing_id:int}")
+    async def delete_thing(thing_id: int):
+        return {}
+
+    # Registration order wins, like Starlette's router.
+    request = _http_request("GET", "/api/items/latest")
+    assert observability._resolve_route_template(request, api) == ("/api/items/{item_id}", "router")
+    assert observability._resolve_route_template(request, api) == ("/api/items/{item_id}", "cache")
+
+    delete_request = _http_request("DELETE", "/api/things/3")
+    assert observability._resolve_route_template(delete_request, api) == ("/api/things/{thing_id:int}", "router")
+    assert observability._resolve_route_template(_http_request("DELETE", "/api/things/abc"), api) == (None, "router")
+    assert observability._resolve_route_template(_http_request("POST", "/api/items/7"), api) == (None, "router")
+
+
+def test_unmatched_404_skips_route_template_lookup(client, monkeypatch):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("route template lookup should be skipped for unmatched 404")
+
+    monkeypatch.setattr(observability, "_resolve_route_template", _fail)
+    monkeypatch.setattr(observability, "_resolve_route_template_from_router", _fail)
+
+    resp = client.get("/api/does-not-exist/404-skip")
+    assert resp.status_code == 404
+
+    metrics = client.get("/metrics")
+    assert 'method="GET",path="/_unmatched",status_code="404"' in metrics.text
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.parsing import parse_date_value, parse_datetime_value
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-01-02 03:04:05", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-1-2 3:4:5", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-01-02  03:04:05", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-01-02\t03:04:05", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-01-02T12:00:00+09:00", datetime(2024, 1, 2, 3, 0, 0, tzinfo=timezone.utc)),
+        ("2024-01-02T03:04:05.5", datetime(2024, 1, 2, 3, 4, 5, 500000, tzinfo=timezone.utc)),
+        ("20240101T100000Z", datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)),
+        ("20240101T100000", datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)),
+        (date(2024, 1, 2), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_datetime_value_accepts_supported_formats(raw, expected):
+    parsed = parse_datetime_value(raw)
+    assert parsed == expected
+    assert parsed.utcoffset() == timedelta(0)
+
+
+@pytest.mark.parametrize("raw", ["2024-13-01 00:00:00", "2024-01-02", "not-a-date", "not a date", "T"])
+def test_parse_datetime_value_rejects_invalid_values(raw):
+    with pytest.raises(ValueError, match="datetime format error"):
+        parse_datetime_value(raw)
+
+
+def test_parse_temporal_values_reuse_cached_string_results():
+    first = parse_datetime_value("2024-05-06T07:08:09Z")
+    assert parse_datetime_value(" 2024-05-06T07:08:09Z ") is first
+    assert parse_date_value("2024-05-06") is parse_date_value("2024-05-06")
+
+    with pytest.raises(ValueError, match="date must be YYYY-MM-DD"):
+        parse_date_value("2024/05/06")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-01-02", date(2024, 1, 2)),
+        ("2024-1-2", date(2024, 1, 2)),
+        ("2024-1-02", date(2024, 1, 2)),
+    ],
+)
+def test_parse_date_value_accepts_padded_and_lenient_dates(raw, expected):
+    assert parse_date_value(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["2024-02-30", "2024-13-01", "20240102", "2024-01-0x"])
+def test_parse_date_value_rejects_invalid_dates(raw):
+    with pytest.raises(ValueError, match="date must be YYYY-MM-DD"):
+        parse_date_value(raw)
@@ -84,3 +84,189 @@ def test_segments_insert_batch_dedupes_same_dedupe_hash_with_last_item_wins(segm
     deduped_items = captured_items["payload"]
     assert len(deduped_items) == 1
     assert deduped_items[0]["content"] == "second"
+
+
+def test_dedupe_rows_by_key_keeps_last_occurrence_position():
+    from app.repositories.common import dedupe_rows_by_key
+
+    rows = [
+        {"url": "a", "v": 1},
+        {"url": "b", "v": 2},
+        {"url": "a", "v": 3},
+        {"url": "c", "v": 4},
+    ]
+
+    assert dedupe_rows_by_key(rows, key="url") == [
+        {"url": "b", "v": 2},
+        {"url": "a", "v": 3},
+        {"url": "c", "v": 4},
+    ]
+
+
+def test_news_upsert_large_batch_stages_rows_with_copy(news_module, make_connection_provider, monkeypatch):
+    from types import SimpleNamespace
+
+    from app.repositories import common
+
+    copied = {"sql": None, "rows": []}
+
+    class _Copy:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+        def write_row(self, row):
+            copied["rows"].append(row)
+
+    class _Cursor(_Copy):
+        def copy(self, sql):
+            copied["sql"] = sql
+            return _Copy()
+
+    def handler(_statement, _params):
+        return StubResult(rows=[{"inserted": 2, "updated": 0}])
+
+    monkeypatch.setattr(common, "COPY_STAGE_MIN_ROWS", 2)
+    monkeypatch.setattr(common, "UPSERT_SERVER_TALLY_MIN_ROWS", 2)
+    connection_provider, engine = make_connection_provider(handler)
+    engine.connection.connection = SimpleNamespace(driver_connection=SimpleNamespace(cursor=_Cursor))
+
+    inserted, _updated = news_module.upsert_articles(
+        [
+            {"title": "first", "url": "https://example.com/n/1", "keywords": ["budget"]},
+            {"title": "second", "url": "https://example.com/n/2"},
+        ],
+        connection_provider=connection_provider,
+    )
+
+    assert inserted == 2
+    statements = [call["statement"].lower() for call in engine.connection.calls]
+    assert "create temp table news_upsert_stage" in statements[0]
+    assert "from news_upsert_stage as p" in statements[1]
+    assert "jsonb_to_recordset" not in statements[1]
+    assert copied["sql"].startswith("COPY news_upsert_stage (source, title, url,")
+    assert copied["rows"][0][1:3] == ["first", "https://example.com/n/1"]
+    assert copied["rows"][0][-1] == '["budget"]'
+
+
+def test_to_json_recordset_serializes_temporal_values_as_iso_strings():
+    from datetime import date, datetime, timezone
+
+    from app.repositories.common import to_json_recordset
+
+    payload = to_json_recordset(
+        [
+            {
+                "published_at": datetime(2026, 2, 17, 9, 30, tzinfo=timezone.utc),
+                "meeting_date": date(2026, 2, 17),
+                "title": "예산 심사",
+                "tag": {1: "budget"},
+            }
+        ]
+    )
+
+    assert json.loads(payload) == [
+        {
+            "published_at": "2026-02-17T09:30:00+00:00",
+            "meeting_date": "2026-02-17",
+            "title": "예산 심사",
+            "tag": {"1": "budget"},
+        }
+    ]
+    assert "예산" in payload
+
+
+def test_project_payload_rows_fills_missing_fields_with_none():
+    from app.repositories.common import project_payload_rows
+
+    fields = ("title", "url", "summary")
+
+    assert project_payload_rows([{"title": "t", "url": "u", "summary": "s", "extra": 1}], fields) == [
+        {"title": "t", "url": "u", "summary": "s"}
+    ]
+    assert project_payload_rows([{"title": "t", "url": "u"}], fields) == [
+        {"title": "t", "url": "u", "summary": None}
+    ]
+
+
+def test_news_upsert_small_batch_tallies_returning_rows(news_module, make_connection_provider):
+    def handler(_statement, _params):
+        return StubResult(rows=[{"inserted": True}, {"inserted": False}])
+
+    connection_provider, engine = make_connection_provider(handler)
+    inserted, updated = news_module.upsert_articles(
+        [
+            {"title": "first", "url": "https://example.com/n/1"},
+            {"title": "second", "url": "https://example.com/n/2"},
+        ],
+        connection_provider=connection_provider,
+    )
+
+    assert (inserted, updated) == (1, 1)
+    sql = engine.connection.calls[0]["statement"].lower()
+    assert "select inserted from upserted" in sql
+    assert "sum(" not in sql
+
+
+def test_segments_insert_large_batch_stages_rows_with_copy(segments_module, make_connection_provider, monkeypatch):
+    from types import SimpleNamespace
+
+    from app.repositories import common
+
+    copied = {"sql": None, "rows": []}
+
+    class _Copy:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+        def write_row(self, row):
+            copied["rows"].append(row)
+
+    class _Cursor(_Copy):
+        def copy(self, sql):
+            copied["sql"] = sql
+            return _Copy()
+
+    def handler(_statement, _params):
+        return StubResult(rows=[{"inserted": 2}])
+
+    monkeypatch.setattr(common, "COPY_STAGE_MIN_ROWS", 2)
+    connection_provider, engine = make_connection_provider(handler)
+    engine.connection.connection = SimpleNamespace(driver_connection=SimpleNamespace(cursor=_Cursor))
+
+    inserted = segments_module.insert_segments(
+        [
+            {"council": "A", "content": "first", "dedupe_hash": "h1", "tag": ["budget"]},
+            {"council": "A", "content": "second", "dedupe_hash": "h2"},
+        ],
+        connection_provider=connection_provider,
+    )
+
+    assert inserted == 2
+    statements = [call["statement"].lower() for call in engine.connection.calls]
+    assert "create temp table segments_insert_stage" in statements[0]
+    assert "from segments_insert_stage as p" in statements[1]
+    assert "jsonb_to_recordset" not in statements[1]
+    assert copied["sql"].startswith("COPY segments_insert_stage (council, committee, session,")
+    assert copied["rows"][0][9] == '["budget"]'
+    assert copied["rows"][1][6] == "second"
+
+
+def test_segments_insert_reuses_payload_statement_across_calls(segments_module, make_connection_provider):
+    def handler(_statement, _params):
+        return StubResult(rows=[{"inserted": 1}])
+
+    connection_provider, engine = make_connection_provider(handler)
+    for content in ("first", "second"):
+        segments_module.insert_segments(
+            [{"council": "A", "content": content, "dedupe_hash": content}],
+            connection_provider=connection_provider,
+        )
+
+    first, second = (call["statement_obj"] for call in engine.connection.calls)
+    assert first is second
@@ -116,3 +116,20 @@ def test_add_date_filters_handle_trim_and_blank_values():
 
     assert blank_conditions == []
     assert blank_params == {}
+
+
+def test_filter_helpers_reuse_condition_objects_for_the_same_column():
+    committee = column("committee")
+    first_conditions = []
+    second_conditions = []
+
+    for conditions, value in ((first_conditions, "education"), (second_conditions, "budget")):
+        add_truthy_equals_filter(
+            value=value,
+            param_name="committee",
+            column_expr=committee,
+            conditions=conditions,
+            params={},
+        )
+
+    assert first_conditions[0] is second_conditions[0]
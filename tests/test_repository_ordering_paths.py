@@ -87,3 +87,123 @@ def test_segments_list_query_uses_index_friendly_order_path(make_connection_prov
     assert "coalesce(" not in sql
     assert "meeting_date desc nulls last" in sql
     assert "count(*) over ()" in sql
+
+
+def test_news_list_query_seeks_past_keyset_cursor(make_connection_provider):
+    connection_provider, engine = make_connection_provider(_make_list_query_handler())
+
+    news_repository.list_articles(
+        q=None,
+        source=None,
+        date_from=None,
+        date_to=None,
+        page=3,
+        size=20,
+        after=("2026-02-17T09:30:00", 42),
+        connection_provider=connection_provider,
+    )
+
+    call = engine.connection.calls[0]
+    sql = call["statement"].lower()
+    assert "(news_articles.published_at, news_articles.id) <" in sql
+    assert call["params"]["after_sort"] == "2026-02-17T09:30:00"
+    assert call["params"]["after_id"] == 42
+    assert call["params"]["offset"] == 0
+
+
+def test_minutes_list_query_seeks_within_null_dates_for_null_cursor(make_connection_provider):
+    connection_provider, engine = make_connection_provider(_make_list_query_handler())
+
+    minutes_repository.list_minutes(
+        q=None,
+        council=None,
+        committee=None,
+        session=None,
+        meeting_no=None,
+        date_from=None,
+        date_to=None,
+        page=1,
+        size=20,
+        after=(None, 9),
+        connection_provider=connection_provider,
+    )
+
+    call = engine.connection.calls[0]
+    sql = call["statement"].lower()
+    assert "council_minutes.meeting_date is null" in sql
+    assert "after_sort" not in call["params"]
+    assert call["params"]["after_id"] == 9
+
+
+def test_news_batch_lookup_and_delete_use_single_any_query(make_connection_provider):
+    def handler(statement, _params):
+        if "delete" in str(statement).lower():
+            return StubResult(rows=[{"id": 3}])
+        return StubResult(rows=[{"id": 3, "title": "t"}, {"id": 5, "title": "u"}])
+
+    connection_provider, engine = make_connection_provider(handler)
+
+    found = news_repository.get_articles_by_ids([3, 5, 7], connection_provider=connection_provider)
+    deleted = news_repository.delete_articles_by_ids([3, 9], connection_provider=connection_provider)
+
+    assert sorted(found) == [3, 5]
+    assert found[5]["title"] == "u"
+    assert deleted == [3]
+    assert len(engine.connection.calls) == 2
+    assert "id = any(:ids)" in engine.connection.calls[0]["statement"].lower()
+    assert engine.connection.calls[0]["params"] == {"ids": [3, 5, 7]}
+    assert news_repository.get_articles_by_ids([], connection_provider=connection_provider) == {}
+
+
+def test_minutes_batch_lookup_and_delete_use_single_any_query(make_connection_provider):
+    def handler(statement, _params):
+        if "delete" in str(statement).lower():
+            return StubResult(rows=[{"id": 4}, {"id": 6}])
+        return StubResult(rows=[{"id": 4, "council": "seoul"}])
+
+    connection_provider, engine = make_connection_provider(handler)
+
+    found = minutes_repository.get_minutes_by_ids([4, 8], connection_provider=connection_provider)
+    deleted = minutes_repository.delete_minutes_by_ids([4, 6], connection_provider=connection_provider)
+
+    assert found == {4: {"id": 4, "council": "seoul"}}
+    assert deleted == [4, 6]
+    assert "returning id" in engine.connection.calls[1]["statement"].lower()
+
+
+def test_list_queries_render_limit_inline_and_keep_offset_bound():
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(news_repository._LIST_STMT.compile(dialect=postgresql.dialect()))
+
+    assert "LIMIT __[POSTCOMPILE_limit]" in sql
+    assert "OFFSET %(offset)s" in sql
+
+
+def test_segments_list_query_seeks_past_keyset_cursor(make_connection_provider):
+    connection_provider, engine = make_connection_provider(_make_list_query_handler())
+
+    segments_repository.list_segments(
+        q=None,
+        council=None,
+        committee=None,
+        session=None,
+        meeting_no=None,
+        importance=None,
+        party=None,
+        constituency=None,
+        department=None,
+        date_from=None,
+        date_to=None,
+        page=4,
+        size=20,
+        after=("2026-02-17", 7),
+        connection_provider=connection_provider,
+    )
+
+    call = engine.connection.calls[0]
+    sql = call["statement"].lower()
+    assert "(council_speech_segments.meeting_date, council_speech_segments.id) <" in sql
+    assert call["params"]["after_sort"] == "2026-02-17"
+    assert call["params"]["after_id"] == 7
+    assert call["params"]["offset"] == 0
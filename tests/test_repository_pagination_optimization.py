@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, column, func, select, table, text
 
+from app.repositories import common
 from app.repositories.common import execute_paginated_query
 from conftest import StubResult
 
@@ -116,3 +117,129 @@ def test_execute_paginated_query_falls_back_to_count_when_window_total_missing(m
     assert rows == []
     assert total == 21
     assert len(engine.connection.calls) == 2
+
+
+def test_execute_paginated_query_skip_mode_uses_lookahead_without_count(make_connection_provider):
+    def handler(_statement, _params):
+        return StubResult(rows=[{"id": 5, "__total_count": 99}, {"id": 4, "__total_count": 99}, {"id": 3, "__total_count": 99}])
+
+    connection_provider, engine = make_connection_provider(handler)
+    list_stmt = (
+        select(column("id"), func.count().over().label("__total_count"))
+        .select_from(table("t"))
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+    rows, total = execute_paginated_query(
+        list_stmt=list_stmt,
+        count_stmt=text("SELECT count(*) AS total FROM t"),
+        params={},
+        page=2,
+        size=2,
+        connection_provider=connection_provider,
+        row_total_key="__total_count",
+        count_mode="skip",
+    )
+
+    assert rows == [{"id": 5}, {"id": 4}]
+    assert total == 5
+    assert len(engine.connection.calls) == 1
+    assert engine.connection.calls[0]["params"] == {"limit": 3, "offset": 2}
+    assert "count(*) OVER" not in engine.connection.calls[0]["statement"]
+
+
+def test_execute_paginated_query_estimate_mode_uses_cached_planner_estimate(make_connection_provider, monkeypatch):
+    monkeypatch.setattr(common, "_ESTIMATED_COUNTS", {})
+
+    def handler(statement, _params):
+        if "pg_class" in str(statement):
+            return StubResult(scalar_value=1000)
+        return StubResult(rows=[{"id": 1}, {"id": 2}, {"id": 3}])
+
+    connection_provider, engine = make_connection_provider(handler)
+    for _ in range(2):
+        rows, total = execute_paginated_query(
+            list_stmt=text("SELECT id FROM t ORDER BY id DESC LIMIT :limit OFFSET :offset"),
+            count_stmt=text("SELECT count(*) AS total FROM t"),
+            params={},
+            page=1,
+            size=2,
+            connection_provider=connection_provider,
+            count_mode="estimate",
+            estimate_table="t",
+        )
+        assert len(rows) == 2
+        assert total == 1000
+
+    estimate_calls = [call for call in engine.connection.calls if "pg_class" in call["statement"]]
+    assert len(estimate_calls) == 1
+
+
+def test_execute_paginated_query_skip_mode_counts_exactly_past_the_end(make_connection_provider):
+    def handler(statement, _params):
+        if "count(*)" in str(statement):
+            return StubResult(scalar_value=3)
+        return StubResult(rows=[])
+
+    connection_provider, engine = make_connection_provider(handler)
+    rows, total = execute_paginated_query(
+        list_stmt=text("SELECT id FROM t ORDER BY id DESC LIMIT :limit OFFSET :offset"),
+        count_stmt=text("SELECT count(*) AS total FROM t"),
+        params={},
+        page=5,
+        size=2,
+        connection_provider=connection_provider,
+        count_mode="skip",
+    )
+
+    assert rows == []
+    assert total == 3
+    assert len(engine.connection.calls) == 2
+
+
+def test_execute_filtered_paginated_query_reuses_statements_per_filter_shape(make_connection_provider):
+    from app.repositories.common import execute_filtered_paginated_query
+
+    items = table("items", column("id"), column("source"))
+    list_stmt = select(items.c.id).limit(bindparam("limit")).offset(bindparam("offset"))
+    count_stmt = select(func.count()).select_from(items)
+
+    def run(source):
+        connection_provider, engine = make_connection_provider(lambda _s, _p: StubResult(rows=[]))
+        execute_filtered_paginated_query(
+            list_stmt=list_stmt,
+            count_stmt=count_stmt,
+            conditions=[items.c.source == bindparam("source")],
+            params={"source": source},
+            page=1,
+            size=20,
+            connection_provider=connection_provider,
+            statement_key="items-test",
+        )
+        return engine.connection.calls[0]
+
+    first = run("a")
+    second = run("b")
+
+    assert first["statement_obj"] is second["statement_obj"]
+    assert "items.source = :source" in first["statement"]
+    assert second["params"]["source"] == "b"
+
+
+def test_execute_paginated_query_drops_window_total_from_any_column_position(make_connection_provider):
+    def handler(_statement, _params):
+        return StubResult(rows=[{"id": 3, "__total_count": 21, "title": "a"}, {"id": 2, "__total_count": 21, "title": "b"}])
+
+    connection_provider, _engine = make_connection_provider(handler)
+    rows, total = execute_paginated_query(
+        list_stmt=text("SELECT 1"),
+        count_stmt=text("SELECT 1"),
+        params={},
+        page=1,
+        size=2,
+        connection_provider=connection_provider,
+        row_total_key="__total_count",
+    )
+
+    assert rows == [{"id": 3, "title": "a"}, {"id": 2, "title": "b"}]
+    assert total == 21
@@ -1,5 +1,13 @@
-from app.repositories.search import build_split_search_condition, build_split_search_params
+import pytest
+
+from app.repositories.search import (
+    build_indexed_search_condition,
+    build_search_document_sql,
+    build_split_search_condition,
+    build_split_search_params,
+)
 from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
 
 
 def test_build_split_search_params_keeps_trigram_and_fts_values():
@@ -14,3 +22,34 @@ def test_build_split_search_condition_contains_trigram_and_fts_operators():
     assert "like lower(:q)" in sql
     assert "to_tsvector" in sql
     assert "websearch_to_tsquery" in sql
+
+
+def test_build_indexed_search_condition_renders_index_expression_verbatim():
+    document_sql = build_search_document_sql("title", "agenda::text")
+    assert document_sql == "COALESCE(title, '') || ' ' || COALESCE(agenda::text, '')"
+
+    expr = build_indexed_search_condition(document_sql=document_sql)
+    sql = str(expr.compile(dialect=postgresql.dialect()))
+    assert f"({document_sql}) ILIKE" in sql
+    assert f"to_tsvector('simple', ({document_sql}))" in sql
+    assert "websearch_to_tsquery('simple'," in sql
+
+
+def test_build_split_search_params_reuses_cached_read_only_mapping():
+    first = build_split_search_params(" budget ")
+    second = build_split_search_params("budget")
+
+    assert first is second
+    assert dict(first) == {"q": "%budget%"}
+    with pytest.raises(TypeError):
+        first["q"] = "%other%"  # type: ignore[index]
+
+
+def test_single_token_query_uses_trigram_branch_only():
+    assert dict(build_split_search_params("예산")) == {"q": "%예산%"}
+    assert dict(build_split_search_params("예산을 심의")) == {"q": "%예산을 심의%", "q_fts": "예산을 심의"}
+
+    document_sql = build_search_document_sql("title")
+    sql = str(build_indexed_search_condition(document_sql=document_sql, fts=False).compile(dialect=postgresql.dialect()))
+    assert "ILIKE" in sql
+    assert "to_tsvector" not in sql
@@ -1,6 +1,10 @@
 import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
 from conftest import StubResult
 
+from app.database import instrument_engine
+from app.observability import DB_QUERY_DURATION
 from app.repositories import news_repository
 from app.repositories import session_provider as session_provider_module
 
@@ -31,3 +35,34 @@ def test_repository_function_accepts_explicit_connection_provider(make_engine):
 def test_ensure_connection_provider_rejects_none():
     with pytest.raises(RuntimeError, match="connection provider is required"):
         session_provider_module.ensure_connection_provider(None)
+
+
+def test_instrument_engine_records_query_duration_from_cursor_events():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    before = DB_QUERY_DURATION.collect()[0]
+    before_count = next(sample.value for sample in before.samples if sample.name.endswith("_count"))
+    with engine.begin() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    after = DB_QUERY_DURATION.collect()[0]
+    after_count = next(sample.value for sample in after.samples if sample.name.endswith("_count"))
+
+    assert after_count == before_count + 1
+    engine.dispose()
+
+
+def test_instrument_engine_records_duration_of_failed_queries():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    before = DB_QUERY_DURATION.collect()[0]
+    before_count = next(sample.value for sample in before.samples if sample.name.endswith("_count"))
+    with pytest.raises(OperationalError):
+        with engine.begin() as conn:
+            conn.execute(text("SELECT * FROM missing_table"))
+    after = DB_QUERY_DURATION.collect()[0]
+    after_count = next(sample.value for sample in after.samples if sample.name.endswith("_count"))
+
+    assert after_count == before_count + 1
+    engine.dispose()
@@ -6,7 +6,7 @@ from app.security_access import build_metrics_access_dependencies, build_protect
 
 
 def test_build_protected_dependencies_preserves_dependency_order():
-    config = SimpleNamespace(REQUIRE_API_KEY=False, REQUIRE_JWT=False)
+    config = SimpleNamespace(REQUIRE_API_KEY=True, REQUIRE_JWT=True, RATE_LIMIT_PER_MINUTE=10)
 
     def api_builder(_config):
         async def api_dependency():
@@ -39,6 +39,32 @@ def test_build_protected_dependencies_preserves_dependency_order():
     assert dependencies[2].dependency.__name__ == "rate_limit_dependency"
 
 
+def test_build_protected_dependencies_skips_disabled_guards():
+    config = SimpleNamespace(REQUIRE_API_KEY=False, REQUIRE_JWT=True, RATE_LIMIT_PER_MINUTE=0)
+    built: list[str] = []
+
+    def builder(name):
+        def _build(_config):
+            built.append(name)
+
+            async def dependency():
+                return None
+
+            return dependency
+
+        return _build
+
+    dependencies = build_protected_dependencies(
+        config,
+        build_api_key_dependency=builder("api_key"),
+        build_jwt_dependency=builder("jwt"),
+        build_rate_limit_dependency=builder("rate_limit"),
+    )
+
+    assert len(dependencies) == 1
+    assert built == ["jwt"]
+
+
 def test_build_metrics_access_dependencies_respects_auth_flags():
     config = SimpleNamespace(REQUIRE_API_KEY=True, REQUIRE_JWT=False)
 
@@ -7,8 +7,9 @@ from fastapi import HTTPException
 
 from app import security_dependencies
 from app import security_proxy
+from app import security_jwt
 from app import security_rate_limit
-from app.security_jwt import authorize_claims_for_request
+from app.security_jwt import authorize_claims_for_request, extract_values_set, required_scope_for_method
 
 
 def _rate_limit_config(**overrides):
@@ -30,6 +31,38 @@ def test_security_proxy_rejects_invalid_cidr():
         security_proxy.parse_trusted_proxy_networks(["not-a-cidr"])
 
 
+def test_security_proxy_splits_networks_by_version_and_single_hosts():
+    trusted = security_proxy.parse_trusted_proxy_networks(
+        ["10.0.0.0/8", " ", "192.0.2.10/32", "::1/128", "2001:db8::/32"]
+    )
+    assert [str(network) for network in trusted.v4] == ["10.0.0.0/8"]
+    assert [str(network) for network in trusted.v6] == ["2001:db8::/32"]
+    assert len(trusted.v4_hosts) == 1 and len(trusted.v6_hosts) == 1
+
+    assert security_proxy.is_trusted_proxy("192.0.2.10", trusted)
+    assert security_proxy.is_trusted_proxy("10.1.2.3", trusted)
+    assert security_proxy.is_trusted_proxy("::1", trusted)
+    assert security_proxy.is_trusted_proxy("2001:db8::5", trusted)
+    # ::1 and 0.0.0.1 share an integer value; host sets stay per address family.
+    assert not security_proxy.is_trusted_proxy("0.0.0.1", trusted)
+    assert not security_proxy.is_trusted_proxy("192.0.2.11", trusted)
+    assert not security_proxy.is_trusted_proxy("not-an-ip", trusted)
+    assert not security_proxy.parse_trusted_proxy_networks([])
+
+
+def test_security_proxy_reuses_parsed_remote_address():
+    trusted = security_proxy.parse_trusted_proxy_networks(["10.0.0.0/8"])
+    security_proxy._parse_remote_address.cache_clear()
+
+    for _ in range(3):
+        assert security_proxy.is_trusted_proxy("10.0.0.7", trusted)
+    assert not security_proxy.is_trusted_proxy("request:unknown", trusted)
+
+    info = security_proxy._parse_remote_address.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
 def test_security_proxy_client_key_uses_xff_only_when_proxy_is_trusted():
     trusted_networks = security_proxy.parse_trusted_proxy_networks(["127.0.0.1/32"])
     request = SimpleNamespace(
@@ -176,6 +209,18 @@ def test_security_dependencies_api_key_rejects_invalid_header():
     assert exc_info.value.status_code == 401
 
 
+def test_security_dependencies_api_key_compares_raw_header_bytes():
+    dependency = security_dependencies.build_api_key_dependency(
+        SimpleNamespace(REQUIRE_API_KEY=True, API_KEY="키-expected"),
+    )
+
+    # Header values arrive latin-1 decoded from the raw (here UTF-8) bytes.
+    asyncio.run(dependency(x_api_key="키-expected".encode("utf-8").decode("latin-1")))
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependency(x_api_key="é-wrong"))
+    assert exc_info.value.status_code == 401
+
+
 def test_security_dependencies_jwt_dependency_uses_injected_jwt_handlers():
     seen = {}
 
@@ -237,3 +282,40 @@ def test_authorize_claims_does_not_log_for_normal_scope_grant(caplog):
 
     audit_records = [r for r in caplog.records if r.message == "admin_role_access_granted"]
     assert len(audit_records) == 0
+
+
+def test_security_jwt_params_are_cached_by_config_values():
+    security_jwt._jwt_params.cache_clear()
+    first = security_jwt._jwt_params(" secret ", "aud", None, 5)
+    second = security_jwt._jwt_params(" secret ", "aud", None, 5)
+    changed = security_jwt._jwt_params(" secret ", None, None, -3)
+
+    assert first is second
+    assert first[:4] == ("secret", "aud", None, 5)
+    assert first[4]["verify_aud"] is True and first[4]["verify_iss"] is False
+    assert changed[:4] == ("secret", None, None, 0)
+    assert changed[4]["verify_aud"] is False
+
+
+def test_required_scope_for_method_maps_verbs_to_configured_scopes():
+    config = SimpleNamespace(JWT_SCOPE_READ=" archive:read ", JWT_SCOPE_WRITE="archive:write", JWT_SCOPE_DELETE="")
+
+    assert required_scope_for_method(config, "GET") == "archive:read"
+    assert required_scope_for_method(config, "head") == "archive:read"
+    assert required_scope_for_method(config, "PATCH") == "archive:write"
+    assert required_scope_for_method(config, "DELETE") is None
+    assert required_scope_for_method(config, "OPTIONS") is None
+    assert required_scope_for_method(config, "") is None
+
+
+def test_extract_values_set_strips_scalars_and_list_items():
+    claims = {
+        "scope": "  archive:read   archive:write ",
+        "scopes": [" archive:delete ", "", 3, "  "],
+        "role": "  admin ",
+        "roles": "   ",
+    }
+
+    assert extract_values_set(claims, "scope", "scopes") == {"archive:read", "archive:write", "archive:delete"}
+    assert extract_values_set(claims, "role", "roles") == {"admin"}
+    assert extract_values_set(claims, "missing") == set()
@@ -4,6 +4,8 @@ import pytest
 from fastapi import HTTPException
 
 from app.services.common import (
+    decode_list_cursor,
+    encode_list_cursor,
     ensure_item_object,
     normalize_list_window,
     normalize_optional_filters,
@@ -51,3 +53,17 @@ def test_normalize_list_window_applies_pagination_and_date_validation():
         normalize_list_window(page=1, size=20, date_from="2026/02/01", date_to=None)
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail["code"] == "BAD_REQUEST"
+
+
+def test_list_cursor_roundtrip_and_invalid_cursor():
+    from datetime import datetime
+
+    cursor = encode_list_cursor(datetime(2026, 2, 17, 9, 30), 42)
+    assert decode_list_cursor(cursor) == ("2026-02-17T09:30:00", 42)
+    assert decode_list_cursor(encode_list_cursor(None, 7)) == (None, 7)
+    assert decode_list_cursor(None) is None
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_list_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["message"] == "invalid cursor"